@@ -0,0 +1,10 @@
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    presets: {
+        // Returns [top figure, side figure, tornado chart, ...table values] for the selected
+        // preset. Unknown values fall back to the default preset.
+        switch_preset: function(button_value, store) {
+            var preset = store.presets[button_value] || store.presets[store.default];
+            return [preset.top, preset.side, preset.tornado].concat(preset.table);
+        }
+    }
+});
@@ -0,0 +1,246 @@
+"""Batch evaluation"""
+
+#Computes the variable table values and the figure geometry for every display
+#spec in a CSV or JSON-lines file, without Dash:
+#
+#    python batch.py catalogue.csv -o results.csv
+#    python batch.py catalogue.jsonl -o - --workers 8 > results.jsonl
+#
+#Every row needs pixel_pitch, hogel_diameter, view_distance and view_angle
+#(mm and degrees, like profiles.py); all other columns are copied through.
+#The input is read as raw records in chunks that worker processes parse,
+#evaluate and format, and results are written in input order as they come back,
+#so memory stays flat however long the file is. A CSV record is one line, or
+#several while a quoted field holds line breaks; counts are of records.
+
+import argparse
+import csv
+import io
+import json
+import os
+import sys
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+import numpy as np
+
+import core
+import sweep
+
+
+REQUIRED_COLUMNS = sweep.PARAMETERS
+RESULT_COLUMNS = sweep.METRICS + ('hor_view_angle', 'hogel_circle_diameter', 'pixel_radius_ratio', 'num_pixel_lines')
+
+DEFAULT_CHUNK_SIZE = 50000 #rows per task
+MAX_VIEW_ANGLE = 180 #degrees, tan of half the view angle changes sign there
+
+
+def valid_values(columns):
+    #True where every value is a positive number and a view_angle is below MAX_VIEW_ANGLE;
+    #columns maps names to floats or float arrays
+    valid = True
+    with np.errstate(invalid='ignore'):
+        for value in columns.values():
+            valid = valid & np.isfinite(value) & (value > 0)
+        if 'view_angle' in columns:
+            valid = valid & (columns['view_angle'] < MAX_VIEW_ANGLE)
+    return valid
+
+
+def evaluate_columns(columns):
+    #columns maps the required names to float arrays, invalid values are NaN
+    with np.errstate(invalid='ignore', divide='ignore'):
+        results = sweep.evaluate(*[columns[name] for name in REQUIRED_COLUMNS])
+        view_distance, pixel_pitch, hogel_diameter = results['view_distance'], results['pixel_pitch'], results['hogel_diameter']
+        results['hor_view_angle'] = results['view_angle'] / 2
+        results['hogel_circle_diameter'] = core.hogel_circle_diameter(view_distance)
+        results['pixel_radius_ratio'] = core.pixel_radius_ratio(view_distance, pixel_pitch, hogel_diameter)
+        results['num_pixel_lines'] = core.num_pixel_lines(view_distance, pixel_pitch, hogel_diameter)
+
+    #specs with a missing or non-positive parameter or a view angle of 180 degrees or more get empty results instead of garbage
+    valid = valid_values(dict((name, results[name]) for name in REQUIRED_COLUMNS))
+    return dict((name, np.where(valid, results[name], np.nan)) for name in RESULT_COLUMNS)
+
+
+def to_float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def format_number(value):
+    if isinstance(value, str):
+        return value
+    return '' if value != value else '%.10g' % value
+
+
+#What a batch run reads, computes and writes; evaluate maps the required columns
+#to float arrays and returns the result columns. Jobs go to worker processes, so
+#evaluate has to be a module level function. solver.py runs its own job.
+Job = namedtuple('Job', ['required_columns', 'result_columns', 'evaluate'])
+
+EVALUATE = Job(REQUIRED_COLUMNS, RESULT_COLUMNS, evaluate_columns)
+
+
+
+"""Input and output formats"""
+
+def parse_csv(lines, header, job=EVALUATE):
+    rows = list(csv.reader(lines))
+    columns = {}
+    for name in job.required_columns:
+        index = header.index(name)
+        columns[name] = np.array([to_float(row[index]) if len(row) > index else np.nan for row in rows])
+    return rows, columns
+
+
+def parse_jsonl(lines, job=EVALUATE):
+    rows = [json.loads(line) for line in lines]
+    columns = dict((name, np.array([to_float(row.get(name)) for row in rows])) for name in job.required_columns)
+    return rows, columns
+
+
+def result_rows(results, job):
+    return zip(*[results[name].tolist() for name in job.result_columns])
+
+
+def format_csv(rows, results, job=EVALUATE):
+    output = io.StringIO()
+    writer = csv.writer(output, lineterminator='\n')
+    values = result_rows(results, job)
+    for row, row_values in zip(rows, values):
+        writer.writerow(row + [format_number(value) for value in row_values])
+    return output.getvalue()
+
+
+def format_jsonl(rows, results, header=None, job=EVALUATE):
+    values = result_rows(results, job)
+    lines = []
+    for row, row_values in zip(rows, values):
+        record = dict(zip(header, row)) if header is not None else dict(row)
+        record.update((name, None if value != value else value) for name, value in zip(job.result_columns, row_values))
+        lines.append(json.dumps(record))
+    return '\n'.join(lines) + '\n' if lines else ''
+
+
+def process_chunk(lines, input_format, output_format, header, job=EVALUATE):
+    #runs in a worker process: raw input lines in, formatted output text out
+    if input_format == 'csv':
+        rows, columns = parse_csv(lines, header, job)
+    else:
+        rows, columns = parse_jsonl(lines, job)
+    results = job.evaluate(columns)
+    if output_format == 'csv':
+        if input_format == 'jsonl':
+            rows = [[row.get(name, '') for name in header] for row in rows]
+        return format_csv(rows, results, job)
+    return format_jsonl(rows, results, header if input_format == 'csv' else None, job)
+
+
+def detect_format(path, default='csv'):
+    if path.endswith('.jsonl') or path.endswith('.ndjson') or path.endswith('.json'):
+        return 'jsonl'
+    if path.endswith('.csv'):
+        return 'csv'
+    return default
+
+
+
+"""Running"""
+
+def read_records(stream, input_format='csv'):
+    #the raw text of every non-blank record; a CSV record goes on over the next line
+    #while a quoted field is open, that is while it holds an odd number of quotes
+    record, quotes = '', 0
+    for line in stream:
+        record += line
+        if input_format == 'csv':
+            quotes += line.count('"')
+            if quotes % 2:
+                continue
+        if record.strip():
+            yield record
+        record, quotes = '', 0
+    if record.strip(): #a quote left open at the end, the CSV reader makes what it can of it
+        yield record
+
+
+def read_header(stream):
+    #the column names of a CSV file, consuming only the header record
+    return next(csv.reader([next(read_records(stream), '')]), [])
+
+
+def read_chunks(stream, chunk_size, input_format='csv'):
+    records = read_records(stream, input_format)
+    while True:
+        chunk = list(islice(records, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def run(input_stream, output_stream, input_format='csv', output_format='csv', chunk_size=DEFAULT_CHUNK_SIZE, workers=None, jsonl_columns=None, job=EVALUATE):
+    header = None
+    if input_format == 'csv':
+        header = read_header(input_stream)
+        missing = [name for name in job.required_columns if name not in header]
+        if missing:
+            raise ValueError("input is missing the column(s) " + ", ".join(missing))
+    elif output_format == 'csv':
+        #CSV output of JSON-lines input needs the input columns up front
+        header = list(jsonl_columns or job.required_columns)
+    if output_format == 'csv':
+        csv.writer(output_stream, lineterminator='\n').writerow(header + list(job.result_columns))
+
+    workers = workers or os.cpu_count() or 1
+    count = 0
+    if workers == 1:
+        for lines in read_chunks(input_stream, chunk_size, input_format):
+            output_stream.write(process_chunk(lines, input_format, output_format, header, job))
+            count += len(lines)
+        return count
+
+    #at most two chunks per worker in flight, so a slow writer cannot fill memory
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        in_flight = []
+        for lines in read_chunks(input_stream, chunk_size, input_format):
+            in_flight.append(executor.submit(process_chunk, lines, input_format, output_format, header, job))
+            count += len(lines)
+            while len(in_flight) >= 2 * workers:
+                output_stream.write(in_flight.pop(0).result())
+        for future in in_flight:
+            output_stream.write(future.result())
+    return count
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Evaluate light field display specs without starting the app.")
+    parser.add_argument('input', help="CSV or JSON-lines file of display specs, - for stdin")
+    parser.add_argument('-o', '--output', default='-', help="where to write the results, - for stdout (default)")
+    parser.add_argument('--input-format', choices=['csv', 'jsonl'], help="default: from the file extension, else csv")
+    parser.add_argument('--output-format', choices=['csv', 'jsonl'], help="default: from the file extension, else the input format")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE, help="rows per worker task")
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (default: one per CPU)")
+    parser.add_argument('--columns', help="comma separated input columns to copy into CSV output of JSON-lines input")
+    args = parser.parse_args(argv)
+
+    input_format = args.input_format or detect_format(args.input)
+    output_format = args.output_format or detect_format(args.output, default=input_format)
+    jsonl_columns = args.columns.split(',') if args.columns else None
+
+    input_stream = sys.stdin if args.input == '-' else open(args.input, newline='')
+    output_stream = sys.stdout if args.output == '-' else open(args.output, 'w', newline='')
+    try:
+        count = run(input_stream, output_stream, input_format, output_format, args.chunk_size, args.workers, jsonl_columns)
+    finally:
+        if input_stream is not sys.stdin:
+            input_stream.close()
+        if output_stream is not sys.stdout:
+            output_stream.close()
+    print("{:,} specs evaluated".format(count), file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,404 @@
+"""Benchmarks"""
+
+#Measures startup, figure building, ray tracing, callback latency, payload size
+#and the disk cache, and compares runs with each other:
+#
+#    python benchmarks.py -o before.json
+#    git checkout my-branch
+#    python benchmarks.py -o after.json --compare before.json
+#
+#Times are the median of --repeat runs in ms; payload sizes are in bytes and
+#don't vary between runs. Startup times come from fresh interpreters so earlier
+#imports don't hide anything; they also count which of the web packages (Dash,
+#Flask, Plotly, pandas) an import pulls in, which must stay 0 for the numeric
+#modules batch jobs use. --compare prints every result next to the old one
+#and exits with status 1 when a time got more than --threshold (and --min-ms)
+#slower, or a payload or a module count got bigger.
+#
+#--serve 1,4,16 also starts gunicorn (gunicorn.conf.py, wsgi.py) with each of
+#those worker counts, loads it with clients for --duration seconds and records
+#requests per second and the resident (RSS) and proportional (PSS, shared pages
+#split between the processes sharing them) memory per worker.
+
+import argparse
+import http.client
+import importlib.util
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+#modules in the order they build on each other: the numeric layer first, then Plotly and the web app
+IMPORTS = ('core', 'profiles', 'geometry', 'sweep', 'batch', 'hogels', 'rays', 'seating', 'motion', 'solver', 'pareto', 'sensitivity', 'disk_cache', 'svg_export', 'figures', 'app')
+WEB_PACKAGES = ('dash', 'flask', 'plotly', 'pandas')
+
+
+
+"""Measuring"""
+
+def median_ms(function, repeat, setup=None):
+    times = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        function()
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times)
+
+
+def import_ms(module, repeat):
+    #a fresh interpreter per run, timing only the import itself; also returns how many web packages it loaded
+    code = ("import sys, time; start = time.perf_counter(); import {}; elapsed = time.perf_counter() - start; "
+            "print(elapsed, sum(name in sys.modules for name in {!r}))").format(module, WEB_PACKAGES)
+    times = []
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, '-W', 'ignore', '-c', code], cwd=HERE, check=True, capture_output=True, text=True).stdout
+        elapsed, web_packages = output.split()[-2:]
+        times.append(float(elapsed) * 1000)
+    return statistics.median(times), int(web_packages)
+
+
+def clear_caches():
+    #everything memoized between a profile and its figures, so builds start from nothing
+    import app
+    import figures
+    import geometry
+    for function in (geometry.arc_points, geometry.head_part, geometry.top_frame_part, geometry.view_angle_part, geometry.pixel_part, geometry.pixel_grid_part,
+                     geometry.side_scene,
+                     figures.build_side_figure, figures.get_figures,
+                     app.preset_payload, app.preset_payloads, app.preset_outputs):
+        function.cache_clear()
+
+
+def callback_body(key):
+    import app
+    outputs = [dict(id=output.component_id, property=output.component_property) for output in app.PRESET_OUTPUTS]
+    return dict(
+        output='..' + '...'.join('{id}.{property}'.format(**output) for output in outputs) + '..',
+        outputs=outputs,
+        inputs=[dict(id='form_buttons', property='value', value=key)],
+        changedPropIds=['form_buttons.value'],
+        state=[],
+    )
+
+
+
+"""Benchmarks"""
+
+def startup_benchmarks(repeat):
+    results = {}
+    for module in IMPORTS:
+        results['import.' + module], results['modules.' + module] = import_ms(module, repeat)
+    return results
+
+
+def figure_benchmarks(repeat):
+    import figures
+    import geometry
+    from profiles import PROFILES, is_drawable
+
+    results = {}
+    for key, profile in PROFILES.items():
+        if not is_drawable(profile):
+            continue
+        results['scene.{}.top'.format(key)] = median_ms(lambda: geometry.top_scene(profile), repeat, clear_caches)
+        results['scene.{}.side'.format(key)] = median_ms(lambda: geometry.side_scene(profile), repeat, clear_caches)
+        results['figure.{}.top'.format(key)] = median_ms(lambda: figures.build_top_figure(profile), repeat, clear_caches)
+        results['figure.{}.side'.format(key)] = median_ms(lambda: figures.build_side_figure(profile), repeat, clear_caches)
+        results['figure.{}.tornado'.format(key)] = median_ms(
+            lambda: figures.build_tornado_figure(profile.pixel_pitch, profile.hogel_diameter, profile.view_distance, profile.view_angle), repeat)
+    return results
+
+
+def ray_benchmarks(repeat, heads=100):
+    #ms per head position when a row of heads across the view distance is traced at once
+    import numpy as np
+    import rays
+    from profiles import PROFILES, is_drawable
+
+    results = {}
+    for key, profile in PROFILES.items():
+        if not is_drawable(profile):
+            continue
+        positions = rays.top_view_heads(profile, -profile.view_distance, np.linspace(0, profile.display_width, heads))
+        results['rays.{}.per_head'.format(key)] = median_ms(lambda: rays.trace_profile(profile, positions), repeat) / heads
+    return results
+
+
+def payload_benchmarks():
+    import figures
+    import responses
+    from profiles import PROFILES, is_drawable
+
+    results = {}
+    for key in PROFILES:
+        for view, figure in zip(('top', 'side'), figures.get_figures(key)):
+            body = responses.to_json_bytes(figure)
+            results['bytes.{}.{}'.format(key, view)] = len(body)
+            results['bytes.{}.{}.gzip'.format(key, view)] = len(responses.compress(body).get('gzip', body))
+        if is_drawable(PROFILES[key]):
+            #the viewer animation, frames only carry what changed
+            for view, figure in zip(('top', 'side'), figures.build_motion_figures(PROFILES[key])):
+                body = responses.to_json_bytes(figure)
+                results['bytes.{}.motion.{}'.format(key, view)] = len(body)
+                results['bytes.{}.motion.{}.gzip'.format(key, view)] = len(responses.compress(body).get('gzip', body))
+    return results
+
+
+def disk_cache_benchmarks(repeat):
+    #a custom top view and a grid sweep built into an empty cache, and read back from it
+    import disk_cache
+    import figures
+    import sweep_page
+    from profiles import custom_profile
+
+    profile = custom_profile(1000, 600, 900, 0.02, 0.3, 60)
+    ranges = dict((name, (low, high, steps)) for name, label, low, high, steps in sweep_page.SWEEP_INPUTS)
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        cache = disk_cache.configure(directory)
+        try:
+            for name, build in (('top', lambda: figures.top_figure_json(profile)),
+                                ('sweep', lambda: sweep_page.sweep_results('grid', ranges, None, float))):
+                results['disk_cache.{}.miss'.format(name)] = median_ms(build, min(repeat, 3), cache.clear)
+                results['disk_cache.{}.hit'.format(name)] = median_ms(build, repeat)
+        finally:
+            disk_cache.configure(None)
+    return results
+
+
+def callback_benchmarks(repeat):
+    #server side preset switching through Flask's test client, the same requests a browser sends
+    import app as app_module
+    from profiles import PROFILES
+
+    results = {}
+    for cache_responses in (False, True):
+        app = app_module.create_app(clientside=False, cache_responses=cache_responses)
+        client = app.server.test_client()
+        mode = 'cached' if cache_responses else 'uncached'
+        client.get('/_dash-dependencies')
+
+        for key in PROFILES:
+            data = json.dumps(callback_body(key))
+
+            def switch():
+                response = client.post('/_dash-update-component', data=data, content_type='application/json')
+                assert response.status_code == 200, response.status_code
+
+            if not cache_responses:
+                #first click on a preset nobody has looked at yet
+                results['callback.{}.cold'.format(key)] = median_ms(switch, repeat, clear_caches)
+            results['callback.{}.{}'.format(key, mode)] = median_ms(switch, repeat)
+
+        #the page layout of the default app, which carries every preset figure for clientside switching
+        layout_client = app_module.create_app(cache_responses=cache_responses).server.test_client()
+        results['layout.{}'.format(mode)] = median_ms(lambda: layout_client.get('/_dash-layout'), repeat, clear_caches)
+
+    results['bytes.layout'] = len(layout_client.get('/_dash-layout').get_data())
+    return results
+
+
+def run(repeat=20, startup_repeat=5, serve_workers=(), duration=10):
+    import disk_cache
+    disk_cache.configure(None) #builds are measured, not reads from APPLET_CACHE_DIR
+    results = {}
+    results.update(startup_benchmarks(startup_repeat))
+    results.update(figure_benchmarks(repeat))
+    results.update(ray_benchmarks(repeat))
+    results.update(payload_benchmarks())
+    results.update(callback_benchmarks(repeat))
+    results.update(disk_cache_benchmarks(repeat))
+    if serve_workers:
+        results.update(serving_benchmarks(serve_workers, duration))
+    return results
+
+
+
+"""Serving"""
+
+SERVE_PORT = 8765
+#what a page load asks the server for, both answered from the response cache
+SERVE_PATHS = ('/_dash-layout', '/_dash-dependencies')
+
+
+def child_pids(pid):
+    children = []
+    for name in os.listdir('/proc'):
+        if not name.isdigit():
+            continue
+        try:
+            with open('/proc/{}/stat'.format(name)) as f:
+                if int(f.read().rsplit(')', 1)[1].split()[1]) == pid:
+                    children.append(int(name))
+        except (OSError, ValueError, IndexError):
+            pass
+    return children
+
+
+def memory_mb(pid):
+    #(RSS, PSS) of a process in MB, from /proc on Linux
+    values = {}
+    for filename, field in (('status', 'VmRSS:'), ('smaps_rollup', 'Pss:')):
+        try:
+            with open('/proc/{}/{}'.format(pid, filename)) as f:
+                for line in f:
+                    if line.startswith(field):
+                        values[field] = int(line.split()[1]) / 1024
+                        break
+        except OSError:
+            pass
+    return values.get('VmRSS:', float('nan')), values.get('Pss:', float('nan'))
+
+
+def get(port, path):
+    connection = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+    try:
+        connection.request('GET', path, headers={'Accept-Encoding': 'gzip'})
+        response = connection.getresponse()
+        response.read()
+        return response.status
+    finally:
+        connection.close()
+
+
+def wait_until_serving(process, port, workers, timeout=120):
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError("gunicorn exited with status {}".format(process.returncode))
+        try:
+            if get(port, SERVE_PATHS[0]) == 200 and len(child_pids(process.pid)) >= workers:
+                return
+        except OSError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError("gunicorn did not start within {} s".format(timeout))
+
+
+def requests_per_second(port, duration, clients):
+    #every client asks for the paths in turn until the time is up
+    counts = [0] * clients
+    deadline = time.perf_counter() + duration
+
+    def client(index):
+        while time.perf_counter() < deadline:
+            if get(port, SERVE_PATHS[counts[index] % len(SERVE_PATHS)]) == 200:
+                counts[index] += 1
+
+    start = time.perf_counter()
+    threads = [threading.Thread(target=client, args=(index,)) for index in range(clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return sum(counts) / (time.perf_counter() - start)
+
+
+def serving_benchmarks(worker_counts, duration):
+    results = {}
+    for workers in worker_counts:
+        #gunicorn before 20.1 has no __main__, its wsgiapp module runs in every version
+        command = [sys.executable, '-m', 'gunicorn.app.wsgiapp', '-c', 'gunicorn.conf.py', '-w', str(workers),
+                   '-b', '127.0.0.1:{}'.format(SERVE_PORT), 'wsgi:server']
+        process = subprocess.Popen(command, cwd=HERE, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        try:
+            wait_until_serving(process, SERVE_PORT, workers)
+            results['serve.w{}.rps'.format(workers)] = requests_per_second(SERVE_PORT, duration, clients=max(4, 2 * workers))
+            rss, pss = zip(*[memory_mb(pid) for pid in child_pids(process.pid)])
+            results['serve.w{}.worker_rss_mb'.format(workers)] = statistics.mean(rss)
+            results['serve.w{}.worker_pss_mb'.format(workers)] = statistics.mean(pss)
+            results['serve.w{}.master_rss_mb'.format(workers)] = memory_mb(process.pid)[0]
+        finally:
+            process.terminate()
+            process.wait()
+    return results
+
+
+
+"""Comparing"""
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=HERE, check=True, capture_output=True, text=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(old, new, threshold, min_ms=0.1):
+    #prints both runs side by side, returns the names of the results that got worse
+    regressions = []
+    print("{:<28} {:>12} {:>12} {:>8}".format("benchmark", old.get('commit') or "old", new.get('commit') or "new", "change"))
+    for name, value in new['results'].items():
+        old_value = old['results'].get(name)
+        if old_value is None:
+            print("{:<28} {:>12} {:>12.4g}".format(name, "-", value))
+            continue
+        change = (value - old_value) / old_value if old_value else float(value > old_value)
+        #sub-millisecond timings jitter by more than the threshold, min_ms keeps them quiet
+        if name.startswith('bytes.') or name.startswith('modules.'):
+            worse = value > old_value
+        elif name.endswith('.rps'):
+            worse = change < -threshold
+        elif name.endswith('_mb'):
+            worse = change > threshold
+        else:
+            worse = change > threshold and value - old_value > min_ms
+        if worse:
+            regressions.append(name)
+        print("{:<28} {:>12.4g} {:>12.4g} {:>+7.1%}{}".format(name, old_value, value, change, "  <-" if worse else ""))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark startup, figure building, callback latency and payload size.")
+    parser.add_argument('-o', '--output', help="file to save the results to, as JSON")
+    parser.add_argument('--compare', help="results file of an earlier run to compare with")
+    parser.add_argument('--repeat', type=int, default=20, help="runs per timing (default: 20)")
+    parser.add_argument('--startup-repeat', type=int, default=5, help="fresh interpreters per import timing (default: 5)")
+    parser.add_argument('--threshold', type=float, default=0.1, help="relative slowdown that counts as a regression (default: 0.1)")
+    parser.add_argument('--min-ms', type=float, default=0.1, help="smallest slowdown in ms that counts as a regression (default: 0.1)")
+    parser.add_argument('--serve', help="comma separated gunicorn worker counts to load test, like 1,4,16 (needs gunicorn)")
+    parser.add_argument('--duration', type=float, default=10, help="seconds of load per worker count (default: 10)")
+    args = parser.parse_args(argv)
+
+    serve_workers = [int(count) for count in args.serve.split(',')] if args.serve else []
+    if serve_workers and importlib.util.find_spec('gunicorn') is None:
+        parser.error("--serve needs gunicorn (pip install gunicorn)")
+
+    report = dict(
+        commit=git_commit(),
+        date=datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        python=platform.python_version(),
+        machine=platform.machine(),
+        cpus=os.cpu_count(),
+        repeat=args.repeat,
+        results=run(args.repeat, args.startup_repeat, serve_workers, args.duration),
+    )
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=1)
+
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(json.load(f), report, args.threshold, args.min_ms)
+        if regressions:
+            print("{} regression(s): {}".format(len(regressions), ", ".join(regressions)), file=sys.stderr)
+            sys.exit(1)
+    else:
+        for name, value in report['results'].items():
+            print("{:<28} {:>12.4g}".format(name, value))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,247 @@
+"""Custom display"""
+
+#Tab of the app where the display parameters are typed in instead of picked from
+#the presets. The inputs only send their value on Enter or when they lose focus,
+#and only the views an edit affects are sent back: a new pixel pitch rebuilds the
+#pixel part of the top view (see top_view_parts in geometry.py) and leaves the
+#side view alone.
+#
+#Updates that arrive while an older one for the same browser is still being
+#built are coalesced: only the newest waiting update is built, the ones it
+#overtook are dropped and their views are rebuilt together with it.
+#
+#Views built before, by any worker and before a restart, are read from the disk
+#cache when one is configured (disk_cache.py).
+#
+#Zooming or panning the top view rebuilds it for the visible window, so a
+#pixel grid too dense to draw whole (shaded instead, see draw_pixels in
+#geometry.py) shows its lines once few enough of them are in view.
+#
+#Next to the table a tornado chart (figures.build_tornado_figure) shows how
+#sensitive the metrics are to the parameters; it has its own callback, so it
+#follows every edit without waiting for the views.
+
+import threading
+import uuid
+
+import dash
+import dash_core_components as dcc
+import dash_html_components as html
+import flask
+from dash.dependencies import Input, Output
+from dash.exceptions import PreventUpdate
+
+import core
+import solver
+from figures import build_tornado_figure, side_figure_json, top_figure_json
+from geometry import graph_variables
+from profiles import PROFILES, custom_profile
+from responses import dont_cache
+
+
+SESSION_COOKIE = 'applet-session'
+
+_desktop = PROFILES['D']
+
+#(parameter, label, default, views it changes)
+CUSTOM_INPUTS = [
+    ('display_width', "Display Width (mm)", _desktop.display_width, ('top', 'side')),
+    ('display_height', "Display Height (mm)", _desktop.display_height, ('top', 'side')),
+    ('view_distance', "View Distance (mm)", _desktop.view_distance, ('top', 'side')),
+    ('pixel_pitch', "Pixel Pitch (mm)", _desktop.pixel_pitch, ('top',)),
+    ('hogel_diameter', "Diameter of Hogel (mm)", _desktop.hogel_diameter, ('top',)),
+    ('view_angle', "\u03B8 (degrees)", _desktop.view_angle, ('top',)),
+]
+
+VIEWS = ('top', 'side')
+
+#CUSTOM_INPUTS the tornado chart depends on, in build_tornado_figure's order
+TORNADO_INPUTS = ('pixel_pitch', 'hogel_diameter', 'view_distance', 'view_angle')
+
+
+def input_error(values):
+    #status message for input values nothing can be drawn from, None when they are fine
+    if any(value is None or value <= 0 for value in values.values()):
+        return "Every value has to be a positive number."
+    if values.get('view_angle', 0) >= 180: #tan of half the angle changes sign
+        return "{}.".format(solver.TOO_WIDE.capitalize())
+    return None
+
+
+def custom_table_rows(profile):
+    return [
+        ("Views per Hogel", core.views_per_hogel(profile.pixel_pitch, profile.hogel_diameter)),
+        ("Angular Resolution", profile.angular_resolution),
+        ("Lossless Projection Depth (mm)", profile.lossless_depth),
+        ("View Zone Width (mm)", core.view_zone_width(profile.view_distance, profile.view_angle)),
+        ("Hogel Angular Size (arcmin)", core.hogel_angular_size(profile.hogel_diameter, profile.view_distance)),
+    ]
+
+
+
+"""Coalescing"""
+
+class Coalescer(object):
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.latest = {} #session -> newest ticket
+        self.pending = {} #session -> views waiting to be rebuilt
+        self.session_locks = {}
+        self.active = {} #session -> updates submitted and not done yet
+
+    def submit(self, session, views):
+        #returns a ticket for this update and remembers which views it dirtied;
+        #every submit has to be followed by done once the update is answered
+        with self.lock:
+            ticket = self.latest.get(session, 0) + 1
+            self.latest[session] = ticket
+            self.pending.setdefault(session, set()).update(views)
+            session_lock = self.session_locks.setdefault(session, threading.Lock())
+            self.active[session] = self.active.get(session, 0) + 1
+        return ticket, session_lock
+
+    def take(self, session, ticket):
+        #the views to build for this ticket, or None when a newer update is waiting
+        with self.lock:
+            if self.latest.get(session) != ticket:
+                return None
+            return self.pending.pop(session, set())
+
+    def done(self, session):
+        #forgets a session once none of its updates is in flight, so sessions don't pile up
+        with self.lock:
+            self.active[session] -= 1
+            if self.active[session] == 0:
+                for entries in (self.latest, self.pending, self.session_locks, self.active):
+                    entries.pop(session, None)
+
+    def __len__(self):
+        #sessions with updates in flight
+        with self.lock:
+            return len(self.active)
+
+
+coalescer = Coalescer()
+
+
+def session_id():
+    return flask.request.cookies.get(SESSION_COOKIE) or flask.request.remote_addr or ''
+
+
+def set_session_cookie(response):
+    if SESSION_COOKIE not in flask.request.cookies:
+        response.set_cookie(SESSION_COOKIE, uuid.uuid4().hex, httponly=True, samesite='Lax')
+    return response
+
+
+
+"""Zoom"""
+
+def relayout_window(relayout_data, axis_size):
+    #the visible (x_min, x_max, y_min, y_max) after a zoom or pan, None for the whole figure
+    if not relayout_data or relayout_data.get('xaxis.autorange') or relayout_data.get('yaxis.autorange'):
+        return None
+    window = []
+    for axis in ('xaxis', 'yaxis'):
+        if axis + '.range[0]' in relayout_data:
+            low, high = relayout_data[axis + '.range[0]'], relayout_data[axis + '.range[1]']
+        elif axis + '.range' in relayout_data:
+            low, high = relayout_data[axis + '.range']
+        else:
+            low, high = -axis_size, axis_size
+        window.extend(sorted((float(low), float(high))))
+    return tuple(window) if window != [-axis_size, axis_size] * 2 else None
+
+
+def changes_view(relayout_data):
+    #autosize and dragmode changes arrive as relayoutData too
+    return any(key.startswith('xaxis.') or key.startswith('yaxis.') for key in relayout_data or {})
+
+
+
+"""Layout and callbacks"""
+
+def make_custom_layout():
+    return html.Div(children=[
+        html.Table(children=[
+            html.Tbody(children=[
+                html.Tr(children=[
+                    html.Th(scope="row", children=[label]),
+                    html.Td(dcc.Input(id='custom-' + name, type='number', value=default, debounce=True, min=0, style={'width': '100px'})),
+                    ])
+                for name, label, default, views in CUSTOM_INPUTS
+                ]),
+            ]),
+        html.Div(id='custom-status'),
+
+        html.Div(children=[dcc.Graph(id='custom-top-figure')], style={ 'display': 'inline-block'}),
+        html.Div(children=[dcc.Graph(id='custom-side-figure')], style={ 'display': 'inline-block'}),
+        html.Div(children=[html.Table(id='custom-table')], style={ 'display': 'inline-block'}),
+        html.Div(children=[dcc.Graph(id='custom-tornado')], style={ 'display': 'inline-block'}),
+    ])
+
+
+def register_custom_callbacks(app):
+    app.server.after_request(set_session_cookie)
+
+    @app.callback(
+        [Output('custom-top-figure', 'figure'), Output('custom-side-figure', 'figure'),
+         Output('custom-table', 'children'), Output('custom-status', 'children')],
+        [Input('custom-' + name, 'value') for name, label, default, views in CUSTOM_INPUTS] +
+        [Input('custom-top-figure', 'relayoutData')]
+    )
+    def update_custom_display(*values):
+        #the answer depends on what was coalesced before it, so it cannot be replayed
+        dont_cache()
+        values, relayout_data = values[:-1], values[-1]
+
+        error = input_error(dict(zip([name for name, label, default, views in CUSTOM_INPUTS], values)))
+        if error:
+            return dash.no_update, dash.no_update, dash.no_update, error
+        profile = custom_profile(*values)
+        axis_size = graph_variables(profile)['axis_size']
+
+        triggered = set(item['prop_id'] for item in dash.callback_context.triggered)
+        views = set()
+        for name, label, default, affected in CUSTOM_INPUTS:
+            if 'custom-' + name + '.value' in triggered:
+                views.update(affected)
+        if 'custom-top-figure.relayoutData' in triggered:
+            if changes_view(relayout_data):
+                views.add('top')
+            elif triggered == {'custom-top-figure.relayoutData'}: #autosize or a new drag mode
+                raise PreventUpdate
+        if not views: #first call when the page loads
+            views = set(VIEWS)
+
+        session = session_id()
+        ticket, session_lock = coalescer.submit(session, views)
+        try:
+            with session_lock:
+                views = coalescer.take(session, ticket)
+                if views is None:
+                    raise PreventUpdate
+                figure_top = top_figure_json(profile, relayout_window(relayout_data, axis_size)) if 'top' in views else dash.no_update
+                figure_side = side_figure_json(profile) if 'side' in views else dash.no_update
+        finally:
+            coalescer.done(session)
+
+        if figure_top is not dash.no_update:
+            #keeps the user's zoom across rebuilds, so the window in relayoutData stays the one on screen
+            figure_top['layout']['uirevision'] = 'custom'
+
+        table = [html.Tbody(children=[
+            html.Tr(children=[html.Th(scope="row", children=[label]), html.Td("{:.4g}".format(value))])
+            for label, value in custom_table_rows(profile)
+            ])]
+        return figure_top, figure_side, table, ""
+
+    @app.callback(
+        Output('custom-tornado', 'figure'),
+        [Input('custom-' + name, 'value') for name in TORNADO_INPUTS]
+    )
+    def update_custom_tornado(*values):
+        if input_error(dict(zip(TORNADO_INPUTS, values))):
+            return dash.no_update
+        return build_tornado_figure(*values)
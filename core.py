@@ -0,0 +1,60 @@
+"""Spatial/angular trade relationships"""
+
+#The quantities in the variable table follow from the display hardware:
+#a hogel of diameter D over pixels of pitch p holds D/p views, the view angle is
+#shared between those views, and the lossless projection depth is the distance
+#at which one view's angular step spans a whole hogel.
+#
+#Every function takes floats or NumPy arrays (broadcast against each other) and
+#keeps the dtype of its inputs, so float32 arrays stay float32.
+#Lengths are in mm and angles in degrees, like the profiles.
+
+import numpy as np
+
+
+def views_per_hogel(pixel_pitch, hogel_diameter):
+    return hogel_diameter / pixel_pitch
+
+
+def view_angle_per_view(pixel_pitch, hogel_diameter, view_angle):
+    #angular step between neighbouring views in degrees
+    return view_angle * pixel_pitch / hogel_diameter
+
+
+def angular_resolution(pixel_pitch, hogel_diameter, view_angle):
+    #views per degree
+    return hogel_diameter / (pixel_pitch * view_angle)
+
+
+def lossless_depth(pixel_pitch, hogel_diameter, view_angle):
+    #depth in mm in front of/behind the display before a point spreads wider than one hogel
+    return hogel_diameter / np.tan(np.radians(view_angle_per_view(pixel_pitch, hogel_diameter, view_angle)) / 2)
+
+
+def view_zone_width(view_distance, view_angle):
+    #width of the view zone at the view distance in mm
+    return 2 * view_distance * np.tan(np.radians(view_angle) / 2)
+
+
+def hogel_angular_size(hogel_diameter, view_distance):
+    #angle one hogel subtends at the viewer in arcminutes (the eye resolves about 1)
+    return np.degrees(2 * np.arctan(hogel_diameter / (2 * view_distance))) * 60
+
+
+
+"""Figure geometry"""
+
+#The top view draws one hogel magnified into a circle 0.75 of the view distance
+#across, with the pixels scaled by the same factor.
+
+def hogel_circle_diameter(view_distance):
+    return view_distance * 0.75
+
+
+def pixel_radius_ratio(view_distance, pixel_pitch, hogel_diameter):
+    #pixel pitch proportional to the hogel circle diameter
+    return hogel_circle_diameter(view_distance) * pixel_pitch / hogel_diameter
+
+
+def num_pixel_lines(view_distance, pixel_pitch, hogel_diameter):
+    return np.floor(hogel_circle_diameter(view_distance) / pixel_radius_ratio(view_distance, pixel_pitch, hogel_diameter))
@@ -0,0 +1,333 @@
+"""Disk cache"""
+
+#Figures and sweeps for custom parameters are rebuilt by every worker and after
+#every restart. With APPLET_CACHE_DIR set, memoize keeps their results in files
+#named by a hash of the arguments and of the code that computes them, so the
+#same request after a deploy, a restart or in another worker costs a file read:
+#
+#    @memoize('figure.side', 'json')
+#    def side_figure_json(profile):
+#        return build_side_figure(profile).to_plotly_json()
+#
+#'json' values are JSON-ready data such as figure dicts (they come back with
+#lists instead of arrays and tuples), 'arrays' values are dicts of NumPy arrays
+#and numbers, nested dicts allowed (written as .npz, numbers come back as Python
+#scalars). A miss returns its result decoded from what it stored, so callers
+#get the same types from a miss as from a hit.
+#
+#The code version hashes every .py file next to this one, so any change to the
+#code starts over with new keys and the old files age out. Files are written to
+#a temporary name and renamed into place, so readers in other processes see a
+#whole file or none. Hits touch the file's mtime and the least recently used
+#files are deleted once the directory holds more than APPLET_CACHE_MB
+#(default 1024), by one process at a time. Every process keeps a running
+#estimate of the size and only scans the directory when the estimate is over
+#budget or every RESCAN_WRITES writes, so a write does not cost a scan.
+
+import glob
+import hashlib
+import io
+import json
+import os
+import tempfile
+import threading
+import time
+import zipfile
+from functools import wraps
+
+import numpy as np
+
+from metrics import REGISTRY
+
+try:
+    import fcntl
+except ImportError: #no file locks, concurrent evictions only repeat each other's work
+    fcntl = None
+
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_MAX_MB = 1024
+STALE_TEMP_SECONDS = 3600 #temporary files this old were left by a writer that died
+EVICT_TO = 0.8 #eviction makes this share of max_bytes free, so it isn't needed again on the next write
+RESCAN_WRITES = 100 #writes between scans of the directory, which also see what other processes wrote
+
+EXTENSIONS = dict(json='.json', arrays='.npz')
+
+DISK_CACHE = REGISTRY.counter('applet_disk_cache_requests_total', "Lookups in the on-disk result cache.", ('namespace', 'result'))
+
+MISSING = object()
+
+
+
+"""Keys"""
+
+_code_version = None
+
+
+def code_version():
+    #hash of this directory's Python sources and of the libraries that shape the results
+    global _code_version
+    if _code_version is None:
+        digest = hashlib.sha1()
+        for path in sorted(glob.glob(os.path.join(HERE, '*.py'))):
+            digest.update(os.path.basename(path).encode() + b'\0')
+            with open(path, 'rb') as f:
+                digest.update(f.read())
+        import plotly
+        digest.update('numpy {} plotly {}'.format(np.__version__, plotly.__version__).encode())
+        _code_version = digest.hexdigest()
+    return _code_version
+
+
+def fingerprint(value, digest):
+    #feeds an unambiguous encoding of value into digest; floats by their exact repr,
+    #arrays by dtype, shape and bytes, tuples (namedtuples too) with their type name
+    if value is None or isinstance(value, (bool, int, float, str)):
+        digest.update('{}:{!r};'.format(type(value).__name__, value).encode())
+    elif isinstance(value, bytes):
+        digest.update(b'bytes:%d:' % len(value) + value)
+    elif isinstance(value, (np.ndarray, np.generic)):
+        value = np.ascontiguousarray(value)
+        digest.update('array:{}:{}:'.format(value.dtype.str, value.shape).encode())
+        digest.update(value.tobytes())
+    elif isinstance(value, type):
+        digest.update('type:{}.{};'.format(value.__module__, value.__qualname__).encode())
+    elif isinstance(value, (tuple, list)):
+        digest.update('{}:{}['.format(type(value).__name__, len(value)).encode())
+        for item in value:
+            fingerprint(item, digest)
+        digest.update(b']')
+    elif isinstance(value, dict):
+        digest.update('dict:{}{{'.format(len(value)).encode())
+        for key in sorted(value, key=repr):
+            fingerprint(key, digest)
+            fingerprint(value[key], digest)
+        digest.update(b'}')
+    else:
+        raise TypeError("cannot make a cache key from {!r}".format(type(value)))
+
+
+def cache_key(namespace, *args, **kwargs):
+    digest = hashlib.sha256()
+    fingerprint((namespace, code_version(), args, kwargs), digest)
+    return digest.hexdigest()
+
+
+
+"""Serialization"""
+
+def dump_json(value, f):
+    import plotly.utils
+    f.write(json.dumps(value, cls=plotly.utils.PlotlyJSONEncoder, separators=(',', ':')).encode('utf-8'))
+
+
+def load_json(f):
+    return json.loads(f.read().decode('utf-8'))
+
+
+def dump_arrays(value, f):
+    #nested dict keys are joined with '/'
+    flat = {}
+
+    def flatten(prefix, item):
+        if isinstance(item, dict):
+            for name, inner in item.items():
+                flatten(prefix + (str(name),), inner)
+        else:
+            flat['/'.join(prefix)] = np.asarray(item)
+
+    flatten((), value)
+    np.savez(f, **flat)
+
+
+def load_arrays(f):
+    value = {}
+    with np.load(f, allow_pickle=False) as arrays:
+        for name in arrays.files:
+            item = arrays[name]
+            *parents, leaf = name.split('/')
+            node = value
+            for parent in parents:
+                node = node.setdefault(parent, {})
+            node[leaf] = item.item() if item.ndim == 0 else item
+    return value
+
+
+SERIALIZERS = dict(json=(dump_json, load_json), arrays=(dump_arrays, load_arrays))
+
+
+def encode(kind, value):
+    f = io.BytesIO()
+    SERIALIZERS[kind][0](value, f)
+    return f.getvalue()
+
+
+def decode(kind, data):
+    return SERIALIZERS[kind][1](io.BytesIO(data))
+
+
+
+"""Cache"""
+
+class DiskCache(object):
+
+    def __init__(self, directory, max_bytes=DEFAULT_MAX_MB * 2**20):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.estimate = None #bytes in the cache as of the last scan plus what this process wrote since
+        self.writes = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def path(self, key, kind):
+        return os.path.join(self.directory, key[:2], key[2:] + EXTENSIONS[kind])
+
+    def get(self, key, kind):
+        #the stored value, or MISSING
+        path = self.path(key, kind)
+        try:
+            with open(path, 'rb') as f:
+                value = SERIALIZERS[kind][1](f)
+        except FileNotFoundError:
+            return MISSING
+        except (OSError, ValueError, EOFError, zipfile.BadZipFile): #unreadable, e.g. truncated by a full disk: drop it
+            self.remove(path)
+            return MISSING
+        try:
+            os.utime(path) #most recently used
+        except OSError:
+            pass
+        return value
+
+    def put(self, key, kind, value):
+        return self.write(key, kind, encode(kind, value))
+
+    def write(self, key, kind, data):
+        #stores encoded data; the directory is only scanned for eviction when this process's
+        #estimate of its size is over budget, or every RESCAN_WRITES writes
+        path = self.path(key, kind)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        handle, temporary = tempfile.mkstemp(prefix='.tmp-', dir=os.path.dirname(path))
+        try:
+            with os.fdopen(handle, 'wb') as f:
+                f.write(data)
+            os.replace(temporary, path)
+        except BaseException:
+            self.remove(temporary)
+            raise
+
+        with self.lock:
+            self.writes += 1
+            if self.estimate is not None:
+                self.estimate += len(data)
+            due = self.estimate is None or self.estimate > self.max_bytes or self.writes % RESCAN_WRITES == 0
+        if due:
+            self.evict()
+        return path
+
+    def remove(self, path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def entries(self):
+        #(mtime, size, path) of every cached file; temporary files are left to their writers unless stale
+        now = time.time()
+        found = []
+        for directory in os.scandir(self.directory):
+            if not directory.is_dir():
+                continue
+            for entry in os.scandir(directory.path):
+                try:
+                    stat = entry.stat()
+                except OSError: #removed by another process meanwhile
+                    continue
+                if entry.name.startswith('.tmp-'):
+                    if now - stat.st_mtime > STALE_TEMP_SECONDS:
+                        self.remove(entry.path)
+                    continue
+                found.append((stat.st_mtime, stat.st_size, entry.path))
+        return found
+
+    def size(self):
+        return sum(size for mtime, size, path in self.entries())
+
+    def evict(self):
+        #deletes least recently used files until the cache fits in EVICT_TO of max_bytes once it is over
+        #max_bytes; skipped when another process is already at it
+        with open(os.path.join(self.directory, '.lock'), 'w') as lock:
+            if fcntl is not None:
+                try:
+                    fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except OSError:
+                    return 0
+            entries = self.entries()
+            total = sum(size for mtime, size, path in entries)
+            removed = 0
+            for mtime, size, path in sorted(entries) if total > self.max_bytes else ():
+                if total <= self.max_bytes * EVICT_TO:
+                    break
+                self.remove(path)
+                total -= size
+                removed += 1
+        with self.lock:
+            self.estimate = total
+        return removed
+
+    def clear(self):
+        for mtime, size, path in self.entries():
+            self.remove(path)
+        with self.lock:
+            self.estimate = None
+
+
+
+"""Memoizing"""
+
+_cache = MISSING
+
+
+def default_cache():
+    #the cache in APPLET_CACHE_DIR, None when it is not set
+    global _cache
+    if _cache is MISSING:
+        directory = os.environ.get('APPLET_CACHE_DIR')
+        max_mb = float(os.environ.get('APPLET_CACHE_MB', DEFAULT_MAX_MB))
+        _cache = DiskCache(directory, int(max_mb * 2**20)) if directory else None
+    return _cache
+
+
+def configure(directory, max_mb=DEFAULT_MAX_MB):
+    #sets the cache memoize uses instead of the environment, None turns it off
+    global _cache
+    _cache = DiskCache(directory, int(max_mb * 2**20)) if directory else None
+    return _cache
+
+
+def memoize(namespace, kind):
+    #decorator caching function's results on disk, keyed by namespace, its arguments and the code version;
+    #calls straight through while no cache is configured
+    if kind not in SERIALIZERS:
+        raise ValueError("kind must be one of " + ", ".join(SERIALIZERS))
+
+    def decorator(function):
+        @wraps(function)
+        def cached(*args, **kwargs):
+            cache = default_cache()
+            if cache is None:
+                return function(*args, **kwargs)
+            key = cache_key(namespace, *args, **kwargs)
+            value = cache.get(key, kind)
+            if value is not MISSING:
+                DISK_CACHE.inc(namespace=namespace, result='hit')
+                return value
+            DISK_CACHE.inc(namespace=namespace, result='miss')
+            data = encode(kind, function(*args, **kwargs))
+            try:
+                cache.write(key, kind, data)
+            except OSError: #a full or read-only disk only costs the caching
+                pass
+            return decode(kind, data) #the same types a hit returns
+        return cached
+    return decorator
@@ -0,0 +1,256 @@
+"""Figures"""
+
+#Plotly figures of the top and side views. The geometry comes from the scenes in
+#geometry.py, every scene is turned into a handful of traces: one per line width
+#for the line segments (joined with NaN gaps, so the number of objects in a
+#figure stays the same however many pixel lines a hogel has), one per polyline
+#and one for all the labels. The circles become layout shapes.
+
+from functools import lru_cache
+
+import numpy as np
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+import disk_cache
+import motion
+import sensitivity
+from geometry import side_scene, top_scene
+from metrics import FIGURE_BUILD
+from profiles import get_profile, is_drawable
+
+
+
+
+"""Scene to figure"""
+
+def line_traces(scene):
+    traces = []
+    for width, rows in scene.segment_rows():
+        gaps = np.full(len(rows), np.nan)
+        x = np.column_stack((rows[:, 0], rows[:, 1], gaps)).ravel()
+        y = np.column_stack((rows[:, 2], rows[:, 3], gaps)).ravel()
+        traces.append(go.Scatter(x=x, y=y, mode='lines', line=dict(color="Black", width=width), hoverinfo='skip', connectgaps=False))
+    return traces
+
+
+def text_trace(scene):
+    return go.Scatter(x=[label.x for label in scene.labels], y=[label.y for label in scene.labels],
+                      text=[label.text for label in scene.labels], mode="text", hoverinfo='skip')
+
+
+def draw_circle(circle):
+    shape = dict(
+            type="circle",
+            xref="x",
+            yref="y",
+            x0=circle.x-circle.radius,
+            y0=circle.y-circle.radius,
+            x1=circle.x+circle.radius,
+            y1=circle.y+circle.radius,
+            line_color="Black",
+            )
+    if circle.fill is not None:
+        #a pixel grid too dense to draw, see draw_pixels in geometry.py
+        shape.update(fillcolor="rgba(0,0,0,{:.3f})".format(circle.fill), layer="below")
+    return shape
+
+
+def new_figure(title, axis_size):
+    figure = go.Figure()
+    figure.update_layout(title=dict(text=title, x=0.5, font=dict(color="Black", size=24)), plot_bgcolor='white', xaxis=dict(visible=False), yaxis=dict(visible=False), width=600, height=600, showlegend=False) #look of the graph
+    figure.update_xaxes(range=[-axis_size, axis_size], zeroline=False)
+    figure.update_yaxes(range=[-axis_size, axis_size])
+    return figure
+
+
+def compile_figure(scene):
+    figure = new_figure(scene.title, scene.axis_size)
+    if scene.circles:
+        figure.update_layout(shapes=[draw_circle(circle) for circle in scene.circles])
+    #polylines go first so they keep the first colour of the colorway
+    figure.add_traces([go.Scatter(x=polyline.x, y=polyline.y, mode='lines') for polyline in scene.polylines])
+    figure.add_traces(line_traces(scene))
+    if scene.labels:
+        figure.add_trace(text_trace(scene))
+    return figure
+
+
+@FIGURE_BUILD.time(view='top')
+def build_top_figure(profile, window=None):
+    return compile_figure(top_scene(profile, window))
+
+
+@lru_cache(maxsize=256)
+@FIGURE_BUILD.time(view='side')
+def build_side_figure(profile):
+    return compile_figure(side_scene(profile))
+
+
+
+"""Viewer motion"""
+
+#The moving parts of motion.py as traces on top of the usual figures drawn
+#without the head. Plotly applies a frame only to the traces it lists, so every
+#frame carries the x and y of just the traces that changed since the frame
+#before: the head moves every frame, the pixels only when an eye crosses into
+#another view. The first frame lists everything, so a loop starts over
+#cleanly; frames have to be played in order, which is why there is a play
+#button and no slider.
+
+FRAME_MS = 1000 / 30
+
+MOTION_COLORS = dict(pixels="rgba(214,39,40,0.5)", sight="rgb(214,39,40)")
+
+
+def delta_frames(first_trace, columns):
+    #columns holds (x, y) arrays of shape (frames, points) for the traces first_trace, first_trace + 1, ...
+    changed = []
+    for x, y in columns:
+        same = ((x[1:] == x[:-1]) | (np.isnan(x[1:]) & np.isnan(x[:-1]))).all(axis=1) & \
+               ((y[1:] == y[:-1]) | (np.isnan(y[1:]) & np.isnan(y[:-1]))).all(axis=1)
+        changed.append(np.concatenate([[True], ~same]))
+
+    frames = []
+    for index in range(len(columns[0][0])):
+        moving = [offset for offset in range(len(columns)) if changed[offset][index]]
+        frames.append(dict(
+            name=str(index),
+            data=[dict(x=columns[offset][0][index], y=columns[offset][1][index]) for offset in moving],
+            traces=[first_trace + offset for offset in moving],
+        ))
+    return frames
+
+
+def play_buttons(frame_ms=FRAME_MS):
+    return [dict(type='buttons', showactive=False, x=0.05, y=0, xanchor='left', yanchor='top', direction='left', buttons=[
+        dict(label='Play', method='animate',
+             args=[None, dict(frame=dict(duration=frame_ms, redraw=False), transition=dict(duration=0), fromcurrent=True, mode='immediate')]),
+        dict(label='Pause', method='animate',
+             args=[[None], dict(frame=dict(duration=0, redraw=False), transition=dict(duration=0), mode='immediate')]),
+    ])]
+
+
+def animate(figure, moving, frame_ms=FRAME_MS):
+    #moving is [(x, y, trace attributes)], drawn from their first frame and then animated;
+    #returns a figure dict, as go.Figure would validate every frame one by one
+    first_trace = len(figure.data)
+    for x, y, attributes in moving:
+        figure.add_trace(go.Scatter(x=x[0], y=y[0], hoverinfo='skip', **attributes))
+    figure.update_layout(updatemenus=play_buttons(frame_ms))
+    figure = figure.to_dict()
+    figure['frames'] = delta_frames(first_trace, [(x, y) for x, y, attributes in moving])
+    return figure
+
+
+@disk_cache.memoize('figure.motion', 'json')
+@FIGURE_BUILD.time(view='motion')
+def build_motion_figures(profile, frames=motion.FRAMES, lateral=None, depth=None, frame_ms=FRAME_MS):
+    #top and side view of a viewer moving along motion.head_path
+    moving = motion.frame_geometry(profile, *motion.head_path(profile, frames, lateral, depth))
+
+    top = animate(compile_figure(top_scene(profile, head=False)), [
+        (moving['pixels_x'], moving['pixels_y'], dict(mode='lines', fill='toself', fillcolor=MOTION_COLORS['pixels'], line=dict(width=0))),
+        (moving['sight_x'], moving['sight_y'], dict(mode='lines', line=dict(color=MOTION_COLORS['sight'], width=1))),
+        (moving['top_head_x'], moving['top_head_y'], dict(mode='lines', line=dict(color="Black", width=1))),
+    ], frame_ms)
+    side = animate(compile_figure(side_scene(profile, head=False)), [
+        (moving['side_head_x'], moving['side_head_y'], dict(mode='lines', line=dict(color="Black", width=1))),
+    ], frame_ms)
+    return top, side
+
+
+
+"""Sensitivity"""
+
+#A tornado chart per metric of sensitivity.py: how many % the metric moves when
+#one parameter at a time goes step down and up, the parameter it reacts to most
+#on top. Parameters a metric does not depend on get no bar.
+
+SENSITIVITY_LABELS = dict(
+    pixel_pitch="Pixel Pitch",
+    hogel_diameter="Hogel Diameter",
+    view_distance="View Distance",
+    angular_resolution="Angular Resolution",
+    lossless_depth="Lossless Projection Depth",
+    view_zone_width="View Zone Width",
+)
+
+SWING_COLORS = ("rgb(31,119,180)", "rgb(255,127,14)") #step down, step up
+
+
+@FIGURE_BUILD.time(view='tornado')
+def build_tornado_figure(pixel_pitch, hogel_diameter, view_distance, view_angle, step=sensitivity.STEP):
+    #view_distance may be None, as for a preset without one
+    view_distance = np.nan if view_distance is None else view_distance
+    swings = sensitivity.swings(pixel_pitch, hogel_diameter, view_distance, view_angle, step)[0]
+
+    figure = make_subplots(rows=len(sensitivity.METRICS), cols=1, shared_xaxes=True, vertical_spacing=0.08,
+                           subplot_titles=[SENSITIVITY_LABELS[name] for name in sensitivity.METRICS])
+    for row, metric in enumerate(sensitivity.METRICS):
+        changes = swings[row]
+        shown = [index for index in np.argsort(np.abs(changes).max(axis=1), kind='stable')
+                 if np.isfinite(changes[index]).all() and np.abs(changes[index]).max() > 0]
+        labels = [SENSITIVITY_LABELS[sensitivity.PARAMETERS[index]] for index in shown]
+        for side, (name, color) in enumerate(zip(("-{:g}%".format(100 * step), "+{:g}%".format(100 * step)), SWING_COLORS)):
+            figure.add_trace(go.Bar(
+                x=[changes[index, side] for index in shown], y=labels, orientation='h', name=name,
+                marker=dict(color=color), legendgroup=name, showlegend=row == 0,
+                hovertemplate="%{y}: %{x:+.2f}%<extra>" + name + "</extra>",
+            ), row=row + 1, col=1)
+
+    figure.update_layout(title=dict(text='Sensitivity', x=0.5, font=dict(color="Black", size=24)), plot_bgcolor='white', width=450, height=600,
+                         barmode='overlay', legend=dict(orientation='h', x=0.5, xanchor='center', y=-0.08))
+    figure.update_xaxes(zeroline=True, zerolinecolor="Black", gridcolor="lightgrey", ticksuffix='%')
+    return figure
+
+
+
+"""Coming Soon"""
+
+def build_placeholder_figures(profile):
+    figure_top = go.Figure()
+    figure_top.update_layout(title=dict(text='Coming Soon!', x=1, font=dict(color="red", size=48)), plot_bgcolor='white', xaxis=dict(visible=False), yaxis=dict(visible=False), width=600, height=600, showlegend=False) #look of the graph
+    figure_top.update_xaxes(range=[0, 0], zeroline=False)
+    figure_top.update_yaxes(range=[0, 0])
+
+    figure_side = go.Figure()
+    figure_side.update_layout(title=dict(text='', x=0.5, font=dict(color="Black", size=24)), plot_bgcolor='white', xaxis=dict(visible=False), yaxis=dict(visible=False), width=600, height=600, showlegend=False) #look of the graph
+    figure_side.update_xaxes(range=[0, 0], zeroline=False)
+    figure_side.update_yaxes(range=[0, 0])
+
+    return figure_top, figure_side
+
+
+
+#figures are only built the first time a profile is shown, then reused
+@lru_cache(maxsize=None)
+def get_figures(key):
+    profile = get_profile(key)
+    if not is_drawable(profile):
+        return build_placeholder_figures(profile)
+    return build_top_figure(profile), build_side_figure(profile)
+
+
+
+"""Cached on disk"""
+
+#Custom views as figure dicts, read from the disk cache (disk_cache.py) when
+#they were built before, by this process or another one. Zoomed top views are
+#one-offs that would push the entries worth keeping out of the cache, so they
+#are built in the process, where pixel_grid_part keeps the recent grids.
+
+@disk_cache.memoize('figure.top', 'json')
+def whole_top_figure_json(profile):
+    return build_top_figure(profile).to_plotly_json()
+
+
+def top_figure_json(profile, window=None):
+    if window is None:
+        return whole_top_figure_json(profile)
+    return build_top_figure(profile, window).to_plotly_json()
+
+
+@disk_cache.memoize('figure.side', 'json')
+def side_figure_json(profile):
+    return build_side_figure(profile).to_plotly_json()
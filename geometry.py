@@ -0,0 +1,365 @@
+"""Geometry"""
+
+#Scenes of the top and side views as a few compact primitives, without Plotly.
+#figures.py turns a scene into a Plotly figure and svg_export.py into an SVG
+#file; anything else that wants the drawings (tests, animations, other
+#backends) can walk the same scene.
+#
+#Line segments are kept as (n, 4) arrays of (x_0, x_1, y_0, y_1) rows per line
+#width, so a hogel with a thousand pixel lines is still one primitive. Scenes
+#are assembled from memoized parts and only hold references to them, so a scene
+#for a display that was drawn before costs a few list appends.
+
+import math
+from functools import lru_cache
+
+import numpy as np
+
+import core
+
+
+#variables for calulations
+HEAD_RADIUS = 90 #radius in mm of an average human head
+BODY_HEIGHT = 1646 #average human body height in mm
+
+
+
+"""Primitives"""
+
+class Segments(object):
+    __slots__ = ('rows', 'width')
+
+    def __init__(self, rows, width=1):
+        self.rows = rows #(n, 4) float array of x_0, x_1, y_0, y_1
+        self.width = width
+
+
+class Circle(object):
+    __slots__ = ('x', 'y', 'radius', 'fill')
+
+    def __init__(self, x, y, radius, fill=None):
+        self.x = x
+        self.y = y
+        self.radius = radius
+        self.fill = fill #opacity of a black fill, None for just the outline
+
+
+class Polyline(object):
+    #drawn in colour, like the view angle arc
+    __slots__ = ('x', 'y')
+
+    def __init__(self, x, y):
+        self.x = x
+        self.y = y
+
+
+class Label(object):
+    __slots__ = ('x', 'y', 'text')
+
+    def __init__(self, x, y, text):
+        self.x = x
+        self.y = y
+        self.text = text
+
+
+class Scene(object):
+    __slots__ = ('title', 'axis_size', 'segments', 'circles', 'polylines', 'labels')
+
+    def __init__(self, title=None, axis_size=None):
+        self.title = title
+        self.axis_size = axis_size #the view spans [-axis_size, axis_size] in x and y
+        self.segments = []
+        self.circles = []
+        self.polylines = []
+        self.labels = []
+
+    def add_line(self, x_0, x_1, y_0, y_1, width=1):
+        self.segments.append(Segments(np.array([[x_0, x_1, y_0, y_1]], dtype=float), width))
+
+    def add_lines(self, x_0, x_1, y_0, y_1, width=1):
+        rows = np.column_stack(np.broadcast_arrays(
+            np.asarray(x_0, dtype=float), np.asarray(x_1, dtype=float),
+            np.asarray(y_0, dtype=float), np.asarray(y_1, dtype=float)))
+        self.segments.append(Segments(rows, width))
+
+    def add_circle(self, x, y, radius, fill=None):
+        self.circles.append(Circle(x, y, radius, fill))
+
+    def add_polyline(self, x, y):
+        self.polylines.append(Polyline(x, y))
+
+    def add_label(self, x, y, text):
+        self.labels.append(Label(x, y, text))
+
+    def extend(self, other):
+        #parts are shared between scenes (see the lru_caches below), so only references are copied
+        self.segments.extend(other.segments)
+        self.circles.extend(other.circles)
+        self.polylines.extend(other.polylines)
+        self.labels.extend(other.labels)
+        return self
+
+    def segment_rows(self):
+        #[(width, (n, 4) array)] with all segments of a width joined, thinnest first
+        by_width = {}
+        for segments in self.segments:
+            by_width.setdefault(segments.width, []).append(segments.rows)
+        return [(width, np.concatenate(parts)) for width, parts in sorted(by_width.items())]
+
+
+
+"""Tessellation"""
+
+#Curves are drawn as polylines with as few points as keep them within
+#TOLERANCE_PX of the true curve on screen. A chord spanning the angle a of a
+#circle of radius r strays r * (1 - cos(a/2)) from it, so the angle per segment
+#follows from the radius and the tolerance in data units, which in turn follows
+#from how much of the figure the axis range covers. Tessellations are memoized
+#on their parameters and shared, so their arrays are read-only.
+
+SCREEN_SIZE = 440 #pixels across the plotted area of a 600 px figure
+TOLERANCE_PX = 0.1 #small enough to stay smooth when zoomed in a few times
+MIN_SEGMENTS = 4
+MAX_SEGMENTS = 4096
+
+
+def screen_tolerance(axis_size, tolerance_px=TOLERANCE_PX):
+    #data units covered by tolerance_px when [-axis_size, axis_size] spans the screen
+    return tolerance_px * 2 * axis_size / SCREEN_SIZE
+
+
+def arc_segments(radius, sweep, tolerance):
+    if radius <= tolerance:
+        return MIN_SEGMENTS
+    step = 2 * math.acos(1 - tolerance / radius)
+    return int(min(max(math.ceil(abs(sweep) / step), MIN_SEGMENTS), MAX_SEGMENTS))
+
+
+@lru_cache(maxsize=1024)
+def arc_points(x, y, radius, start_angle, end_angle, tolerance):
+    #(x, y) arrays along the arc around (x, y), angles in radians counterclockwise from the +x axis
+    angles = np.linspace(start_angle, end_angle, arc_segments(radius, end_angle - start_angle, tolerance) + 1)
+    arc_x = x + radius * np.cos(angles)
+    arc_y = y + radius * np.sin(angles)
+    arc_x.setflags(write=False)
+    arc_y.setflags(write=False)
+    return arc_x, arc_y
+
+
+def circle_points(x, y, radius, tolerance):
+    return arc_points(x, y, radius, 0.0, 2 * math.pi, tolerance)
+
+
+
+"""Graph variables"""
+
+def graph_variables(profile):
+    hogel_circle_diameter = core.hogel_circle_diameter(profile.view_distance)  #controls the size of the circle that represents one hogel
+    hogel_circle_radius = hogel_circle_diameter/2
+    pixel_radius_ratio = core.pixel_radius_ratio(profile.view_distance, profile.pixel_pitch, profile.hogel_diameter) #pixel pitch proportional to circle diameter
+
+    return dict(
+        hor_view_angel=math.radians(profile.hor_view_angle), #horizontal view angle in radians
+        hogel_circle_diameter=hogel_circle_diameter,
+        hogel_circle_radius=hogel_circle_radius,
+        pixel_radius_ratio=pixel_radius_ratio,
+        head_xpos=-profile.view_distance,
+        head_ypos=profile.display_width/2,
+        hogel_xpos=profile.view_distance,
+        hogel_ypos=profile.display_width/2,
+        axis_size=profile.axis_size if profile.axis_size is not None else profile.view_distance * 1.5,
+    )
+
+
+"""Pixel grid"""
+
+#A hogel is hogel_diameter / pixel_pitch pixels across, and drawing every pixel
+#line stops being useful long before that number stops growing. Up to
+#LOD_MAX_LINES lines per direction inside the visible window are drawn; beyond
+#that the grid becomes a disc shaded as dark as the lines would make it on
+#screen. Zooming in narrows the window, and once few enough lines are in view
+#they are drawn again, so what is sent stays bounded for any pixel pitch.
+
+LOD_MAX_LINES = 150 #per direction
+LINE_WIDTH_PX = 1
+
+
+def full_window(axis_size):
+    return (-axis_size, axis_size, -axis_size, axis_size)
+
+
+def grid_indices(low, high, hogel_pos, hogel_circle_radius, pixel_radius_ratio, num_pixel_lines):
+    #first and last k in 1..num_pixel_lines whose line at hogel_pos - radius + k * pitch lies in [low, high]
+    first = max(1, math.ceil((low - hogel_pos + hogel_circle_radius) / pixel_radius_ratio))
+    last = min(num_pixel_lines, math.floor((high - hogel_pos + hogel_circle_radius) / pixel_radius_ratio))
+    return first, last
+
+
+def draw_pixels(scene, hogel_xpos, hogel_ypos, hogel_circle_radius, pixel_radius_ratio, window):
+    #vertical and horizontal pixel lines clipped to the hogel circle, one "pixel" in from the edge
+    num_pixel_lines = int(2 * hogel_circle_radius / pixel_radius_ratio)
+    x_min, x_max, y_min, y_max = window
+    x_first, x_last = grid_indices(x_min, x_max, hogel_xpos, hogel_circle_radius, pixel_radius_ratio, num_pixel_lines)
+    y_first, y_last = grid_indices(y_min, y_max, hogel_ypos, hogel_circle_radius, pixel_radius_ratio, num_pixel_lines)
+
+    if max(x_last - x_first, y_last - y_first) + 1 > LOD_MAX_LINES:
+        #the share of the screen the lines of both directions would cover
+        coverage = min(1.0, LINE_WIDTH_PX * (x_max - x_min) / (pixel_radius_ratio * SCREEN_SIZE))
+        scene.add_circle(hogel_xpos, hogel_ypos, hogel_circle_radius, fill=1 - (1 - coverage)**2)
+        return
+
+    offsets = pixel_radius_ratio * np.arange(x_first, x_last + 1) - hogel_circle_radius
+    half_chords = np.sqrt(np.maximum(hogel_circle_radius**2 - offsets**2, 0))
+    visible = (hogel_ypos - half_chords <= y_max) & (hogel_ypos + half_chords >= y_min)
+    scene.add_lines(hogel_xpos + offsets[visible], hogel_xpos + offsets[visible],
+                    hogel_ypos - half_chords[visible], hogel_ypos + half_chords[visible])
+
+    offsets = pixel_radius_ratio * np.arange(y_first, y_last + 1) - hogel_circle_radius
+    half_chords = np.sqrt(np.maximum(hogel_circle_radius**2 - offsets**2, 0))
+    visible = (hogel_xpos - half_chords <= x_max) & (hogel_xpos + half_chords >= x_min)
+    scene.add_lines(hogel_xpos - half_chords[visible], hogel_xpos + half_chords[visible],
+                    hogel_ypos + offsets[visible], hogel_ypos + offsets[visible])
+
+
+
+"""Top View"""
+
+#The top view is assembled from parts that each depend on as few display
+#parameters as possible and are memoized on them. Changing the pixel pitch of a
+#custom display only rebuilds pixel_part, the head, screen and labels are reused.
+
+@lru_cache(maxsize=256)
+def head_part(head_xpos, head_ypos, body=False):
+    #its own part so animations (motion.py) can draw the rest of a view without it
+    scene = Scene()
+    scene.add_circle(head_xpos, head_ypos, HEAD_RADIUS)
+    if body:
+        scene.add_line(head_xpos, head_xpos, head_ypos - HEAD_RADIUS, head_ypos - HEAD_RADIUS - BODY_HEIGHT)
+    return scene
+
+
+@lru_cache(maxsize=256)
+def top_frame_part(view_distance, display_width):
+    hogel_circle_radius = core.hogel_circle_diameter(view_distance) / 2
+    hogel_xpos, hogel_ypos = view_distance, display_width/2
+    hogel_bottom = hogel_ypos - hogel_circle_radius
+    scene = Scene()
+
+    #making the hogel circle, the head is head_part
+    scene.add_circle(hogel_xpos, hogel_ypos, hogel_circle_radius)
+
+    #making the screen
+    scene.add_line(0, 0, 0, display_width, width=3)
+
+    #top and bottom hogel line
+    scene.add_line(0, hogel_xpos - hogel_circle_radius/2, 0.75*display_width, hogel_ypos + math.sqrt(3) * hogel_circle_radius/2)
+    scene.add_line(0, hogel_xpos - hogel_circle_radius/2, 0.75*display_width, hogel_ypos - math.sqrt(3) * hogel_circle_radius/2)
+
+    #hogel label: left and right lines, connecting line and the line sticking out of it
+    scene.add_line(hogel_xpos - hogel_circle_radius, hogel_xpos - hogel_circle_radius, hogel_bottom, hogel_bottom - (1/4) * hogel_circle_radius)
+    scene.add_line(hogel_xpos + hogel_circle_radius, hogel_xpos + hogel_circle_radius, hogel_bottom, hogel_bottom - (1/4) * hogel_circle_radius)
+    scene.add_line(hogel_xpos - hogel_circle_radius, hogel_xpos + hogel_circle_radius, hogel_bottom - (1/4) * hogel_circle_radius, hogel_bottom - (1/4) * hogel_circle_radius)
+    scene.add_line(hogel_xpos, hogel_xpos, hogel_bottom - (1/4) * hogel_circle_radius, hogel_bottom - (1/2) * hogel_circle_radius)
+
+    #text for the hogel label
+    scene.add_label(hogel_xpos, hogel_bottom - (0.6) * hogel_circle_radius, "Diameter of Hogel")
+
+    return scene
+
+
+@lru_cache(maxsize=256)
+def view_angle_part(view_distance, display_width, hor_view_angle, axis_size):
+    hor_view_angel = math.radians(hor_view_angle) #horizontal view angle in radians
+    arc_radius = view_distance/2
+    scene = Scene()
+
+    #top and bottom viewing angle line
+    scene.add_line(0, -view_distance, display_width/2, view_distance*math.tan(hor_view_angel) + display_width/2)
+    scene.add_line(0, -view_distance, display_width/2, view_distance*math.tan(-hor_view_angel) + display_width/2)
+
+    #the arc between the viewing angles, halfway to the viewer, and the theta next to it
+    scene.add_polyline(*arc_points(0.0, display_width/2, arc_radius, math.pi - hor_view_angel, math.pi + hor_view_angel, screen_tolerance(axis_size)))
+    scene.add_label(-(arc_radius + view_distance/16), display_width/2, "\u03B8")
+
+    return scene
+
+
+@lru_cache(maxsize=256)
+def pixel_part(view_distance, display_width, pixel_radius_ratio):
+    hogel_circle_radius = core.hogel_circle_diameter(view_distance) / 2
+    hogel_xpos, hogel_ypos = view_distance, display_width/2
+    hogel_left = hogel_xpos - hogel_circle_radius
+    hogel_top = hogel_ypos + hogel_circle_radius
+    scene = Scene()
+
+    #pixel label: left line, right line, connecting line and the line sticking out of it
+    scene.add_line(pixel_radius_ratio + hogel_left, pixel_radius_ratio + hogel_left, hogel_top + (1/16) * hogel_circle_radius, hogel_top + (1/8) * hogel_circle_radius)
+    scene.add_line(2 * pixel_radius_ratio + hogel_left, 2 * pixel_radius_ratio + hogel_left, hogel_top + (1/16) * hogel_circle_radius, hogel_top + (1/8) * hogel_circle_radius)
+    scene.add_line(pixel_radius_ratio + hogel_left, 2 * pixel_radius_ratio + hogel_left, hogel_top + (1/8) * hogel_circle_radius, hogel_top + (1/8) * hogel_circle_radius)
+    scene.add_line(1.5 * pixel_radius_ratio + hogel_left, 1.5 * pixel_radius_ratio + hogel_left, hogel_top + (1/8) * hogel_circle_radius, hogel_top + (1/4) * hogel_circle_radius)
+
+    #text for the pixel label
+    scene.add_label(1.5 * pixel_radius_ratio + hogel_left, hogel_ypos + 1.35 * hogel_circle_radius, "Pixel Pitch")
+
+    return scene
+
+
+@lru_cache(maxsize=256)
+def pixel_grid_part(view_distance, display_width, pixel_radius_ratio, window):
+    scene = Scene()
+    #Drawing the lines for represent the pixels in the hogel circle
+    draw_pixels(scene, view_distance, display_width/2, core.hogel_circle_diameter(view_distance) / 2, pixel_radius_ratio, window)
+    return scene
+
+
+def top_view_parts(profile, window=None, head=True):
+    #window is the visible (x_min, x_max, y_min, y_max), None for the whole figure
+    g = graph_variables(profile)
+    parts = [head_part(g['head_xpos'], g['head_ypos'])] if head else []
+    return parts + [
+        top_frame_part(profile.view_distance, profile.display_width),
+        view_angle_part(profile.view_distance, profile.display_width, profile.hor_view_angle, g['axis_size']),
+        pixel_part(profile.view_distance, profile.display_width, g['pixel_radius_ratio']),
+        pixel_grid_part(profile.view_distance, profile.display_width, g['pixel_radius_ratio'], window or full_window(g['axis_size'])),
+    ]
+
+
+def top_scene(profile, window=None, head=True):
+    scene = Scene('Top View', graph_variables(profile)['axis_size'])
+    for part in top_view_parts(profile, window, head):
+        scene.extend(part)
+    return scene
+
+
+
+"""Side View"""
+
+@lru_cache(maxsize=256)
+def side_scene(profile, head=True):
+    g = graph_variables(profile)
+    head_xpos, head_ypos = g['head_xpos'], g['head_ypos']
+    display_height = profile.display_height
+    label_offset = profile.side_label_offset if profile.side_label_offset is not None else 1.25 * HEAD_RADIUS
+    label_step = profile.side_label_step if profile.side_label_step is not None else 0.25 * HEAD_RADIUS
+
+    scene = Scene('Side View', g['axis_size'])
+
+    #drawing the head and the body line
+    if head:
+        scene.extend(head_part(head_xpos, head_ypos, body=True))
+
+    #drawing the display line
+    scene.add_line(0, 0, -display_height/2, display_height/2, width=3)
+
+    #Drawing view distance representation
+    label_bottom = display_height/2 + label_offset
+    label_middle = label_bottom + label_step
+    label_top = label_middle + label_step
+    scene.add_line(head_xpos, head_xpos, label_bottom, label_middle)
+    scene.add_line(0, 0, label_bottom, label_middle)
+    scene.add_line(head_xpos, 0, label_middle, label_middle)
+    scene.add_line(head_xpos/2, head_xpos/2, label_middle, label_top)
+
+    scene.add_label(head_xpos/2, label_top + label_step, "View Distance")
+
+    return scene
@@ -0,0 +1,28 @@
+"""gunicorn settings"""
+
+#    gunicorn -c gunicorn.conf.py wsgi:server
+#    WEB_CONCURRENCY=16 gunicorn -c gunicorn.conf.py -b 0.0.0.0:80 wsgi:server
+#
+#Command line options override these, see benchmarks.py --serve for how the
+#worker count was measured.
+
+import gc
+import multiprocessing
+import os
+
+
+bind = os.environ.get('BIND', '127.0.0.1:8050')
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+
+#build the figures and payloads in the master (see wsgi.py), workers inherit them
+preload_app = True
+
+#a sweep of up to sweep_page.MAX_DESIGNS designs runs inside the request
+timeout = 120
+
+
+def pre_fork(server, worker):
+    #everything built so far lives as long as the process; moving it out of the
+    #garbage collector's generations keeps collections in the workers from
+    #touching, and so copying, the shared pages
+    gc.freeze()
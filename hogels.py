@@ -0,0 +1,175 @@
+"""Hogel array"""
+
+#Per-hogel quantities across a whole panel instead of the one magnified hogel of
+#the top view. A display_width x display_height panel holds a grid of hogels
+#hogel_diameter apart (1800 x 1012 of them for the home cinema); for a viewer
+#at a point in front of it every hogel gets its position, its distance to the
+#viewer and the horizontal and vertical angle of the viewer off the hogel's
+#normal, and whether the viewer is inside the hogel's fan of views.
+#
+#Coordinates are in mm with the origin at the centre of the panel: x along the
+#width, y up and z out of the panel towards the viewer. Every hogel sends its
+#views_per_hogel rays over the same fan of view_angle degrees around the
+#normal (view_directions), so the fan is stored once and not per hogel: as
+#fan.npy next to the per-hogel arrays and as the summary's 'fan'.
+#
+#Hogels are evaluated a block of rows at a time, so memory stays bounded by
+#chunk_size however large the panel is:
+#
+#    grid = hogel_grid(1440, 810, 0.8)
+#    summary = sweep.summarize(iter_chunks(grid, 61.9, viewer=(0, 0, 2743.2)))
+#    fan = view_directions(0.047, 0.8, 61.9)
+#    summary = write_npy('hc-hogels', grid, 61.9, viewer=(0, 0, 2743.2), fan=fan)   #and one memory-mapped .npy per quantity
+
+import argparse
+import os
+from collections import namedtuple
+
+import numpy as np
+
+import core
+import sweep
+from profiles import PROFILES, is_drawable
+
+
+QUANTITIES = ('x', 'y', 'distance', 'horizontal_angle', 'vertical_angle', 'in_fan')
+
+DEFAULT_CHUNK_SIZE = 1 << 20 #hogels per chunk
+
+
+HogelGrid = namedtuple('HogelGrid', ['columns', 'rows', 'hogel_diameter'])
+
+COUNT_TOLERANCE = 1e-9 #relative, so 1440 / 0.8 counts 1800 hogels although 1440 // 0.8 == 1799.0
+
+
+def whole_count(length, size):
+    #how many whole size fit into length, without losing one to binary rounding
+    return int(np.floor(length / size * (1 + COUNT_TOLERANCE)))
+
+
+def hogel_grid(display_width, display_height, hogel_diameter):
+    #as many whole hogels as fit, centred on the panel
+    return HogelGrid(whole_count(display_width, hogel_diameter), whole_count(display_height, hogel_diameter), hogel_diameter)
+
+
+def grid_size(grid):
+    return grid.columns * grid.rows
+
+
+def column_positions(grid, dtype=np.float64):
+    #x of every column of hogels
+    return (np.arange(grid.columns, dtype=dtype) - (grid.columns - 1) / 2) * grid.hogel_diameter
+
+
+def row_positions(grid, row_start=0, row_stop=None, dtype=np.float64):
+    #y of every row of hogels in [row_start, row_stop)
+    row_stop = grid.rows if row_stop is None else row_stop
+    return (np.arange(row_start, row_stop, dtype=dtype) - (grid.rows - 1) / 2) * grid.hogel_diameter
+
+
+def hogel_centers(grid, row_start, row_stop, dtype=np.float64):
+    #x and y of every hogel in rows [row_start, row_stop), row after row, as flat arrays
+    x, y = column_positions(grid, dtype), row_positions(grid, row_start, row_stop, dtype)
+    return np.tile(x, row_stop - row_start), np.repeat(y, grid.columns)
+
+
+def view_directions(pixel_pitch, hogel_diameter, view_angle):
+    #angle off the normal in degrees of the centre of every view in a hogel's fan
+    views = whole_count(hogel_diameter, pixel_pitch)
+    step = core.view_angle_per_view(pixel_pitch, hogel_diameter, view_angle)
+    return (np.arange(views) + 0.5) * step - view_angle / 2
+
+
+
+"""Evaluation"""
+
+def evaluate(grid, view_angle, viewer, row_start=0, row_stop=None, dtype=np.float64):
+    #every quantity for the hogels in rows [row_start, row_stop) as a dict of flat arrays
+    row_stop = grid.rows if row_stop is None else row_stop
+    x, y = hogel_centers(grid, row_start, row_stop, dtype)
+    viewer_x, viewer_y, viewer_z = [np.asarray(value, dtype=dtype) for value in viewer]
+
+    dx, dy = viewer_x - x, viewer_y - y
+    horizontal_angle = np.degrees(np.arctan2(dx, viewer_z))
+    vertical_angle = np.degrees(np.arctan2(dy, viewer_z))
+    half_angle = view_angle / 2
+
+    return dict(
+        x=x,
+        y=y,
+        distance=np.sqrt(dx*dx + dy*dy + viewer_z*viewer_z),
+        horizontal_angle=horizontal_angle,
+        vertical_angle=vertical_angle,
+        in_fan=((np.abs(horizontal_angle) <= half_angle) & (np.abs(vertical_angle) <= half_angle)).astype(dtype),
+    )
+
+
+def iter_chunks(grid, view_angle, viewer, chunk_size=DEFAULT_CHUNK_SIZE, dtype=np.float64):
+    #whole rows per chunk, at least one
+    rows_per_chunk = max(1, chunk_size // max(grid.columns, 1))
+    for row_start in range(0, grid.rows, rows_per_chunk):
+        yield evaluate(grid, view_angle, viewer, row_start, min(row_start + rows_per_chunk, grid.rows), dtype)
+
+
+def write_npy(directory, grid, view_angle, viewer, chunk_size=DEFAULT_CHUNK_SIZE, dtype=np.float64, sample_size=5000, fan=None):
+    #one (rows, columns) .npy file per quantity, filled chunk by chunk through memory maps, and fan.npy
+    #for the view directions fan of every hogel when given; returns sweep.summarize's count, stats and
+    #sample of the hogels, with the fan under 'fan'
+    os.makedirs(directory, exist_ok=True)
+    arrays = dict((name, np.lib.format.open_memmap(os.path.join(directory, name + '.npy'), mode='w+', dtype=dtype, shape=(grid.rows, grid.columns)))
+                  for name in QUANTITIES)
+    flat = dict((name, array.reshape(-1)) for name, array in arrays.items())
+
+    def written_chunks():
+        start = 0
+        for chunk in iter_chunks(grid, view_angle, viewer, chunk_size, dtype):
+            size = len(chunk['x'])
+            for name in QUANTITIES:
+                flat[name][start:start + size] = chunk[name]
+            start += size
+            yield chunk
+
+    summary = sweep.summarize(written_chunks(), sample_size=sample_size)
+    for array in arrays.values():
+        array.flush()
+    if fan is not None:
+        fan = np.asarray(fan, dtype=dtype)
+        np.save(os.path.join(directory, 'fan.npy'), fan)
+        summary['fan'] = fan
+    return summary
+
+
+
+"""Command line"""
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Evaluate every hogel of a preset display for a viewer in front of it.")
+    parser.add_argument('preset', choices=[key for key, profile in PROFILES.items() if is_drawable(profile)])
+    parser.add_argument('-o', '--output-dir', help="write one memory-mapped .npy file per quantity here")
+    parser.add_argument('--viewer', type=float, nargs=3, metavar=('X', 'Y', 'Z'), help="viewer position in mm (default: centred at the view distance)")
+    parser.add_argument('--float32', action='store_true', help="half the memory and file size")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE, help="hogels per chunk")
+    args = parser.parse_args(argv)
+
+    profile = PROFILES[args.preset]
+    grid = hogel_grid(profile.display_width, profile.display_height, profile.hogel_diameter)
+    viewer = tuple(args.viewer) if args.viewer else (0.0, 0.0, profile.view_distance)
+    dtype = np.float32 if args.float32 else np.float64
+
+    fan = view_directions(profile.pixel_pitch, profile.hogel_diameter, profile.view_angle).astype(dtype)
+
+    if args.output_dir:
+        summary = write_npy(args.output_dir, grid, profile.view_angle, viewer, args.chunk_size, dtype, fan=fan)
+    else:
+        summary = sweep.summarize(iter_chunks(grid, profile.view_angle, viewer, args.chunk_size, dtype))
+        summary['fan'] = fan
+
+    print("{} x {} hogels, {} views each from {:.4g} to {:.4g} degrees".format(
+        grid.columns, grid.rows, len(summary['fan']), summary['fan'][0], summary['fan'][-1]))
+    for name in QUANTITIES:
+        stats = summary['stats'][name]
+        print("{:<18} min {:>12.6g}  mean {:>12.6g}  max {:>12.6g}".format(name, stats['min'], stats['mean'], stats['max']))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,212 @@
+"""Metrics"""
+
+#Counters and histograms in the Prometheus text exposition format, served on
+#/metrics by register_metrics. Every Dash callback request is timed and counted
+#per callback (its output ids) and per form_buttons value, with its response
+#size; figures.py times every figure it builds.
+#
+#Recording is a dict lookup, a bisect and an add under a lock, cheap enough to
+#leave on. Only the standard library is imported at module level, so the
+#Plotly layer can time itself without pulling in Flask. Each gunicorn worker
+#keeps its own numbers, as with any per-process Prometheus client.
+
+import bisect
+import threading
+import time
+from functools import wraps
+
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+SIZE_BUCKETS = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+MAX_SERIES = 1000 #label combinations per metric, later ones are counted under "other"
+
+
+
+"""Metric types"""
+
+def escape_label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def format_labels(names, values, extra=()):
+    pairs = list(zip(names, values)) + list(extra)
+    if not pairs:
+        return ''
+    return '{' + ','.join('{}="{}"'.format(name, escape_label(value)) for name, value in pairs) + '}'
+
+
+def format_value(value):
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+class Metric(object):
+    kind = None
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.series = {} #label values -> state
+        self.lock = threading.Lock()
+
+    def key(self, labels):
+        key = tuple(str(labels.get(name, '')) for name in self.labelnames)
+        if key not in self.series and len(self.series) >= MAX_SERIES:
+            return ('other',) * len(self.labelnames)
+        return key
+
+    def expose(self):
+        lines = ['# HELP {} {}'.format(self.name, self.documentation), '# TYPE {} {}'.format(self.name, self.kind)]
+        with self.lock:
+            series = [(key, self.snapshot(state)) for key, state in sorted(self.series.items())]
+        for key, state in series:
+            lines.extend(self.sample_lines(key, state))
+        return lines
+
+
+class Counter(Metric):
+    kind = 'counter'
+
+    def inc(self, amount=1, **labels):
+        with self.lock:
+            key = self.key(labels)
+            self.series[key] = self.series.get(key, 0) + amount
+
+    def snapshot(self, state):
+        return state
+
+    def sample_lines(self, key, value):
+        return ['{}{} {}'.format(self.name, format_labels(self.labelnames, key), format_value(value))]
+
+
+class Histogram(Metric):
+    kind = 'histogram'
+
+    def __init__(self, name, documentation, labelnames=(), buckets=LATENCY_BUCKETS):
+        super(Histogram, self).__init__(name, documentation, labelnames)
+        self.buckets = tuple(buckets)
+
+    def observe(self, value, **labels):
+        index = bisect.bisect_left(self.buckets, value)
+        with self.lock:
+            key = self.key(labels)
+            state = self.series.get(key)
+            if state is None:
+                state = self.series[key] = [[0] * (len(self.buckets) + 1), 0.0]
+            state[0][index] += 1
+            state[1] += value
+
+    def time(self, **labels):
+        #decorator observing the wall time of every call
+        def decorator(function):
+            @wraps(function)
+            def timed(*args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return function(*args, **kwargs)
+                finally:
+                    self.observe(time.perf_counter() - start, **labels)
+            return timed
+        return decorator
+
+    def snapshot(self, state):
+        return list(state[0]), state[1]
+
+    def sample_lines(self, key, state):
+        counts, total = state
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets + (float('inf'),), counts):
+            cumulative += count
+            le = '+Inf' if bound == float('inf') else format_value(bound)
+            lines.append('{}_bucket{} {}'.format(self.name, format_labels(self.labelnames, key, [('le', le)]), cumulative))
+        labels = format_labels(self.labelnames, key)
+        lines.append('{}_sum{} {}'.format(self.name, labels, format_value(total)))
+        lines.append('{}_count{} {}'.format(self.name, labels, cumulative))
+        return lines
+
+
+class Registry(object):
+
+    def __init__(self):
+        self.metrics = []
+
+    def register(self, metric):
+        self.metrics.append(metric)
+        return metric
+
+    def counter(self, name, documentation, labelnames=()):
+        return self.register(Counter(name, documentation, labelnames))
+
+    def histogram(self, name, documentation, labelnames=(), buckets=LATENCY_BUCKETS):
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def expose(self):
+        lines = []
+        for metric in self.metrics:
+            lines.extend(metric.expose())
+        return '\n'.join(lines) + '\n'
+
+
+REGISTRY = Registry()
+
+CALLBACK_LATENCY = REGISTRY.histogram('applet_callback_duration_seconds', "Time to answer a Dash callback request.", ('callback', 'preset'))
+CALLBACK_ERRORS = REGISTRY.counter('applet_callback_errors_total', "Dash callback requests answered with an error status.", ('callback', 'status'))
+CALLBACK_RESPONSE_SIZE = REGISTRY.histogram('applet_callback_response_bytes', "Size of Dash callback responses as sent.", ('callback',), SIZE_BUCKETS)
+FIGURE_BUILD = REGISTRY.histogram('applet_figure_build_seconds', "Time to build a Plotly figure from its scene.", ('view',))
+
+
+
+"""Flask wiring"""
+
+def output_ids(output):
+    #"..top_view_figure.figure...side_view_figure.figure.." -> "top_view_figure,side_view_figure"
+    return ','.join(part.rsplit('.', 1)[0] for part in output.strip('.').split('...'))
+
+
+def preset_value(body, known):
+    for value in body.get('inputs') or []:
+        if isinstance(value, dict) and value.get('id') == 'form_buttons':
+            return value.get('value') if value.get('value') in known else 'other'
+    return ''
+
+
+def register_metrics(app, presets=()):
+    #has to be registered before the ResponseCache, so cached answers are timed too
+    import flask
+
+    server = app.server
+    callback_path = app.config.routes_pathname_prefix + '_dash-update-component'
+    #labels only come from registered callbacks and presets, whatever the request says
+    known_callbacks = set(output_ids(output) for output in app.callback_map)
+    known_presets = set(presets)
+
+    def start_timer():
+        if flask.request.path == callback_path:
+            flask.g.metrics_start = time.perf_counter()
+
+    def record(response):
+        start = flask.g.get('metrics_start')
+        if start is None:
+            return response
+        body = flask.request.get_json(silent=True)
+        body = body if isinstance(body, dict) else {}
+        name = output_ids(str(body.get('output', '')))
+        if name not in known_callbacks:
+            name = 'unknown'
+
+        CALLBACK_LATENCY.observe(time.perf_counter() - start, callback=name, preset=preset_value(body, known_presets))
+        if response.status_code >= 400:
+            CALLBACK_ERRORS.inc(callback=name, status=response.status_code)
+        if not response.direct_passthrough:
+            CALLBACK_RESPONSE_SIZE.observe(response.calculate_content_length() or 0, callback=name)
+        return response
+
+    server.before_request(start_timer)
+    server.after_request(record)
+
+    @server.route('/metrics')
+    def metrics():
+        return flask.Response(REGISTRY.expose(), mimetype='text/plain; version=0.0.4')
+
+    return REGISTRY
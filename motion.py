@@ -0,0 +1,113 @@
+"""Viewer motion"""
+
+#Geometry for animating the viewer: the head sways sideways and moves towards
+#and away from the display while the top view shows the lines of sight from
+#the centre hogel to both eyes and, inside the magnified hogel circle, the
+#pixel each eye sees, and the side view shows the head and body moving in
+#depth. Everything that moves is worked out for every frame in one go as
+#(frames, points) arrays in the coordinates of the top and side views; the
+#rest of the drawing is the usual scene without the head (geometry.py), so a
+#backend only has to draw the frames on top of it (see figures.py).
+#
+#    head_xpos, head_ypos = head_path(PROFILES['HC'])
+#    frames = frame_geometry(PROFILES['HC'], head_xpos, head_ypos)
+#    frames['top_head_x'].shape                     #(300, 8)
+
+import math
+
+import numpy as np
+
+import rays
+from geometry import BODY_HEIGHT, HEAD_RADIUS, arc_segments, graph_variables, screen_tolerance
+
+
+FRAMES = 300 #10 s at 30 frames per second
+TOLERANCE_PX = 0.5 #moving outlines can be coarser than still ones
+DECIMALS = 1 #mm, far below a screen pixel at any preset's scale
+
+
+def head_path(profile, frames=FRAMES, lateral=None, depth=None):
+    #top view head positions swaying lateral mm to both sides twice and moving
+    #depth mm towards and away from the display once; by default far enough
+    #sideways to leave the view zone, as far as the figure shows
+    g = graph_variables(profile)
+    if lateral is None:
+        lateral = min(profile.view_distance * math.tan(g['hor_view_angel']) * 1.2, 0.6 * g['axis_size'])
+    if depth is None:
+        depth = profile.view_distance / 3
+    t = np.arange(frames) / frames
+    head_xpos = g['head_xpos'] + depth * np.sin(2 * np.pi * t)
+    head_ypos = g['head_ypos'] + lateral * np.sin(4 * np.pi * t)
+    return head_xpos, head_ypos
+
+
+def with_gaps(*columns):
+    #(frames, n) arrays side by side with a NaN column between them, so each stays a separate line
+    gap = np.full((len(columns[0]), 1), np.nan)
+    parts = []
+    for column in columns:
+        parts.extend([column, gap])
+    return np.hstack(parts[:-1])
+
+
+def outlines(x, y, radius, tolerance):
+    #(frames, k) points of a circle of radius around every (x, y)
+    angles = np.linspace(0, 2 * np.pi, arc_segments(radius, 2 * np.pi, tolerance) + 1)
+    return x[:, None] + radius * np.cos(angles), y[:, None] + radius * np.sin(angles)
+
+
+def pixel_bands(profile, views):
+    #(frames, 5) outline of the strip of the magnified hogel holding the pixel of
+    #every view index, NaN for NO_VIEW. Behind its lens a pixel lights the opposite
+    #side of the fan, so view 0 (towards low y) is the top strip.
+    g = graph_variables(profile)
+    radius, pitch = g['hogel_circle_radius'], g['pixel_radius_ratio']
+    hogel_xpos, hogel_ypos = g['hogel_xpos'], g['hogel_ypos']
+
+    top = hogel_ypos + radius - views * pitch
+    bottom = np.maximum(top - pitch, hogel_ypos - radius)
+    middle = (top + bottom) / 2
+    half_chord = np.sqrt(np.maximum(radius**2 - (middle - hogel_ypos)**2, 0))
+    x = np.column_stack([-half_chord, half_chord, half_chord, -half_chord, -half_chord]) + hogel_xpos
+    y = np.column_stack([bottom, bottom, top, top, bottom])
+    hidden = (views == rays.NO_VIEW)[:, None]
+    return np.where(hidden, np.nan, x), np.where(hidden, np.nan, y)
+
+
+def frame_geometry(profile, head_xpos, head_ypos, eye_separation=rays.EYE_SEPARATION):
+    #everything that moves, for every frame: top_head, sight, pixels, side_head
+    #as (frames, points) x and y arrays rounded to DECIMALS, and the views seen
+    g = graph_variables(profile)
+    tolerance = screen_tolerance(g['axis_size'], TOLERANCE_PX)
+    head_xpos, head_ypos = np.asarray(head_xpos, dtype=float), np.asarray(head_ypos, dtype=float)
+
+    #both eyes in the panel frame, and the view of the centre hogel each one sees
+    eyes = rays.eye_positions(rays.top_view_heads(profile, head_xpos, head_ypos), eye_separation)
+    views = rays.view_index(eyes[..., 0], eyes[..., 2], profile.pixel_pitch, profile.hogel_diameter, profile.view_angle)
+
+    #lines of sight from the centre of the display to the eyes
+    eye_ypos = eyes[..., 0] + profile.display_width/2
+    screen_x, screen_y = np.zeros_like(head_xpos), np.full_like(head_xpos, profile.display_width/2)
+    sight_x = with_gaps(np.column_stack([head_xpos, screen_x]), np.column_stack([head_xpos, screen_x]))
+    sight_y = with_gaps(np.column_stack([eye_ypos[:, 0], screen_y]), np.column_stack([eye_ypos[:, 1], screen_y]))
+
+    left_x, left_y = pixel_bands(profile, views[:, 0])
+    right_x, right_y = pixel_bands(profile, views[:, 1])
+
+    top_head_x, top_head_y = outlines(head_xpos, head_ypos, HEAD_RADIUS, tolerance)
+
+    #the side view only sees the head move in depth
+    side_ypos = np.full_like(head_xpos, g['head_ypos'])
+    side_head_x, side_head_y = outlines(head_xpos, side_ypos, HEAD_RADIUS, tolerance)
+    body_x = np.column_stack([head_xpos, head_xpos])
+    body_y = np.column_stack([side_ypos - HEAD_RADIUS, side_ypos - HEAD_RADIUS - BODY_HEIGHT])
+
+    frames = dict(
+        top_head_x=top_head_x, top_head_y=top_head_y,
+        sight_x=sight_x, sight_y=sight_y,
+        pixels_x=with_gaps(left_x, right_x), pixels_y=with_gaps(left_y, right_y),
+        side_head_x=with_gaps(side_head_x, body_x), side_head_y=with_gaps(side_head_y, body_y),
+    )
+    frames = dict((name, np.round(value, DECIMALS)) for name, value in frames.items())
+    frames['views'] = views
+    return frames
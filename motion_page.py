@@ -0,0 +1,69 @@
+"""Motion page"""
+
+#Tab of the app that animates a viewer moving in front of a preset display
+#(figures.build_motion_figures): the head sways sideways and moves in depth, and
+#the top view follows the lines of sight and the pixel each eye sees in the
+#magnified hogel.
+
+import dash_core_components as dcc
+import dash_html_components as html
+from dash.dependencies import Input, Output, State
+
+import motion
+from figures import build_motion_figures
+from profiles import PROFILES, DEFAULT_PROFILE, is_drawable
+
+
+MAX_FRAMES = 1000
+
+
+def make_motion_layout():
+    return html.Div(children=[
+        dcc.RadioItems(
+            id='motion-preset',
+            options=[{'label': profile.label, 'value': key} for key, profile in PROFILES.items() if is_drawable(profile)],
+            value=DEFAULT_PROFILE,
+            labelStyle={'display': 'inline-block'},
+        ),
+        html.Table(children=[
+            html.Tbody(children=[
+                html.Tr(children=[
+                    html.Th(scope="row", children=["Sideways (mm, empty for out of the view zone)"]),
+                    html.Td(dcc.Input(id='motion-lateral', type='number', min=0, style={'width': '90px'})),
+                    ]),
+                html.Tr(children=[
+                    html.Th(scope="row", children=["In Depth (mm, empty for a third of the view distance)"]),
+                    html.Td(dcc.Input(id='motion-depth', type='number', min=0, style={'width': '90px'})),
+                    ]),
+                html.Tr(children=[
+                    html.Th(scope="row", children=["Frames"]),
+                    html.Td(dcc.Input(id='motion-frames', type='number', value=motion.FRAMES, min=2, max=MAX_FRAMES, style={'width': '90px'})),
+                    ]),
+                ]),
+            ]),
+        html.Button('Animate', id='motion-run', n_clicks=0),
+        html.Div(id='motion-status'),
+
+        html.Div(children=[
+            html.Div(children=[dcc.Graph(id='motion-top-figure')], style={'display': 'inline-block'}),
+            html.Div(children=[dcc.Graph(id='motion-side-figure')], style={'display': 'inline-block'}),
+        ]),
+    ])
+
+
+def register_motion_callbacks(app):
+
+    @app.callback(
+        [Output('motion-top-figure', 'figure'), Output('motion-side-figure', 'figure'), Output('motion-status', 'children')],
+        [Input('motion-run', 'n_clicks')],
+        [State('motion-preset', 'value'), State('motion-lateral', 'value'), State('motion-depth', 'value'), State('motion-frames', 'value')]
+    )
+    def run_motion(n_clicks, preset, lateral, depth, frames):
+        profile = PROFILES.get(preset)
+        if profile is None or not is_drawable(profile):
+            profile = PROFILES[DEFAULT_PROFILE]
+        if not frames or not 2 <= frames <= MAX_FRAMES:
+            return {}, {}, "Between 2 and {} frames, please.".format(MAX_FRAMES)
+
+        top, side = build_motion_figures(profile, int(frames), lateral, depth)
+        return top, side, "{} frames, each view has its own Play button.".format(int(frames))
@@ -0,0 +1,131 @@
+"""Pareto frontier"""
+
+#The designs of a sweep that no other design beats on every objective at once.
+#By default those are the largest lossless depth and angular resolution for
+#the fewest pixels; a panel of a given size has area / pixel_pitch**2 pixels,
+#so fewest pixels is largest pixel pitch.
+#
+#Designs are sorted so that anything that dominates a design comes before it
+#(descending in the objectives, lexicographically), and then each one only has
+#to be checked against the frontier found so far instead of against every
+#other design. With two objectives that check is a running maximum; with more
+#it is done a block of designs at a time. ParetoFront keeps the frontier of
+#everything it has been given, so chunks from sweep.py can stream through it:
+#
+#    front = ParetoFront()
+#    for chunk in sweep.iter_grid(axes):
+#        front.update(chunk)
+#    front.designs['pixel_pitch']                   #the frontier, every column of the chunks
+
+import numpy as np
+
+
+#(column, 'max' or 'min')
+OBJECTIVES = (('lossless_depth', 'max'), ('angular_resolution', 'max'), ('pixel_pitch', 'max'))
+
+BLOCK_SIZE = 4096 #designs checked against the frontier at once
+
+
+def scores(designs, objectives=OBJECTIVES):
+    #(n, k) array in which larger is better for every objective
+    return np.column_stack([designs[name] if sense == 'max' else -designs[name] for name, sense in objectives]).astype(np.float64)
+
+
+def pareto_mask(points):
+    #True for the rows of points (larger is better) that no other row dominates;
+    #identical rows don't dominate each other, rows with NaN are never on the frontier
+    n = len(points)
+    mask = np.zeros(n, dtype=bool)
+    finite = np.flatnonzero(np.isfinite(points).all(axis=1))
+    if len(finite) == 0:
+        return mask
+
+    #descending lexicographic order, then one representative per group of identical rows
+    order = finite[np.lexsort(-points[finite].T[::-1])]
+    ordered = points[order]
+    first = np.ones(len(order), dtype=bool)
+    first[1:] = (ordered[1:] != ordered[:-1]).any(axis=1)
+    unique = ordered[first]
+
+    if unique.shape[1] == 1:
+        keep = np.zeros(len(unique), dtype=bool)
+        keep[0] = True
+    elif unique.shape[1] == 2:
+        #sorted by the first objective, so a row is dominated exactly when an earlier one is at least as good in the second
+        best_before = np.maximum.accumulate(np.concatenate([[-np.inf], unique[:-1, 1]]))
+        keep = unique[:, 1] > best_before
+    else:
+        keep = block_filter(unique)
+
+    #identical rows share the fate of their representative
+    mask[order] = keep[np.cumsum(first) - 1]
+    return mask
+
+
+def at_least_as_good(points, others):
+    #(len(others), len(points)) True where points[j] is at least as good as others[i] everywhere,
+    #one objective at a time, which is much faster than comparing (n, m, k) arrays
+    result = points[None, :, 0] >= others[:, None, 0]
+    for objective in range(1, points.shape[1]):
+        result &= points[None, :, objective] >= others[:, None, objective]
+    return result
+
+
+def block_filter(unique):
+    #pareto_mask for sorted, distinct rows: a row is dominated when an earlier row is at least as good
+    #everywhere. Dominance is transitive, so the frontier found so far stands in for all earlier rows,
+    #and inside a block only the rows the frontier let through need comparing with each other.
+    keep = np.zeros(len(unique), dtype=bool)
+    front = unique[:0]
+    for start in range(0, len(unique), BLOCK_SIZE):
+        block = unique[start:start + BLOCK_SIZE]
+        candidates = np.arange(len(block))
+        for front_start in range(0, len(front), BLOCK_SIZE):
+            beaten = at_least_as_good(front[front_start:front_start + BLOCK_SIZE], block[candidates]).any(axis=1)
+            candidates = candidates[~beaten]
+        rows = block[candidates]
+        inside = np.tril(at_least_as_good(rows, rows), -1).any(axis=1)
+        candidates = candidates[~inside]
+        keep[start + candidates] = True
+        front = np.concatenate([front, block[candidates]])
+    return keep
+
+
+def dominates(points, others):
+    #(len(others), len(points)) True where points[j] dominates others[i]
+    return at_least_as_good(points, others) & ~at_least_as_good(others, points).T
+
+
+class ParetoFront(object):
+
+    def __init__(self, objectives=OBJECTIVES):
+        self.objectives = tuple(objectives)
+        self.designs = None #dict of equally long arrays, the frontier so far
+        self.count = 0 #designs seen
+
+    def __len__(self):
+        return 0 if self.designs is None else len(self.designs[self.objectives[0][0]])
+
+    def update(self, chunk):
+        #adds a dict of equally long arrays (a sweep chunk) and keeps what is still on the frontier
+        size = len(chunk[self.objectives[0][0]])
+        self.count += size
+        if size == 0:
+            return self
+        merged = chunk if self.designs is None else dict((name, np.concatenate([self.designs[name], chunk[name]])) for name in self.designs)
+        keep = pareto_mask(scores(merged, self.objectives))
+        self.designs = dict((name, values[keep]) for name, values in merged.items())
+        return self
+
+    def dominated_by(self, designs):
+        #how many frontier designs dominate each of the given designs, 0 means it is on the frontier too
+        if self.designs is None:
+            return np.zeros(len(designs[self.objectives[0][0]]), dtype=np.int64)
+        return dominates(scores(self.designs, self.objectives), scores(designs, self.objectives)).sum(axis=1)
+
+
+def frontier(chunks, objectives=OBJECTIVES):
+    front = ParetoFront(objectives)
+    for chunk in chunks:
+        front.update(chunk)
+    return front
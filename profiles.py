@@ -0,0 +1,135 @@
+"""Display profiles"""
+
+#One record per display class. Values come from the excel trade study; anything
+#the study does not have yet is None and shows up as "N/A" in the table.
+#Adding a display class is one more entry in PROFILES, nothing is built until
+#the app asks for it.
+
+from collections import OrderedDict, namedtuple
+
+import core
+
+
+DisplayProfile = namedtuple(
+    'DisplayProfile',
+    [
+        'key',                  #value used by the form_buttons radio items
+        'label',                #label shown next to the radio button
+        'display_height',       #in mm
+        'display_width',        #in mm
+        'view_distance',        #in mm
+        'pixel_pitch',          #in mm
+        'hogel_diameter',       #in mm
+        'lossless_depth',       #in mm
+        'view_angle',           #full view angle in degrees
+        'hor_view_angle',       #horizontal (half) view angle in degrees
+        'angular_resolution',
+        'axis_size',            #half width of the plotted area, None means 1.5 * view_distance
+        'side_label_offset',    #height of the view distance label above the display, None means 1.25 * HEAD_RADIUS
+        'side_label_step',      #spacing of the view distance label lines, None means 0.25 * HEAD_RADIUS
+    ],
+    defaults=(None, None, None),
+)
+
+
+def is_drawable(profile):
+    #profiles without a view distance (table top) only get a placeholder figure
+    return profile.view_distance is not None and profile.display_width is not None
+
+
+PROFILES = OrderedDict((profile.key, profile) for profile in [
+    DisplayProfile(
+        key='T',
+        label='Tablet',
+        display_height=60,
+        display_width=106.7,
+        view_distance=450,
+        pixel_pitch=(27*(10**-3)), #so 27um
+        hogel_diameter=0.07,
+        lossless_depth=0.51,
+        view_angle=32,
+        hor_view_angle=16,
+        angular_resolution=0.06,
+    ),
+    DisplayProfile(
+        key='D',
+        label='Desktop',
+        display_height=330,
+        display_width=586.7,
+        view_distance=800,
+        pixel_pitch=(19*(10**-3)),
+        hogel_diameter=0.23,
+        lossless_depth=5.70,
+        view_angle=57.2,
+        hor_view_angle=28.62,
+        angular_resolution=0.21,
+    ),
+    DisplayProfile(
+        key='SF',
+        label='TableTop',
+        display_height=None,
+        display_width=None,
+        view_distance=None,
+        pixel_pitch=(50*(10**-3)),
+        hogel_diameter=0.5,
+        lossless_depth=6.4,
+        view_angle=90,
+        hor_view_angle=None,
+        angular_resolution=0.111,
+    ),
+    DisplayProfile(
+        key='HC',
+        label='HomeCinema',
+        display_height=810,
+        display_width=1440,
+        view_distance=2743.2,
+        pixel_pitch=(47*(10**-3)),
+        hogel_diameter=0.8,
+        lossless_depth=25.06,
+        view_angle=61.9,
+        hor_view_angle=30.97,
+        angular_resolution=0.27,
+    ),
+    DisplayProfile(
+        key='C',
+        label='Cinema',
+        display_height=12192,
+        display_width=5151,
+        view_distance=3658,
+        pixel_pitch=(50*(10**-3)),
+        hogel_diameter=1.06,
+        lossless_depth=17.53,
+        view_angle=147.9,
+        hor_view_angle=73.94,
+        angular_resolution=0.14,
+        axis_size=12192, #the display is taller than the view distance
+        side_label_offset=0.2 * 12192/2,
+        side_label_step=0.1 * 12192/2,
+    ),
+])
+
+DEFAULT_PROFILE = 'T'
+
+
+def get_profile(key):
+    #unknown values fall back to the default profile, same as the old else branches
+    return PROFILES.get(key, PROFILES[DEFAULT_PROFILE])
+
+
+def custom_profile(display_width, display_height, view_distance, pixel_pitch, hogel_diameter, view_angle, key='custom', label='Custom'):
+    #a profile for display parameters typed into the app or read from a spec file
+    return DisplayProfile(
+        key=key,
+        label=label,
+        display_height=display_height,
+        display_width=display_width,
+        view_distance=view_distance,
+        pixel_pitch=pixel_pitch,
+        hogel_diameter=hogel_diameter,
+        lossless_depth=float(core.lossless_depth(pixel_pitch, hogel_diameter, view_angle)),
+        view_angle=view_angle,
+        hor_view_angle=view_angle/2,
+        angular_resolution=float(core.angular_resolution(pixel_pitch, hogel_diameter, view_angle)),
+        #tall displays need more room than the view distance, like the cinema preset
+        axis_size=display_height if display_height > view_distance * 1.5 else None,
+    )
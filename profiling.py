@@ -0,0 +1,182 @@
+"""Request profiling"""
+
+#Opt-in sampling profiler for callback requests, for finding out where a slow
+#interaction spends its time (Dash serialization, Plotly validation, geometry).
+#It is only installed when APPLET_PROFILE is set:
+#
+#    APPLET_PROFILE=header   profile requests that carry an "X-Profile: 1" header
+#    APPLET_PROFILE=all      profile every callback request
+#
+#A background thread samples the request thread's stack every
+#APPLET_PROFILE_INTERVAL seconds (default 0.005) and the stacks are written to
+#APPLET_PROFILE_DIR (default ./profiles), one file per request, either as
+#collapsed stacks for flamegraph.pl / speedscope (APPLET_PROFILE_FORMAT=collapsed,
+#the default) or as speedscope JSON (speedscope). At most APPLET_PROFILE_RATE
+#requests (default 6) are profiled per minute and process, the others run as
+#usual, so it is safe to turn on for a production worker.
+
+import json
+import os
+import sys
+import threading
+import time
+from collections import Counter
+
+
+PROFILE_HEADER = 'X-Profile'
+FORMATS = ('collapsed', 'speedscope')
+
+
+
+"""Sampling"""
+
+def frame_name(frame):
+    #per function rather than per line, so samples anywhere in a function add up
+    code = frame.f_code
+    return '{} ({}:{})'.format(code.co_name, frame.f_globals.get('__name__', os.path.basename(code.co_filename)), code.co_firstlineno)
+
+
+def stack_of(frame):
+    #outermost call first, like flame graphs draw them
+    names = []
+    while frame is not None:
+        names.append(frame_name(frame))
+        frame = frame.f_back
+    return tuple(reversed(names))
+
+
+class Sampler(object):
+
+    def __init__(self, thread_id, interval):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self.run, name='profile-sampler', daemon=True)
+        self.start_time = self.end_time = None
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is not None:
+                self.stacks[stack_of(frame)] += 1
+
+    def start(self):
+        self.start_time = time.perf_counter()
+        self.thread.start()
+        return self
+
+    def stop(self):
+        if not self.stopped.is_set():
+            self.stopped.set()
+            self.thread.join()
+            self.end_time = time.perf_counter()
+        return self
+
+
+class RateLimiter(object):
+    #at most rate starts in any 60 seconds
+
+    def __init__(self, rate, period=60):
+        self.rate = rate
+        self.period = period
+        self.starts = []
+        self.lock = threading.Lock()
+
+    def allow(self):
+        now = time.monotonic()
+        with self.lock:
+            self.starts = [start for start in self.starts if now - start < self.period]
+            if len(self.starts) >= self.rate:
+                return False
+            self.starts.append(now)
+            return True
+
+
+
+"""Output formats"""
+
+def to_collapsed(sampler):
+    return ''.join('{} {}\n'.format(';'.join(stack), count) for stack, count in sampler.stacks.most_common())
+
+
+def to_speedscope(sampler, name):
+    frames, index = [], {}
+    samples, weights = [], []
+    for stack, count in sampler.stacks.items():
+        for frame in stack:
+            if frame not in index:
+                index[frame] = len(frames)
+                frames.append(dict(name=frame))
+        samples.append([index[frame] for frame in stack])
+        weights.append(count * sampler.interval)
+    return json.dumps({
+        '$schema': 'https://www.speedscope.app/file-format-schema.json',
+        'name': name,
+        'exporter': 'applet profiling.py',
+        'shared': dict(frames=frames),
+        'profiles': [dict(type='sampled', name=name, unit='seconds', startValue=0, endValue=sum(weights), samples=samples, weights=weights)],
+    })
+
+
+def write_profile(sampler, directory, output_format, name):
+    os.makedirs(directory, exist_ok=True)
+    stamp = time.strftime('%Y%m%d-%H%M%S') + '-{:03d}-{}'.format(int(time.time() * 1000) % 1000, os.getpid())
+    if output_format == 'speedscope':
+        path, text = os.path.join(directory, stamp + '.speedscope.json'), to_speedscope(sampler, name)
+    else:
+        path, text = os.path.join(directory, stamp + '.folded'), to_collapsed(sampler)
+    with open(path, 'w') as f:
+        f.write(text)
+    return path
+
+
+
+"""Flask wiring"""
+
+def register_profiling(app, mode=None, directory=None, output_format=None, interval=None, rate=None):
+    #arguments left as None come from the APPLET_PROFILE* environment variables,
+    #nothing is installed when the mode is unset
+    import flask
+
+    mode = mode or os.environ.get('APPLET_PROFILE')
+    if not mode:
+        return None
+    if mode not in ('header', 'all'):
+        raise ValueError("APPLET_PROFILE must be 'header' or 'all', not {!r}".format(mode))
+    directory = directory or os.environ.get('APPLET_PROFILE_DIR', 'profiles')
+    output_format = output_format or os.environ.get('APPLET_PROFILE_FORMAT', 'collapsed')
+    if output_format not in FORMATS:
+        raise ValueError("APPLET_PROFILE_FORMAT must be one of " + ", ".join(FORMATS))
+    interval = interval or float(os.environ.get('APPLET_PROFILE_INTERVAL', 0.005))
+    limiter = RateLimiter(rate or int(os.environ.get('APPLET_PROFILE_RATE', 6)))
+    callback_path = app.config.routes_pathname_prefix + '_dash-update-component'
+
+    def start_profile():
+        request = flask.request
+        if request.path != callback_path:
+            return
+        if mode == 'header' and request.headers.get(PROFILE_HEADER) != '1':
+            return
+        if limiter.allow():
+            flask.g.profile_sampler = Sampler(threading.get_ident(), interval).start()
+
+    def finish_profile(response):
+        sampler = flask.g.pop('profile_sampler', None)
+        if sampler is not None:
+            body = flask.request.get_json(silent=True)
+            name = body.get('output', callback_path) if isinstance(body, dict) else callback_path
+            path = write_profile(sampler.stop(), directory, output_format, name)
+            response.headers['X-Profile-File'] = os.path.basename(path)
+        return response
+
+    def stop_profile(exception):
+        #the sampler thread must not outlive a request that failed before after_request
+        sampler = flask.g.pop('profile_sampler', None)
+        if sampler is not None:
+            sampler.stop()
+
+    app.server.before_request(start_profile)
+    app.server.after_request(finish_profile)
+    app.server.teardown_request(stop_profile)
+    return limiter
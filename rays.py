@@ -0,0 +1,139 @@
+"""Viewer visibility"""
+
+#Which view of every hogel each of a viewer's eyes sees, and how far the viewer
+#is from leaving the view zone. Coordinates are hogels.py's: mm from the centre
+#of the panel, x along the width, y up and z towards the viewer.
+#
+#On a flat panel the horizontal angle from a hogel to an eye only depends on
+#the hogel's column and the vertical angle only on its row, so the view seen is
+#worked out per column and per row, and the view of hogel (row, column) is
+#(vertical_view[row], horizontal_view[column]). That keeps a trace at
+#columns + rows per eye instead of columns * rows, a few tens of microseconds
+#per head at desktop scale. Heads are any array of shape (..., 3), so many head
+#positions are traced in one pass:
+#
+#    grid = hogels.hogel_grid(586.7, 330, 0.23)
+#    heads = top_view_heads(PROFILES['D'], head_xpos=-800, head_ypos=np.linspace(0, 586.7, 50))
+#    result = trace(grid, 0.019, 57.2, 28.62, heads)
+#    result['horizontal_view'].shape                #(50, 2, 2550): head, eye, column
+#
+#A view index is NO_VIEW where the eye is outside that hogel's fan.
+
+import argparse
+
+import numpy as np
+
+import core
+import hogels
+from profiles import PROFILES, is_drawable
+
+
+EYE_SEPARATION = 63 #mm between the pupils of an average adult
+NO_VIEW = -1
+
+
+def eye_positions(heads, eye_separation=EYE_SEPARATION):
+    #(..., 3) head centres -> (..., 2, 3) left and right eye, side by side along x
+    heads = np.asarray(heads, dtype=float)
+    offset = np.array([[-eye_separation / 2, 0, 0], [eye_separation / 2, 0, 0]], dtype=heads.dtype)
+    return heads[..., None, :] + offset
+
+
+def top_view_heads(profile, head_xpos, head_ypos, head_height=0):
+    #top view coordinates (the panel along y from 0 to display_width at x = 0, the
+    #viewer at negative x) to head positions; any of them can be arrays
+    head_xpos, head_ypos, head_height = np.broadcast_arrays(*[np.asarray(value, dtype=float) for value in (head_xpos, head_ypos, head_height)])
+    return np.stack([head_ypos - profile.display_width/2, head_height, -head_xpos], axis=-1)
+
+
+
+"""Tracing"""
+
+def view_index(offsets, depth, pixel_pitch, hogel_diameter, view_angle):
+    #index of the view whose slice of the fan holds the direction offsets / depth
+    #(views counted from the -x or -y edge of the fan), NO_VIEW outside the fan
+    views = hogels.whole_count(hogel_diameter, pixel_pitch)
+    step = core.view_angle_per_view(pixel_pitch, hogel_diameter, view_angle)
+    angle = np.degrees(np.arctan2(offsets, depth))
+    index = np.floor((angle + view_angle / 2) / step)
+    return np.where((index >= 0) & (index < views), index, NO_VIEW).astype(np.int32)
+
+
+def columns_in_view(grid, pixel_pitch, view_angle, eyes):
+    #how many columns have a view for each eye, the count of NO_VIEW-free entries of
+    #trace's horizontal_view worked out from the ends of the fan instead of per column
+    views = hogels.whole_count(grid.hogel_diameter, pixel_pitch)
+    step = core.view_angle_per_view(pixel_pitch, grid.hogel_diameter, view_angle)
+    low, high = np.radians(-view_angle / 2), np.radians(views * step - view_angle / 2)
+    x, depth = eyes[..., 0], eyes[..., 2]
+    #columns whose hogel sees the eye at an angle in [low, high)
+    centre = (grid.columns - 1) / 2
+    first = np.ceil((x - depth * np.tan(high)) / grid.hogel_diameter + centre + 1e-9)
+    last = np.floor((x - depth * np.tan(low)) / grid.hogel_diameter + centre)
+    first, last = np.maximum(first, 0), np.minimum(last, grid.columns - 1)
+    return np.where(depth > 0, np.maximum(last - first + 1, 0), 0).astype(np.int64)
+
+
+def zone_margin(grid, hor_view_angle, eyes):
+    #how far an eye can move sideways before the first column of hogels drops out
+    #of view, negative once it has; hor_view_angle is the half angle of the zone
+    reach = eyes[..., 2] * np.tan(np.radians(hor_view_angle))
+    half_span = (grid.columns - 1) / 2 * grid.hogel_diameter
+    return reach - half_span - np.abs(eyes[..., 0])
+
+
+def zone_depth(grid, hor_view_angle):
+    #nearest distance from the panel at which the whole width is in view
+    return (grid.columns - 1) / 2 * grid.hogel_diameter / np.tan(np.radians(hor_view_angle))
+
+
+def trace(grid, pixel_pitch, view_angle, hor_view_angle, heads, eye_separation=EYE_SEPARATION, dtype=np.float64):
+    #views seen and view zone margins for both eyes of every head, as a dict of
+    #arrays shaped like heads with the last axis replaced by the eye (and then
+    #the column or row)
+    eyes = eye_positions(heads, eye_separation).astype(dtype)
+    x, y, depth = eyes[..., 0, None], eyes[..., 1, None], eyes[..., 2, None]
+
+    horizontal_view = view_index(x - hogels.column_positions(grid, dtype), depth, pixel_pitch, grid.hogel_diameter, view_angle)
+    vertical_view = view_index(y - hogels.row_positions(grid, dtype=dtype), depth, pixel_pitch, grid.hogel_diameter, view_angle)
+    margin = zone_margin(grid, hor_view_angle, eyes)
+
+    return dict(
+        eyes=eyes,
+        horizontal_view=horizontal_view,
+        vertical_view=vertical_view,
+        visible_columns=np.mean(horizontal_view != NO_VIEW, axis=-1),
+        zone_margin=margin,
+        in_zone=margin >= 0,
+    )
+
+
+def trace_profile(profile, heads, eye_separation=EYE_SEPARATION, dtype=np.float64):
+    grid = hogels.hogel_grid(profile.display_width, profile.display_height, profile.hogel_diameter)
+    return trace(grid, profile.pixel_pitch, profile.view_angle, profile.hor_view_angle, heads, eye_separation, dtype)
+
+
+
+"""Command line"""
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Trace which views of a preset display each eye of a viewer sees.")
+    parser.add_argument('preset', choices=[key for key, profile in PROFILES.items() if is_drawable(profile)])
+    parser.add_argument('--head', type=float, nargs=3, metavar=('X', 'Y', 'Z'), help="head position in mm (default: centred at the view distance)")
+    parser.add_argument('--eye-separation', type=float, default=EYE_SEPARATION, help="mm between the pupils")
+    args = parser.parse_args(argv)
+
+    profile = PROFILES[args.preset]
+    grid = hogels.hogel_grid(profile.display_width, profile.display_height, profile.hogel_diameter)
+    head = args.head or (0.0, 0.0, profile.view_distance)
+    result = trace(grid, profile.pixel_pitch, profile.view_angle, profile.hor_view_angle, head, args.eye_separation)
+
+    print("{} x {} hogels, whole width in view from {:.6g} mm".format(grid.columns, grid.rows, zone_depth(grid, profile.hor_view_angle)))
+    for eye, name in enumerate(('left', 'right')):
+        columns = result['horizontal_view'][eye]
+        print("{:<6} views {:>3} {:>3} {:>3} (left edge, centre, right edge)  columns in view {:>7.2%}  zone margin {:>10.6g} mm".format(
+            name, columns[0], columns[grid.columns // 2], columns[-1], result['visible_columns'][eye], result['zone_margin'][eye]))
+
+
+if __name__ == '__main__':
+    main()
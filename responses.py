@@ -0,0 +1,160 @@
+"""Response cache"""
+
+#The layout, the dependencies and the preset callbacks always answer the same
+#request with the same bytes, so the first response is kept and replayed for
+#every identical request after it. Cached responses carry a strong ETag and
+#requests with a matching If-None-Match get a 304 without a body.
+#
+#Bodies are compressed once when they are stored (gzip, and brotli when the
+#brotli package is installed) so replaying them costs no serialization and no
+#compression.
+#
+#Callback responses of the sweep or motion tabs run to hundreds of kB, so the
+#cache is bounded by the bytes it holds (bodies and their compressed copies)
+#as well as by the number of entries, least recently used first out. Every
+#gunicorn worker has its own cache, so the memory it takes is max_bytes times
+#the worker count at most.
+
+import gzip
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+
+import flask
+import plotly
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+MIN_COMPRESS_SIZE = 1024 #smaller bodies are not worth the Content-Encoding
+DEFAULT_MAX_BYTES = 32 * 2**20 #per process
+
+#headers a replayed response sets itself; any other header of the response being
+#stored, such as X-Profile-File of profiling.py, is per request and copied over
+OWN_HEADERS = frozenset(('content-type', 'content-length', 'content-encoding', 'etag', 'vary'))
+
+
+def to_json_bytes(obj):
+    #same encoder Dash uses for layouts and callback responses
+    return json.dumps(obj, cls=plotly.utils.PlotlyJSONEncoder, separators=(',', ':')).encode('utf-8')
+
+
+def compress(body):
+    encoded = {}
+    if len(body) < MIN_COMPRESS_SIZE:
+        return encoded
+    encoded['gzip'] = gzip.compress(body, compresslevel=9, mtime=0)
+    if brotli is not None:
+        encoded['br'] = brotli.compress(body)
+    return encoded
+
+
+def dont_cache():
+    #called from a callback whose response depends on more than its request body
+    flask.g.dont_cache_response = True
+
+
+class CachedResponse(object):
+    __slots__ = ('body', 'mimetype', 'etag', 'encoded')
+
+    def __init__(self, body, mimetype, precompress=True):
+        self.body = body
+        self.mimetype = mimetype
+        self.etag = hashlib.sha1(body).hexdigest()
+        self.encoded = compress(body) if precompress else {}
+
+    @property
+    def size(self):
+        return len(self.body) + sum(len(encoded) for encoded in self.encoded.values())
+
+    def to_response(self, request):
+        encoding = request.accept_encodings.best_match(list(self.encoded)) if self.encoded else None
+        if encoding:
+            response = flask.Response(self.encoded[encoding], mimetype=self.mimetype)
+            response.headers['Content-Encoding'] = encoding
+            response.set_etag(self.etag + '-' + encoding)
+        else:
+            response = flask.Response(self.body, mimetype=self.mimetype)
+            response.set_etag(self.etag)
+        if self.encoded:
+            response.vary.add('Accept-Encoding')
+        return response.make_conditional(request)
+
+
+class ResponseCache(object):
+
+    def __init__(self, server, paths, max_entries=256, precompress=True, max_bytes=DEFAULT_MAX_BYTES):
+        self.paths = set(paths)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.precompress = precompress
+        self.entries = OrderedDict() #request key -> CachedResponse
+        self.size = 0 #bytes held by the entries
+        self.lock = threading.Lock()
+        server.before_request(self.serve_cached)
+        server.after_request(self.store)
+
+    def request_key(self, method, path, data=b''):
+        #callbacks are POSTs, the request body says which inputs changed
+        return hashlib.sha1(method.encode() + path.encode() + b'\0' + data).hexdigest()
+
+    def lookup(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.entries.move_to_end(key)
+            return entry
+
+    def put(self, method, path, body, mimetype='application/json', data=b''):
+        #also used to fill the cache before the first request, see warm_layout in app.py
+        #an entry larger than max_bytes is returned but not kept
+        entry = CachedResponse(body, mimetype, self.precompress)
+        if entry.size > self.max_bytes:
+            return entry
+        key = self.request_key(method, path, data)
+        with self.lock:
+            replaced = self.entries.pop(key, None)
+            if replaced is not None:
+                self.size -= replaced.size
+            self.entries[key] = entry
+            self.size += entry.size
+            while len(self.entries) > self.max_entries or self.size > self.max_bytes:
+                self.size -= self.entries.popitem(last=False)[1].size
+        return entry
+
+    def serve_cached(self):
+        request = flask.request
+        if request.path not in self.paths:
+            return None
+        entry = self.lookup(self.request_key(request.method, request.path, request.get_data()))
+        if entry is None:
+            return None
+        response = entry.to_response(request)
+        response.headers['X-Response-Cache'] = 'hit'
+        return response
+
+    def store(self, response):
+        request = flask.request
+        if request.path not in self.paths or response.status_code != 200:
+            return response
+        if response.headers.get('X-Response-Cache') == 'hit' or response.direct_passthrough:
+            return response
+        if 'Content-Encoding' in response.headers or flask.g.get('dont_cache_response'):
+            return response
+
+        entry = self.put(request.method, request.path, response.get_data(), response.mimetype, request.get_data())
+        replayed = entry.to_response(request)
+        for name, value in response.headers.items():
+            if name.lower() not in OWN_HEADERS:
+                replayed.headers.add(name, value)
+        replayed.headers['X-Response-Cache'] = 'miss'
+        return replayed
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.size = 0
@@ -0,0 +1,227 @@
+"""Seating"""
+
+#Evaluates every seat of a venue instead of the one head at view_distance of
+#the top view. Seats come from a CSV file or are generated in rows, in the
+#panel frame of hogels.py and rays.py (mm from the centre of the panel, x
+#sideways, y up, z away from the panel), and for every seat we get:
+#
+#    coverage            share of the hogel columns the eyes get a view from (mean of both eyes)
+#    in_zone             both eyes inside the view zone set by hor_view_angle
+#    zone_margin         mm the head can move sideways before that stops being true
+#    hogel_arcmin        angle one hogel subtends at the seat, about 1 is the eye's limit
+#    views_between_eyes  views the panel centre fits between the eyes, 1 or more for stereo
+#    views_per_degree    effective angular resolution: the hogels' views per degree times coverage,
+#                        so hogels the seat gets no view from count as 0
+#
+#Every quantity is worked out for all seats at once; venues with more than
+#PARALLEL_MIN_SEATS seats are split into chunks evaluated in worker processes,
+#like batch.py does:
+#
+#    seats = seat_rows(rows=20, seats_per_row=24, first_row=3658, row_spacing=950, seat_width=550)
+#    results = simulate(PROFILES['C'], seats)
+#    python seating.py C --rows 20 --seats-per-row 24 -o seats.csv
+
+import argparse
+import csv
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+import numpy as np
+
+import core
+import hogels
+import rays
+from profiles import PROFILES, is_drawable
+
+
+SEAT_COLUMNS = ('x', 'z') #required, mm; y (eye height above the panel centre) and seat (a name) are optional
+RESULT_COLUMNS = ('coverage', 'in_zone', 'zone_margin', 'hogel_arcmin', 'views_between_eyes', 'views_per_degree')
+
+DEFAULT_CHUNK_SIZE = 50000 #seats per task
+PARALLEL_MIN_SEATS = 200000 #fewer seats take less time than starting the workers
+
+#rows of seats centred on the panel: (rows, seats per row, row spacing, seat width), the first row at view_distance
+DEFAULT_VENUES = dict(
+    HC=(3, 5, 1000, 600),
+    C=(20, 24, 950, 550),
+)
+
+
+
+"""Seats"""
+
+def seat_rows(rows, seats_per_row, first_row, row_spacing, seat_width, eye_height=0, stagger=False):
+    #rows of seats centred on the panel, the first row first_row mm from it;
+    #stagger shifts every other row by half a seat so heads don't line up
+    row, column = np.divmod(np.arange(rows * seats_per_row), seats_per_row)
+    x = (column - (seats_per_row - 1) / 2) * seat_width
+    if stagger:
+        x = x + np.where(row % 2 == 1, seat_width / 2, 0)
+    return dict(
+        seat=np.char.add(np.repeat([row_name(r) for r in range(rows)], seats_per_row), np.tile(np.arange(1, seats_per_row + 1).astype(str), rows)),
+        x=x.astype(float),
+        y=np.full(len(x), float(eye_height)),
+        z=first_row + row * float(row_spacing),
+    )
+
+
+def row_name(row):
+    #A..Z, then AA, AB, ... like most venues
+    name = ''
+    row += 1
+    while row:
+        row, letter = divmod(row - 1, 26)
+        name = chr(ord('A') + letter) + name
+    return name
+
+
+def default_seats(profile):
+    rows, seats_per_row, row_spacing, seat_width = DEFAULT_VENUES.get(profile.key, (1, 1, 1000, 600))
+    return seat_rows(rows, seats_per_row, profile.view_distance, row_spacing, seat_width)
+
+
+def read_seats(lines):
+    #seats from CSV lines with a header naming x and z (and optionally y and seat)
+    reader = csv.reader(lines)
+    header = [name.strip() for name in next(reader)]
+    missing = [name for name in SEAT_COLUMNS if name not in header]
+    if missing:
+        raise ValueError("seat file is missing the column(s) " + ", ".join(missing))
+    rows = [row for row in reader if row]
+
+    def column(name, default):
+        if name not in header:
+            return [default] * len(rows)
+        index = header.index(name)
+        return [row[index].strip() if len(row) > index else default for row in rows]
+
+    seats = dict((name, np.array([to_float(value) for value in column(name, 0)])) for name in ('x', 'y', 'z'))
+    seats['seat'] = np.array([value or str(i + 1) for i, value in enumerate(column('seat', ''))])
+    return seats
+
+
+def to_float(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+
+"""Evaluation"""
+
+def evaluate_seats(profile, x, y, z, eye_separation=rays.EYE_SEPARATION):
+    #RESULT_COLUMNS for seats at x, y, z; seats at or behind the panel see nothing
+    grid = hogels.hogel_grid(profile.display_width, profile.display_height, profile.hogel_diameter)
+    eyes = rays.eye_positions(np.stack([x, y, z], axis=-1), eye_separation)
+    left, right = eyes[:, 0], eyes[:, 1]
+
+    #seen from the panel centre, the eyes are this many views apart
+    step = core.view_angle_per_view(profile.pixel_pitch, profile.hogel_diameter, profile.view_angle)
+    with np.errstate(invalid='ignore'):
+        eye_angle = np.degrees(np.arctan2(right[:, 0], right[:, 2]) - np.arctan2(left[:, 0], left[:, 2]))
+        distance = np.sqrt(x*x + y*y + z*z)
+        margin = rays.zone_margin(grid, profile.hor_view_angle, eyes).min(axis=-1)
+        in_front = z > 0
+    coverage = np.where(in_front, rays.columns_in_view(grid, profile.pixel_pitch, profile.view_angle, eyes).mean(axis=-1) / grid.columns, 0.0)
+
+    return dict(
+        coverage=coverage,
+        in_zone=in_front & (margin >= 0),
+        zone_margin=np.where(in_front, margin, np.nan),
+        hogel_arcmin=np.where(in_front, core.hogel_angular_size(profile.hogel_diameter, distance), np.nan),
+        views_between_eyes=np.where(in_front, eye_angle / step, np.nan),
+        views_per_degree=coverage / step,
+    )
+
+
+def simulate(profile, seats, eye_separation=rays.EYE_SEPARATION, chunk_size=DEFAULT_CHUNK_SIZE, workers=None):
+    #RESULT_COLUMNS for every seat, in seat order; large venues are split between worker processes
+    x, y, z = [np.asarray(seats[name], dtype=float) for name in ('x', 'y', 'z')]
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(x) < PARALLEL_MIN_SEATS:
+        return evaluate_seats(profile, x, y, z, eye_separation)
+
+    starts = range(0, len(x), chunk_size)
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        chunks = list(executor.map(evaluate_seats, repeat(profile),
+                                   [x[start:start + chunk_size] for start in starts],
+                                   [y[start:start + chunk_size] for start in starts],
+                                   [z[start:start + chunk_size] for start in starts],
+                                   repeat(eye_separation)))
+    return dict((name, np.concatenate([chunk[name] for chunk in chunks])) for name in RESULT_COLUMNS)
+
+
+def summarize_seats(results):
+    #venue-wide numbers for the summary table
+    seats = len(results['coverage'])
+    in_zone = int(np.count_nonzero(results['in_zone']))
+    stereo = int(np.count_nonzero(results['views_between_eyes'] >= 1))
+    with np.errstate(invalid='ignore'):
+        return dict(
+            seats=seats,
+            in_zone=in_zone,
+            in_zone_share=in_zone / seats if seats else np.nan,
+            stereo=stereo,
+            min_coverage=float(np.min(results['coverage'])) if seats else np.nan,
+            mean_coverage=float(np.mean(results['coverage'])) if seats else np.nan,
+            max_hogel_arcmin=float(np.nanmax(results['hogel_arcmin'])) if seats else np.nan,
+            min_views_between_eyes=float(np.nanmin(results['views_between_eyes'])) if seats else np.nan,
+            min_views_per_degree=float(np.min(results['views_per_degree'])) if seats else np.nan,
+            mean_views_per_degree=float(np.mean(results['views_per_degree'])) if seats else np.nan,
+        )
+
+
+def write_csv(stream, seats, results):
+    writer = csv.writer(stream, lineterminator='\n')
+    writer.writerow(('seat', 'x', 'y', 'z') + RESULT_COLUMNS)
+    values = np.column_stack([seats[name] for name in ('x', 'y', 'z')] + [results[name].astype(float) for name in RESULT_COLUMNS]).tolist()
+    for seat, row in zip(seats['seat'].tolist(), values):
+        writer.writerow([seat] + ['{:.6g}'.format(value) for value in row])
+
+
+
+"""Command line"""
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Evaluate every seat of a venue in front of a preset display.")
+    parser.add_argument('preset', choices=[key for key, profile in PROFILES.items() if is_drawable(profile)])
+    parser.add_argument('--seats', help="CSV of seats with x and z columns (and optionally y and seat), in mm from the panel centre")
+    parser.add_argument('--rows', type=int, help="generate this many rows of seats instead")
+    parser.add_argument('--seats-per-row', type=int, default=20)
+    parser.add_argument('--row-spacing', type=float, default=950, help="mm")
+    parser.add_argument('--seat-width', type=float, default=550, help="mm")
+    parser.add_argument('--first-row', type=float, help="mm from the panel (default: the view distance)")
+    parser.add_argument('--stagger', action='store_true', help="shift every other row by half a seat")
+    parser.add_argument('-o', '--output', help="write one CSV row per seat here, - for stdout")
+    parser.add_argument('--workers', type=int, default=None, help="worker processes for large venues (default: one per CPU)")
+    args = parser.parse_args(argv)
+
+    profile = PROFILES[args.preset]
+    if args.seats:
+        with open(args.seats, newline='') as f:
+            seats = read_seats(f)
+    elif args.rows:
+        first_row = args.first_row if args.first_row is not None else profile.view_distance
+        seats = seat_rows(args.rows, args.seats_per_row, first_row, args.row_spacing, args.seat_width, stagger=args.stagger)
+    else:
+        seats = default_seats(profile)
+
+    results = simulate(profile, seats, workers=args.workers)
+    if args.output == '-':
+        write_csv(sys.stdout, seats, results)
+    elif args.output:
+        with open(args.output, 'w', newline='') as f:
+            write_csv(f, seats, results)
+
+    summary = summarize_seats(results)
+    print("{seats} seats, {in_zone} ({in_zone_share:.0%}) in the view zone, {stereo} with stereo; coverage {min_coverage:.1%} at worst and {mean_coverage:.1%} on average, "
+          "hogels up to {max_hogel_arcmin:.3g} arcmin, at least {min_views_between_eyes:.3g} views between the eyes, "
+          "{min_views_per_degree:.3g} views per degree at worst and {mean_views_per_degree:.3g} on average".format(**summary),
+          file=sys.stderr if args.output == '-' else sys.stdout)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,183 @@
+"""Seating page"""
+
+#Tab of the app that runs seating.py for a venue in front of the home cinema
+#or cinema display, from generated rows of seats or an uploaded seat CSV, and
+#shows a seat map coloured by one of the results next to a summary table. The
+#map is drawn like the top view: the panel along y at x = 0, the seats at
+#negative x, and the edges of the view zone behind them.
+
+import base64
+import io
+import time
+
+import numpy as np
+import dash_core_components as dcc
+import dash_html_components as html
+import plotly.graph_objects as go
+from dash.dependencies import Input, Output, State
+
+import hogels
+import rays
+import seating
+from profiles import PROFILES
+
+
+SEATING_PRESETS = ('HC', 'C')
+MAX_SEATS = 10**6 #about a second to evaluate in one worker
+PLOT_SAMPLE_SIZE = 20000 #seats drawn on the map, the table covers all of them
+
+#(name, label, default)
+ROW_INPUTS = [
+    ('rows', "Rows", 20),
+    ('seats_per_row', "Seats per Row", 24),
+    ('row_spacing', "Row Spacing (mm)", 950),
+    ('seat_width', "Seat Width (mm)", 550),
+    ('first_row', "First Row (mm, empty for the view distance)", None),
+]
+
+LABELS = dict(
+    coverage="Coverage (share of hogels in view)",
+    in_zone="In the View Zone",
+    zone_margin="View Zone Margin (mm)",
+    hogel_arcmin="Hogel Angular Size (arcmin)",
+    views_between_eyes="Views between the Eyes",
+    views_per_degree="Effective Angular Resolution (views/degree)",
+)
+
+
+def make_seating_layout():
+    return html.Div(children=[
+        dcc.RadioItems(
+            id='seating-preset',
+            options=[{'label': PROFILES[key].label, 'value': key} for key in SEATING_PRESETS],
+            value='C',
+            labelStyle={'display': 'inline-block'},
+        ),
+        html.Table(children=[
+            html.Tbody(children=[
+                html.Tr(children=[
+                    html.Th(scope="row", children=[label]),
+                    html.Td(dcc.Input(id='seating-' + name.replace('_', '-'), type='number', value=value, min=0, style={'width': '90px'})),
+                    ])
+                for name, label, value in ROW_INPUTS
+                ]),
+            ]),
+
+        html.Div(children=[
+            dcc.Checklist(
+                id='seating-options',
+                options=[{'label': 'Stagger rows', 'value': 'stagger'}],
+                value=[],
+                labelStyle={'display': 'inline-block'},
+            ),
+            dcc.Upload(id='seating-upload', children=html.Button('Seat CSV (x, z and optionally y, seat in mm)'), accept='.csv'),
+            dcc.RadioItems(
+                id='seating-source',
+                options=[
+                    {'label': 'Rows', 'value': 'rows'},
+                    {'label': 'Uploaded seats', 'value': 'upload'},
+                ],
+                value='rows',
+                labelStyle={'display': 'inline-block'},
+            ),
+            html.Label(children=["Colour ", dcc.Dropdown(id='seating-color', options=[{'label': LABELS[name], 'value': name} for name in seating.RESULT_COLUMNS],
+                                                        value='coverage', clearable=False)],
+                       style={'display': 'inline-block', 'width': '320px'}),
+            html.Button('Simulate', id='seating-run', n_clicks=0),
+            html.Div(id='seating-status'),
+        ]),
+
+        html.Div(children=[dcc.Graph(id='seating-figure')], style={'display': 'inline-block'}),
+        html.Div(children=[html.Table(id='seating-summary')], style={'display': 'inline-block', 'vertical-align': 'top'}),
+    ])
+
+
+def uploaded_seats(contents):
+    #dcc.Upload hands the file over as a base64 data URL
+    data = base64.b64decode(contents.split(',', 1)[1]).decode('utf-8-sig')
+    return seating.read_seats(io.StringIO(data))
+
+
+def seating_figure(profile, seats, results, color):
+    grid = hogels.hogel_grid(profile.display_width, profile.display_height, profile.hogel_diameter)
+    shown = np.linspace(0, len(seats['x']) - 1, min(len(seats['x']), PLOT_SAMPLE_SIZE)).astype(int)
+    x, z = seats['x'][shown], seats['z'][shown]
+    values = results[color][shown].astype(float)
+
+    figure = go.Figure()
+    figure.add_trace(go.Scatter(x=[0, 0], y=[0, profile.display_width], mode='lines', line=dict(color='black', width=3), hoverinfo='skip', showlegend=False))
+
+    #edges of the view zone, from where it starts to the last row
+    start, end = rays.zone_depth(grid, profile.hor_view_angle), max(np.nanmax(z), 0)
+    if end > start:
+        depth = np.array([start, end])
+        lateral = depth * np.tan(np.radians(profile.hor_view_angle)) - (grid.columns - 1) / 2 * grid.hogel_diameter
+        for side in (1, -1):
+            figure.add_trace(go.Scatter(x=-depth, y=side * lateral + profile.display_width/2, mode='lines', line=dict(color='grey', dash='dash'),
+                                        hoverinfo='skip', showlegend=False))
+
+    figure.add_trace(go.Scattergl(
+        x=-z, y=x + profile.display_width/2, mode='markers',
+        marker=dict(size=6, color=values, colorscale='Viridis', showscale=True, colorbar=dict(title=LABELS[color])),
+        text=seats['seat'][shown], hovertemplate='%{text}: %{marker.color:.4g}<extra></extra>', showlegend=False,
+    ))
+    figure.update_layout(title=dict(text='Seats', x=0.5, font=dict(color="Black", size=24)), plot_bgcolor='white', width=700, height=700,
+                         xaxis=dict(title="Distance from the Display (mm)"), yaxis=dict(title="Across the Display (mm)", scaleanchor='x'))
+    return figure
+
+
+def summary_table(summary):
+    rows = [
+        ("Seats", "{:,}".format(summary['seats'])),
+        ("In the View Zone", "{:,} ({:.0%})".format(summary['in_zone'], summary['in_zone_share'])),
+        ("Stereo (a view or more between the eyes)", "{:,}".format(summary['stereo'])),
+        ("Lowest Coverage", "{:.1%}".format(summary['min_coverage'])),
+        ("Mean Coverage", "{:.1%}".format(summary['mean_coverage'])),
+        ("Largest Hogel Angular Size (arcmin)", "{:.3g}".format(summary['max_hogel_arcmin'])),
+        ("Fewest Views between the Eyes", "{:.3g}".format(summary['min_views_between_eyes'])),
+        ("Lowest Effective Angular Resolution (views/degree)", "{:.3g}".format(summary['min_views_per_degree'])),
+        ("Mean Effective Angular Resolution (views/degree)", "{:.3g}".format(summary['mean_views_per_degree'])),
+    ]
+    return [
+        html.Thead(children=[html.Tr(children=[html.Th(scope="col", children=[name]) for name in ("Symbol", "Value")])]),
+        html.Tbody(children=[
+            html.Tr(children=[html.Th(scope="row", children=[label]), html.Td(value)])
+            for label, value in rows
+            ]),
+    ]
+
+
+def register_seating_callbacks(app):
+    row_states = [State('seating-' + name.replace('_', '-'), 'value') for name, label, value in ROW_INPUTS]
+
+    @app.callback(
+        [Output('seating-figure', 'figure'), Output('seating-summary', 'children'), Output('seating-status', 'children')],
+        [Input('seating-run', 'n_clicks')],
+        [State('seating-preset', 'value'), State('seating-source', 'value'), State('seating-upload', 'contents'),
+         State('seating-options', 'value'), State('seating-color', 'value')] + row_states
+    )
+    def run_seating(n_clicks, preset, source, contents, options, color, rows, seats_per_row, row_spacing, seat_width, first_row):
+        profile = PROFILES[preset if preset in SEATING_PRESETS else SEATING_PRESETS[0]]
+
+        if source == 'upload':
+            if not contents:
+                return go.Figure(), [], "Upload a seat CSV first."
+            try:
+                seats = uploaded_seats(contents)
+            except (ValueError, UnicodeDecodeError, StopIteration) as error:
+                return go.Figure(), [], "Could not read the seat file: {}".format(str(error) or "it is empty")
+        else:
+            if any(value is None for value in (rows, seats_per_row, row_spacing, seat_width)):
+                return go.Figure(), [], "Fill in every row setting."
+            if int(rows) * int(seats_per_row) > MAX_SEATS:
+                return go.Figure(), [], "{:,} seats is more than the {:,} the page allows, use seating.py directly.".format(int(rows) * int(seats_per_row), MAX_SEATS)
+            first_row = profile.view_distance if first_row is None else first_row
+            seats = seating.seat_rows(int(rows), int(seats_per_row), first_row, row_spacing, seat_width, stagger='stagger' in (options or []))
+
+        if not 0 < len(seats['x']) <= MAX_SEATS:
+            return go.Figure(), [], "Between 1 and {:,} seats, please.".format(MAX_SEATS)
+
+        start = time.time()
+        results = seating.simulate(profile, seats, workers=1) #one click, one worker process
+        status = "{:,} seats in {:.2f} s, plotting {:,} of them.".format(len(seats['x']), time.time() - start, min(len(seats['x']), PLOT_SAMPLE_SIZE))
+        return seating_figure(profile, seats, results, color), summary_table(seating.summarize_seats(results)), status
@@ -0,0 +1,118 @@
+"""Sensitivity"""
+
+#How strongly angular resolution, lossless projection depth and view zone width
+#react to small changes of pixel pitch, hogel diameter and view distance. The
+#relationships in core.py differentiate in closed form, so the Jacobian of many
+#designs is a few array operations; finite_differences does the same job for
+#any function of the design by central differences, all perturbed designs
+#evaluated in one batched call, and is what the analytic Jacobian is checked
+#against:
+#
+#    J = jacobian([0.019, 0.5], [0.23, 0.8], [800, 2743.2], [57.2, 61.9])
+#    J.shape                                        #(2, 3, 3): design, metric, parameter
+#    elasticities(0.019, 0.23, 800, 57.2)           #% change of a metric per % change of a parameter
+#
+#swings is what a tornado chart shows: the % change of every metric when one
+#parameter at a time moves step (10% by default) down and up.
+
+import numpy as np
+
+import core
+
+
+PARAMETERS = ('pixel_pitch', 'hogel_diameter', 'view_distance')
+METRICS = ('angular_resolution', 'lossless_depth', 'view_zone_width')
+
+STEP = 0.1 #relative parameter change of a tornado chart
+DIFFERENCE_STEP = 1e-6 #relative step of the central differences
+
+
+def designs(pixel_pitch, hogel_diameter, view_distance, view_angle, dtype=np.float64):
+    #the inputs (floats or arrays, broadcast against each other) as flat arrays
+    inputs = np.broadcast_arrays(*[np.asarray(value, dtype=dtype) for value in (pixel_pitch, hogel_diameter, view_distance, view_angle)])
+    return [np.ravel(value) for value in inputs]
+
+
+def metric_values(pixel_pitch, hogel_diameter, view_distance, view_angle, dtype=np.float64):
+    #(n, metrics) METRICS of the designs
+    pixel_pitch, hogel_diameter, view_distance, view_angle = designs(pixel_pitch, hogel_diameter, view_distance, view_angle, dtype)
+    return np.stack([
+        core.angular_resolution(pixel_pitch, hogel_diameter, view_angle),
+        core.lossless_depth(pixel_pitch, hogel_diameter, view_angle),
+        core.view_zone_width(view_distance, view_angle),
+    ], axis=-1)
+
+
+def jacobian(pixel_pitch, hogel_diameter, view_distance, view_angle, dtype=np.float64):
+    #(n, metrics, parameters) derivatives of METRICS with respect to PARAMETERS
+    pixel_pitch, hogel_diameter, view_distance, view_angle = designs(pixel_pitch, hogel_diameter, view_distance, view_angle, dtype)
+    result = np.zeros((len(pixel_pitch), len(METRICS), len(PARAMETERS)), dtype=dtype)
+
+    #angular resolution D / (p * theta)
+    resolution = core.angular_resolution(pixel_pitch, hogel_diameter, view_angle)
+    result[:, 0, 0] = -resolution / pixel_pitch
+    result[:, 0, 1] = resolution / hogel_diameter
+
+    #lossless depth D / tan(r / 2) with r = radians(theta * p / D), so dr/dp = r / p and dr/dD = -r / D
+    half_angle = np.radians(core.view_angle_per_view(pixel_pitch, hogel_diameter, view_angle)) / 2
+    tangent = np.tan(half_angle)
+    slope = hogel_diameter * (1 + tangent**2) / tangent**2 #-d(depth)/d(half_angle)
+    result[:, 1, 0] = -slope * half_angle / pixel_pitch
+    result[:, 1, 1] = 1 / tangent + slope * half_angle / hogel_diameter
+
+    #view zone width 2 * L * tan(theta / 2)
+    result[:, 2, 2] = 2 * np.tan(np.radians(view_angle) / 2)
+    return result
+
+
+def finite_differences(function, parameters, relative_step=DIFFERENCE_STEP):
+    #(n, outputs, k) central differences of function, which maps k arrays of n designs to an (n, outputs)
+    #array, with respect to each of them; the 2 * k perturbed copies of the designs go through one call
+    parameters = [np.asarray(value, dtype=np.float64) for value in np.broadcast_arrays(*parameters)]
+    n, k = len(parameters[0]), len(parameters)
+    steps = [relative_step * np.maximum(np.abs(value), 1) for value in parameters]
+
+    stacked = []
+    for index, value in enumerate(parameters):
+        perturbed = np.tile(value, 2 * k)
+        perturbed[2 * index * n:(2 * index + 1) * n] -= steps[index]
+        perturbed[(2 * index + 1) * n:(2 * index + 2) * n] += steps[index]
+        stacked.append(perturbed)
+
+    values = np.asarray(function(*stacked)).reshape(k, 2, n, -1)
+    return np.stack([(values[index, 1] - values[index, 0]) / (2 * steps[index][:, None]) for index in range(k)], axis=-1)
+
+
+def numeric_jacobian(pixel_pitch, hogel_diameter, view_distance, view_angle, relative_step=DIFFERENCE_STEP):
+    #jacobian by finite differences
+    pixel_pitch, hogel_diameter, view_distance, view_angle = designs(pixel_pitch, hogel_diameter, view_distance, view_angle)
+    return finite_differences(lambda p, d, l: metric_values(p, d, l, np.tile(view_angle, 2 * len(PARAMETERS))),
+                              [pixel_pitch, hogel_diameter, view_distance], relative_step)
+
+
+def elasticities(pixel_pitch, hogel_diameter, view_distance, view_angle, dtype=np.float64):
+    #(n, metrics, parameters) % change of each metric per % change of each parameter, 0 where a metric is 0
+    pixel_pitch, hogel_diameter, view_distance, view_angle = designs(pixel_pitch, hogel_diameter, view_distance, view_angle, dtype)
+    values = metric_values(pixel_pitch, hogel_diameter, view_distance, view_angle, dtype)
+    parameters = np.stack([pixel_pitch, hogel_diameter, view_distance], axis=-1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        result = jacobian(pixel_pitch, hogel_diameter, view_distance, view_angle, dtype) * parameters[:, None, :] / values[:, :, None]
+    return np.where(values[:, :, None] == 0, 0, result)
+
+
+def swings(pixel_pitch, hogel_diameter, view_distance, view_angle, step=STEP, dtype=np.float64):
+    #(n, metrics, parameters, 2) % change of each metric when each parameter alone is scaled by 1 - step and 1 + step,
+    #every scaled design evaluated in one batch
+    pixel_pitch, hogel_diameter, view_distance, view_angle = designs(pixel_pitch, hogel_diameter, view_distance, view_angle, dtype)
+    n, k = len(pixel_pitch), len(PARAMETERS)
+
+    scale = np.ones((k, 2, k), dtype=dtype)
+    for index in range(k):
+        scale[index, :, index] = (1 - step, 1 + step)
+    scaled = scale[:, :, None, :] * np.stack([pixel_pitch, hogel_diameter, view_distance], axis=-1) #(k, 2, n, k)
+
+    values = metric_values(scaled[..., 0], scaled[..., 1], scaled[..., 2], np.broadcast_to(view_angle, (k, 2, n)), dtype).reshape(k, 2, n, -1)
+    base = metric_values(pixel_pitch, hogel_diameter, view_distance, view_angle, dtype)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        change = 100 * (values / base - 1) #(k, 2, n, metrics)
+    return change.transpose(2, 3, 0, 1)
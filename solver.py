@@ -0,0 +1,120 @@
+"""Inverse design"""
+
+#The variable table goes from hardware to metrics; this goes the other way,
+#from a required lossless projection depth and angular resolution at a view
+#distance and view angle to the pixel pitch and hogel diameter that give them.
+#
+#Both relationships in core.py invert in closed form: the angle per view is
+#1 / angular_resolution, the lossless depth is hogel_diameter / tan(angle per
+#view / 2), and the pixel pitch follows from the views per hogel. So every
+#target is solved exactly, and a batch of them is a few array operations.
+#Targets that no display meets are reported in the reason column instead of
+#raising:
+#
+#    solve(lossless_depth=25, angular_resolution=0.27, view_distance=2743.2, view_angle=61.9)
+#    python solver.py targets.csv -o designs.csv          #CSV or JSON lines, like batch.py
+#
+#The view distance gives the view zone width and the angular size of a hogel;
+#with max_hogel_arcmin set (EYE_LIMIT_ARCMIN for hogels the eye cannot make out)
+#a design whose hogels look larger than that from there is infeasible.
+
+import argparse
+import sys
+from functools import partial
+
+import numpy as np
+
+import batch
+import core
+
+
+TARGETS = ('lossless_depth', 'angular_resolution', 'view_distance', 'view_angle')
+SOLUTION_COLUMNS = ('pixel_pitch', 'hogel_diameter', 'views_per_hogel', 'view_zone_width', 'hogel_angular_size', 'feasible', 'reason')
+
+EYE_LIMIT_ARCMIN = 1.0 #what the eye resolves at best
+
+#reasons, checked in this order
+INVALID_TARGET = 'every target must be a positive number'
+TOO_WIDE = 'the view angle must be below 180 degrees'
+TOO_FEW_VIEWS = 'less than one view per hogel'
+VISIBLE_HOGELS = 'hogels larger than max_hogel_arcmin at the view distance'
+PIXELS_TOO_SMALL = 'pixel pitch below min_pixel_pitch'
+
+
+def solve(lossless_depth, angular_resolution, view_distance, view_angle, max_hogel_arcmin=None, min_pixel_pitch=0, dtype=np.float64):
+    #SOLUTION_COLUMNS for the targets (floats or arrays, broadcast against each other) as a dict of flat arrays;
+    #reason is '' for feasible targets, and pixel_pitch and hogel_diameter are NaN for invalid ones
+    targets = np.broadcast_arrays(*[np.asarray(value, dtype=dtype) for value in (lossless_depth, angular_resolution, view_distance, view_angle)])
+    lossless_depth, angular_resolution, view_distance, view_angle = [np.ravel(value) for value in targets]
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        valid = np.ones(len(lossless_depth), dtype=bool)
+        for value in (lossless_depth, angular_resolution, view_distance, view_angle):
+            valid &= np.isfinite(value) & (value > 0)
+
+        angle_per_view = 1 / angular_resolution
+        hogel_diameter = np.where(valid, lossless_depth * np.tan(np.radians(angle_per_view) / 2), np.nan)
+        views_per_hogel = angular_resolution * view_angle
+        pixel_pitch = hogel_diameter / views_per_hogel
+        hogel_angular_size = core.hogel_angular_size(hogel_diameter, view_distance)
+
+        reason = np.full(len(valid), '', dtype=object)
+        for failed, text in ((pixel_pitch < min_pixel_pitch, PIXELS_TOO_SMALL),
+                             (hogel_angular_size > (np.inf if max_hogel_arcmin is None else max_hogel_arcmin), VISIBLE_HOGELS),
+                             (views_per_hogel < 1, TOO_FEW_VIEWS),
+                             (view_angle >= 180, TOO_WIDE),
+                             (~valid, INVALID_TARGET)):
+            reason[failed] = text #later checks overwrite earlier ones, so the first failing one stays
+
+        return dict(
+            pixel_pitch=pixel_pitch,
+            hogel_diameter=hogel_diameter,
+            views_per_hogel=np.where(valid, views_per_hogel, np.nan),
+            view_zone_width=np.where(valid & (view_angle < 180), core.view_zone_width(view_distance, view_angle), np.nan),
+            hogel_angular_size=hogel_angular_size,
+            feasible=reason == '',
+            reason=reason,
+        )
+
+
+def solve_columns(columns, max_hogel_arcmin=None, min_pixel_pitch=0):
+    #batch.Job.evaluate for target files
+    return solve(*[columns[name] for name in TARGETS], max_hogel_arcmin=max_hogel_arcmin, min_pixel_pitch=min_pixel_pitch)
+
+
+SOLVE = batch.Job(TARGETS, SOLUTION_COLUMNS, solve_columns)
+
+
+
+"""Command line"""
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Solve display targets for pixel pitch and hogel diameter.")
+    parser.add_argument('input', help="CSV or JSON-lines file with the columns " + ", ".join(TARGETS) + ", - for stdin")
+    parser.add_argument('-o', '--output', default='-', help="where to write the solutions, - for stdout (default)")
+    parser.add_argument('--input-format', choices=['csv', 'jsonl'], help="default: from the file extension, else csv")
+    parser.add_argument('--output-format', choices=['csv', 'jsonl'], help="default: from the file extension, else the input format")
+    parser.add_argument('--chunk-size', type=int, default=batch.DEFAULT_CHUNK_SIZE, help="rows per worker task")
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (default: one per CPU)")
+    parser.add_argument('--max-hogel-arcmin', type=float, help="largest hogel angular size at the view distance, {} for invisible hogels".format(EYE_LIMIT_ARCMIN))
+    parser.add_argument('--min-pixel-pitch', type=float, default=0, help="smallest pixel pitch that can be made, in mm")
+    args = parser.parse_args(argv)
+
+    input_format = args.input_format or batch.detect_format(args.input)
+    output_format = args.output_format or batch.detect_format(args.output, default=input_format)
+
+    input_stream = sys.stdin if args.input == '-' else open(args.input, newline='')
+    output_stream = sys.stdout if args.output == '-' else open(args.output, 'w', newline='')
+    try:
+        job = SOLVE._replace(evaluate=partial(solve_columns, max_hogel_arcmin=args.max_hogel_arcmin, min_pixel_pitch=args.min_pixel_pitch))
+        count = batch.run(input_stream, output_stream, input_format, output_format, args.chunk_size, args.workers, job=job)
+    finally:
+        if input_stream is not sys.stdin:
+            input_stream.close()
+        if output_stream is not sys.stdout:
+            output_stream.close()
+    print("{:,} targets solved".format(count), file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
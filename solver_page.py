@@ -0,0 +1,92 @@
+"""Solver page"""
+
+#Tab of the app that runs solver.py on one set of targets as they are typed in,
+#and hands a feasible solution over to the Custom tab to be drawn.
+
+import dash
+import dash_core_components as dcc
+import dash_html_components as html
+from dash.dependencies import Input, Output, State
+
+import core
+import solver
+from profiles import PROFILES
+
+
+_desktop = PROFILES['D']
+
+#(target, label, default), the defaults are what the desktop preset achieves
+SOLVER_INPUTS = [
+    ('lossless_depth', "Lossless Projection Depth (mm)", float('{:.4g}'.format(core.lossless_depth(_desktop.pixel_pitch, _desktop.hogel_diameter, _desktop.view_angle)))),
+    ('angular_resolution', "Angular Resolution (views/degree)", float('{:.4g}'.format(core.angular_resolution(_desktop.pixel_pitch, _desktop.hogel_diameter, _desktop.view_angle)))),
+    ('view_distance', "View Distance (mm)", _desktop.view_distance),
+    ('view_angle', "\u03B8 (degrees)", _desktop.view_angle),
+    ('max_hogel_arcmin', "Largest Hogel Angular Size (arcmin, optional)", solver.EYE_LIMIT_ARCMIN),
+]
+
+SOLUTION_ROWS = [
+    ('pixel_pitch', "Pixel Pitch (mm)"),
+    ('hogel_diameter', "Diameter of Hogel (mm)"),
+    ('views_per_hogel', "Views per Hogel"),
+    ('view_zone_width', "View Zone Width (mm)"),
+    ('hogel_angular_size', "Hogel Angular Size (arcmin)"),
+]
+
+#Custom tab inputs a solution fills in
+CUSTOM_VALUES = ('pixel_pitch', 'hogel_diameter', 'view_distance', 'view_angle')
+
+
+def make_solver_layout():
+    return html.Div(children=[
+        html.Table(children=[
+            html.Tbody(children=[
+                html.Tr(children=[
+                    html.Th(scope="row", children=[label]),
+                    html.Td(dcc.Input(id='solver-' + name, type='number', value=default, debounce=True, min=0, style={'width': '100px'})),
+                    ])
+                for name, label, default in SOLVER_INPUTS
+                ]),
+            ]),
+        html.Div(id='solver-status'),
+        html.Div(children=[html.Table(id='solver-table')], style={'display': 'inline-block'}),
+        html.Div(children=[html.Button('Draw in the Custom tab', id='solver-use', n_clicks=0)]),
+    ])
+
+
+def solve_inputs(values):
+    targets = dict(zip([name for name, label, default in SOLVER_INPUTS], values))
+    return solver.solve(*[targets[name] for name in solver.TARGETS], max_hogel_arcmin=targets['max_hogel_arcmin'])
+
+
+def register_solver_callbacks(app):
+    inputs = [Input('solver-' + name, 'value') for name, label, default in SOLVER_INPUTS]
+
+    @app.callback(
+        [Output('solver-table', 'children'), Output('solver-status', 'children')],
+        inputs
+    )
+    def update_solution(*values):
+        if any(value is None for value in values[:len(solver.TARGETS)]):
+            return [], "Fill in every target."
+        solution = solve_inputs(values)
+        feasible = solution['feasible'][0]
+        #an infeasible solution's numbers (NaN, negative sizes) mean nothing
+        table = [html.Tbody(children=[
+            html.Tr(children=[html.Th(scope="row", children=[label]), html.Td("{:.4g}".format(solution[name][0]) if feasible else "\u2013")])
+            for name, label in SOLUTION_ROWS
+            ])]
+        return table, ("Feasible." if feasible else "Infeasible: {}.".format(solution['reason'][0]))
+
+    @app.callback(
+        [Output('custom-' + name, 'value') for name in CUSTOM_VALUES],
+        [Input('solver-use', 'n_clicks')],
+        [State('solver-' + name, 'value') for name, label, default in SOLVER_INPUTS]
+    )
+    def use_solution(n_clicks, *values):
+        if not n_clicks or any(value is None for value in values[:len(solver.TARGETS)]):
+            return [dash.no_update] * len(CUSTOM_VALUES)
+        solution = solve_inputs(values)
+        if not solution['feasible'][0]:
+            return [dash.no_update] * len(CUSTOM_VALUES)
+        targets = dict(zip([name for name, label, default in SOLVER_INPUTS], values))
+        return [float(solution['pixel_pitch'][0]), float(solution['hogel_diameter'][0]), targets['view_distance'], targets['view_angle']]
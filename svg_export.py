@@ -0,0 +1,244 @@
+"""SVG export"""
+
+#Writes the top and side views straight to SVG files, from the same scenes
+#(geometry.py) as the Plotly figures but without a browser, Plotly or its image
+#export:
+#
+#    python svg_export.py --presets -o diagrams/
+#    python svg_export.py specs.csv -o diagrams/ --format png --workers 8
+#
+#Spec rows need display_width, display_height, pixel_pitch, hogel_diameter,
+#view_distance and view_angle (mm and degrees, like profiles.py); a name column,
+#when there is one, names the files, otherwise they are numbered by row.
+#PNG output rasterizes the SVG with the optional cairosvg package.
+
+import argparse
+import csv
+import json
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from html import escape
+
+import numpy as np
+
+import batch
+from geometry import side_scene, top_scene
+from profiles import PROFILES, custom_profile, is_drawable
+
+try:
+    import cairosvg
+except ImportError:
+    cairosvg = None
+
+
+WIDTH = HEIGHT = 600
+#Plotly's default margins, so the diagrams line up with the figures in the app
+MARGIN_LEFT, MARGIN_RIGHT, MARGIN_TOP, MARGIN_BOTTOM = 80, 80, 100, 80
+FONT_FAMILY = '"Open Sans", verdana, arial, sans-serif'
+TEXT_COLOR = '#444'
+CURVE_COLOR = '#636efa' #first colour of Plotly's default colorway
+
+SPEC_COLUMNS = ('display_width', 'display_height') + batch.REQUIRED_COLUMNS
+DEFAULT_CHUNK_SIZE = 200 #rows per worker task
+
+
+
+"""Rendering"""
+
+class Canvas(object):
+    #maps the [-axis_size, axis_size] square of a figure onto the plot area
+    __slots__ = ('axis_size', 'x_scale', 'y_scale')
+
+    def __init__(self, axis_size):
+        self.axis_size = axis_size
+        self.x_scale = (WIDTH - MARGIN_LEFT - MARGIN_RIGHT) / (2 * axis_size)
+        self.y_scale = (HEIGHT - MARGIN_TOP - MARGIN_BOTTOM) / (2 * axis_size)
+
+    def x(self, x):
+        return MARGIN_LEFT + (np.asarray(x, dtype=float) + self.axis_size) * self.x_scale
+
+    def y(self, y):
+        return MARGIN_TOP + (self.axis_size - np.asarray(y, dtype=float)) * self.y_scale
+
+
+def path_data(canvas, rows):
+    #one "M x_0 y_0 L x_1 y_1" per (x_0, x_1, y_0, y_1) row, formatted in a single pass
+    values = np.column_stack((canvas.x(rows[:, 0]), canvas.y(rows[:, 2]), canvas.x(rows[:, 1]), canvas.y(rows[:, 3]))).ravel()
+    return ('M%.2f %.2fL%.2f %.2f' * len(rows)) % tuple(values)
+
+
+def svg_text(x, y, text, size=12, color=TEXT_COLOR, anchor='middle'):
+    return '<text x="%.2f" y="%.2f" font-size="%d" fill="%s" text-anchor="%s" dominant-baseline="central">%s</text>' % (
+        x, y, size, color, anchor, escape(text, quote=False))
+
+
+def svg_document(elements, title):
+    return '\n'.join([
+        '<svg xmlns="http://www.w3.org/2000/svg" width="%d" height="%d" viewBox="0 0 %d %d" font-family=\'%s\'>' % (WIDTH, HEIGHT, WIDTH, HEIGHT, FONT_FAMILY),
+        '<rect width="100%" height="100%" fill="white"/>',
+    ] + elements + [title, '</svg>', ''])
+
+
+def render_svg(scene):
+    canvas = Canvas(scene.axis_size)
+    elements = [
+        '<clipPath id="plot"><rect x="%d" y="%d" width="%d" height="%d"/></clipPath>' % (
+            MARGIN_LEFT, MARGIN_TOP, WIDTH - MARGIN_LEFT - MARGIN_RIGHT, HEIGHT - MARGIN_TOP - MARGIN_BOTTOM),
+        '<g clip-path="url(#plot)" fill="none">',
+    ]
+
+    #the axes are not equally long on screen, so circles come out as ellipses like in Plotly
+    for circle in scene.circles:
+        fill = ' fill="black" fill-opacity="%.3f"' % circle.fill if circle.fill is not None else ''
+        elements.append('<ellipse cx="%.2f" cy="%.2f" rx="%.2f" ry="%.2f" stroke="black" stroke-width="2"%s/>' % (
+            canvas.x(circle.x), canvas.y(circle.y), circle.radius * canvas.x_scale, circle.radius * canvas.y_scale, fill))
+
+    for polyline in scene.polylines:
+        points = np.column_stack((canvas.x(polyline.x), canvas.y(polyline.y))).ravel()
+        elements.append('<polyline points="%s" stroke="%s" stroke-width="2"/>' % (
+            ' '.join(['%.2f,%.2f'] * len(polyline.x)) % tuple(points), CURVE_COLOR))
+
+    for width, rows in scene.segment_rows():
+        elements.append('<path d="%s" stroke="black" stroke-width="%g"/>' % (path_data(canvas, rows), width))
+
+    for label in scene.labels:
+        elements.append(svg_text(canvas.x(label.x), canvas.y(label.y), label.text))
+
+    elements.append('</g>')
+    return svg_document(elements, svg_text(WIDTH / 2, MARGIN_TOP / 2, scene.title, size=24, color='black'))
+
+
+def render_placeholders():
+    #same as build_placeholder_figures in figures.py: the top view says so, the side view is empty
+    return dict(
+        top=svg_document([], svg_text(WIDTH - MARGIN_RIGHT, MARGIN_TOP / 2, 'Coming Soon!', size=48, color='red', anchor='end')),
+        side=svg_document([], ''),
+    )
+
+
+def render_views(profile):
+    #SVG text of the top and side views of a profile
+    if not is_drawable(profile):
+        return render_placeholders()
+    return dict(top=render_svg(top_scene(profile)), side=render_svg(side_scene(profile)))
+
+
+
+"""Writing files"""
+
+def safe_name(name):
+    return re.sub(r'[^\w.-]+', '_', str(name)).strip('._') or 'display'
+
+
+def write_views(name, profile, directory, output_format='svg'):
+    paths = []
+    for view, svg in render_views(profile).items():
+        path = os.path.join(directory, '{}_{}.{}'.format(safe_name(name), view, output_format))
+        if output_format == 'png':
+            cairosvg.svg2png(bytestring=svg.encode('utf-8'), write_to=path)
+        else:
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(svg)
+        paths.append(path)
+    return paths
+
+
+def spec_profile(record):
+    #None for rows that cannot be drawn: a missing or non-positive value or a view angle of 180 degrees or more
+    values = dict((name, batch.to_float(record.get(name))) for name in SPEC_COLUMNS)
+    if not batch.valid_values(values):
+        return None
+    return custom_profile(**values)
+
+
+def parse_records(lines, input_format, header):
+    if input_format == 'csv':
+        return [dict(zip(header, row)) for row in csv.reader(lines)]
+    return [json.loads(line) for line in lines]
+
+
+def render_chunk(lines, first_row, input_format, header, directory, output_format):
+    #runs in a worker process: raw input lines in, (rendered, skipped) counts out
+    rendered = skipped = 0
+    for row, record in enumerate(parse_records(lines, input_format, header), first_row):
+        profile = spec_profile(record)
+        if profile is None:
+            skipped += 1
+            continue
+        write_views(record.get('name') or 'row{}'.format(row), profile, directory, output_format)
+        rendered += 1
+    return rendered, skipped
+
+
+def render_presets(directory, output_format='svg'):
+    for key, profile in PROFILES.items():
+        write_views(key, profile, directory, output_format)
+    return len(PROFILES)
+
+
+def run(input_stream, directory, input_format='csv', output_format='svg', chunk_size=DEFAULT_CHUNK_SIZE, workers=None):
+    header = None
+    if input_format == 'csv':
+        header = batch.read_header(input_stream)
+        missing = [name for name in SPEC_COLUMNS if name not in header]
+        if missing:
+            raise ValueError("input is missing the column(s) " + ", ".join(missing))
+
+    workers = workers or os.cpu_count() or 1
+    rendered = skipped = row = 0
+    if workers == 1:
+        for lines in batch.read_chunks(input_stream, chunk_size, input_format):
+            counts = render_chunk(lines, row, input_format, header, directory, output_format)
+            rendered, skipped, row = rendered + counts[0], skipped + counts[1], row + len(lines)
+        return rendered, skipped
+
+    #bounded number of chunks in flight, like batch.run
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        in_flight = []
+        for lines in batch.read_chunks(input_stream, chunk_size, input_format):
+            in_flight.append(executor.submit(render_chunk, lines, row, input_format, header, directory, output_format))
+            row += len(lines)
+            while len(in_flight) >= 2 * workers:
+                counts = in_flight.pop(0).result()
+                rendered, skipped = rendered + counts[0], skipped + counts[1]
+        for future in in_flight:
+            counts = future.result()
+            rendered, skipped = rendered + counts[0], skipped + counts[1]
+    return rendered, skipped
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write the top and side views of light field displays as SVG or PNG files.")
+    parser.add_argument('input', nargs='?', help="CSV or JSON-lines file of display specs, - for stdin")
+    parser.add_argument('--presets', action='store_true', help="render the preset displays from profiles.py")
+    parser.add_argument('-o', '--output-dir', default='.', help="directory to write the files to (default: the current one)")
+    parser.add_argument('--format', choices=['svg', 'png'], default='svg', help="png needs the cairosvg package")
+    parser.add_argument('--input-format', choices=['csv', 'jsonl'], help="default: from the file extension, else csv")
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE, help="rows per worker task")
+    parser.add_argument('--workers', type=int, default=None, help="worker processes (default: one per CPU)")
+    args = parser.parse_args(argv)
+
+    if not args.presets and args.input is None:
+        parser.error("give a spec file or --presets")
+    if args.format == 'png' and cairosvg is None:
+        parser.error("PNG output needs the cairosvg package (pip install cairosvg)")
+    os.makedirs(args.output_dir, exist_ok=True)
+
+    if args.presets:
+        count = render_presets(args.output_dir, args.format)
+        print("{:,} presets rendered".format(count), file=sys.stderr)
+    if args.input is not None:
+        input_format = args.input_format or batch.detect_format(args.input)
+        input_stream = sys.stdin if args.input == '-' else open(args.input, newline='')
+        try:
+            rendered, skipped = run(input_stream, args.output_dir, input_format, args.format, args.chunk_size, args.workers)
+        finally:
+            if input_stream is not sys.stdin:
+                input_stream.close()
+        print("{:,} specs rendered, {:,} skipped".format(rendered, skipped), file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
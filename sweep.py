@@ -0,0 +1,124 @@
+"""Design-space sweep"""
+
+#Evaluates the trade relationships in core.py over many candidate designs at
+#once. Candidates come from a Cartesian grid of parameter values or from uniform
+#random samples inside bounds, and are generated and evaluated chunk by chunk so
+#memory stays bounded by chunk_size however many designs are swept.
+#
+#    axes = dict(pixel_pitch=np.linspace(0.01, 0.06, 100), hogel_diameter=np.linspace(0.05, 1.2, 100),
+#                view_distance=[450, 800, 2743.2], view_angle=np.linspace(20, 150, 100))
+#    results = sweep(axes)                          #all 3 million designs as arrays
+#    summary = summarize(iter_grid(axes))           #stats and a sample, without keeping the rest
+
+import numpy as np
+
+import core
+
+
+PARAMETERS = ('pixel_pitch', 'hogel_diameter', 'view_distance', 'view_angle')
+METRICS = ('views_per_hogel', 'view_angle_per_view', 'angular_resolution', 'lossless_depth', 'view_zone_width', 'hogel_angular_size')
+
+DEFAULT_CHUNK_SIZE = 1 << 20 #designs per chunk, about 80 MB of float64 results
+
+
+def evaluate(pixel_pitch, hogel_diameter, view_distance, view_angle, dtype=np.float64):
+    #inputs and all metrics for the given designs as a dict of equally long arrays
+    inputs = np.broadcast_arrays(*[np.asarray(value, dtype=dtype) for value in (pixel_pitch, hogel_diameter, view_distance, view_angle)])
+    pixel_pitch, hogel_diameter, view_distance, view_angle = [np.ravel(value) for value in inputs]
+
+    return dict(
+        pixel_pitch=pixel_pitch,
+        hogel_diameter=hogel_diameter,
+        view_distance=view_distance,
+        view_angle=view_angle,
+        views_per_hogel=core.views_per_hogel(pixel_pitch, hogel_diameter),
+        view_angle_per_view=core.view_angle_per_view(pixel_pitch, hogel_diameter, view_angle),
+        angular_resolution=core.angular_resolution(pixel_pitch, hogel_diameter, view_angle),
+        lossless_depth=core.lossless_depth(pixel_pitch, hogel_diameter, view_angle),
+        view_zone_width=core.view_zone_width(view_distance, view_angle),
+        hogel_angular_size=core.hogel_angular_size(hogel_diameter, view_distance),
+    )
+
+
+def grid_shape(axes):
+    return tuple(len(np.atleast_1d(axes[name])) for name in PARAMETERS)
+
+
+def grid_size(axes):
+    return int(np.prod(grid_shape(axes), dtype=np.int64))
+
+
+def iter_grid(axes, chunk_size=DEFAULT_CHUNK_SIZE, dtype=np.float64):
+    #axes maps every name in PARAMETERS to its values (a single value is fine)
+    values = [np.atleast_1d(np.asarray(axes[name], dtype=dtype)) for name in PARAMETERS]
+    shape = grid_shape(axes)
+    total = grid_size(axes)
+
+    for start in range(0, total, chunk_size):
+        index = np.unravel_index(np.arange(start, min(start + chunk_size, total)), shape)
+        yield evaluate(*[axis[i] for axis, i in zip(values, index)], dtype=dtype)
+
+
+def iter_random(bounds, n, chunk_size=DEFAULT_CHUNK_SIZE, dtype=np.float64, seed=None):
+    #bounds maps every name in PARAMETERS to a (low, high) pair
+    rng = np.random.default_rng(seed)
+
+    for start in range(0, n, chunk_size):
+        size = min(chunk_size, n - start)
+        samples = [rng.uniform(bounds[name][0], bounds[name][1], size).astype(dtype, copy=False) for name in PARAMETERS]
+        yield evaluate(*samples, dtype=dtype)
+
+
+def concatenate(chunks):
+    chunks = list(chunks)
+    if not chunks:
+        return dict((name, np.empty(0)) for name in PARAMETERS + METRICS)
+    return dict((name, np.concatenate([chunk[name] for chunk in chunks])) for name in chunks[0])
+
+
+def sweep(axes=None, bounds=None, n=None, chunk_size=DEFAULT_CHUNK_SIZE, dtype=np.float64, seed=None):
+    #a grid sweep when axes are given, otherwise n random samples inside bounds
+    if axes is not None:
+        chunks = iter_grid(axes, chunk_size, dtype)
+    elif bounds is not None and n is not None:
+        chunks = iter_random(bounds, n, chunk_size, dtype, seed)
+    else:
+        raise ValueError("sweep needs either axes or bounds and n")
+    return concatenate(chunks)
+
+
+def summarize(chunks, sample_size=5000, seed=0):
+    #count, min/mean/max of every column and a uniform sample of sample_size designs,
+    #kept by giving every design a random key and holding on to the smallest keys
+    rng = np.random.default_rng(seed)
+    count = 0
+    stats = {}
+    sample = None
+    sample_keys = np.empty(0)
+
+    for chunk in chunks:
+        size = len(next(iter(chunk.values())))
+        if size == 0:
+            continue
+        count += size
+
+        for name, values in chunk.items():
+            low, high, total, finite_count = stats.get(name, (np.inf, -np.inf, 0.0, 0))
+            finite = values[np.isfinite(values)]
+            if len(finite):
+                low, high = min(low, float(finite.min())), max(high, float(finite.max()))
+                total, finite_count = total + float(finite.sum(dtype=np.float64)), finite_count + len(finite)
+            stats[name] = (low, high, total, finite_count)
+
+        keys = np.concatenate([sample_keys, rng.random(size)])
+        merged = chunk if sample is None else dict((name, np.concatenate([sample[name], chunk[name]])) for name in chunk)
+        keep = np.argpartition(keys, sample_size)[:sample_size] if len(keys) > sample_size else np.arange(len(keys))
+        sample_keys = keys[keep]
+        sample = dict((name, values[keep]) for name, values in merged.items())
+
+    return dict(
+        count=count,
+        stats=dict((name, dict(min=low, max=high, mean=total / finite_count if finite_count else np.nan))
+                   for name, (low, high, total, finite_count) in stats.items()),
+        sample=sample if sample is not None else concatenate([]),
+    )
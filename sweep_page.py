@@ -0,0 +1,240 @@
+"""Sweep page"""
+
+#Tab of the app that runs sweep.py over a grid or random samples of designs and
+#plots a sample of the results. Only summary statistics and a fixed size sample
+#ever leave the server, however many designs are swept. The Pareto frontier
+#(pareto.py) is kept as the chunks go by and drawn over the sample together with
+#the presets, and a table says which presets the frontier beats. A sweep run
+#before is read from the disk cache when one is configured (disk_cache.py).
+
+import time
+
+import numpy as np
+import dash_core_components as dcc
+import dash_html_components as html
+import plotly.graph_objects as go
+from dash.dependencies import Input, Output, State
+
+import disk_cache
+import pareto
+import sweep
+from profiles import PROFILES
+
+
+MAX_DESIGNS = 50 * 10**6 #keeps one click from tying up a worker for minutes
+PLOT_SAMPLE_SIZE = 5000
+PLOT_FRONT_SIZE = 5000
+
+#(parameter, label, default min, default max, default steps)
+SWEEP_INPUTS = [
+    ('pixel_pitch', "Pixel Pitch (mm)", 0.01, 0.06, 50),
+    ('hogel_diameter', "Diameter of Hogel (mm)", 0.05, 1.2, 50),
+    ('view_distance', "View Distance (mm)", 300, 4000, 20),
+    ('view_angle', "\u03B8 (degrees)", 20, 150, 50),
+]
+
+LABELS = dict(
+    pixel_pitch="Pixel Pitch (mm)",
+    hogel_diameter="Diameter of Hogel (mm)",
+    view_distance="View Distance (mm)",
+    view_angle="\u03B8 (degrees)",
+    views_per_hogel="Views per Hogel",
+    view_angle_per_view="Angle per View (degrees)",
+    angular_resolution="Angular Resolution (views/degree)",
+    lossless_depth="Lossless Projection Depth (mm)",
+    view_zone_width="View Zone Width (mm)",
+    hogel_angular_size="Hogel Angular Size (arcmin)",
+)
+
+
+def range_input(name, field, value):
+    return dcc.Input(id='sweep-{}-{}'.format(name, field), type='number', value=value, style={'width': '90px'})
+
+
+def make_sweep_layout():
+    columns = list(sweep.PARAMETERS + sweep.METRICS)
+
+    return html.Div(children=[
+        html.Table(children=[
+            html.Thead(children=[
+                html.Tr(children=[
+                    html.Th(scope="col", children=["Parameter"]),
+                    html.Th(scope="col", children=["Min"]),
+                    html.Th(scope="col", children=["Max"]),
+                    html.Th(scope="col", children=["Steps"]),
+                    ])
+                ]),
+            html.Tbody(children=[
+                html.Tr(children=[
+                    html.Th(scope="row", children=[label]),
+                    html.Td(range_input(name, 'min', low)),
+                    html.Td(range_input(name, 'max', high)),
+                    html.Td(range_input(name, 'steps', steps)),
+                    ])
+                for name, label, low, high, steps in SWEEP_INPUTS
+                ]),
+            ]),
+
+        html.Div(children=[
+            dcc.RadioItems(
+                id='sweep-mode',
+                options=[
+                    {'label': 'Grid', 'value': 'grid'},
+                    {'label': 'Random samples', 'value': 'random'},
+                ],
+                value='grid',
+                labelStyle={'display': 'inline-block'},
+            ),
+            html.Label(children=["Samples ", dcc.Input(id='sweep-samples', type='number', value=10**6, min=1)]),
+            dcc.Checklist(
+                id='sweep-options',
+                options=[{'label': 'float32', 'value': 'float32'}],
+                value=[],
+                labelStyle={'display': 'inline-block'},
+            ),
+            html.Label(children=["x ", dcc.Dropdown(id='sweep-x', options=[{'label': LABELS[name], 'value': name} for name in columns], value='angular_resolution', clearable=False)],
+                       style={'display': 'inline-block', 'width': '280px'}),
+            html.Label(children=["y ", dcc.Dropdown(id='sweep-y', options=[{'label': LABELS[name], 'value': name} for name in columns], value='lossless_depth', clearable=False)],
+                       style={'display': 'inline-block', 'width': '280px'}),
+            html.Button('Run sweep', id='sweep-run', n_clicks=0),
+            html.Div(id='sweep-status'),
+        ]),
+
+        html.Div(children=[dcc.Graph(id='sweep-figure')], style={'display': 'inline-block'}),
+        html.Div(children=[
+            html.Table(id='sweep-summary'),
+            html.Table(id='sweep-presets'),
+        ], style={'display': 'inline-block', 'vertical-align': 'top'}),
+    ])
+
+
+def sweep_chunks(mode, ranges, samples, dtype):
+    if mode == 'random':
+        bounds = dict((name, (low, high)) for name, (low, high, steps) in ranges.items())
+        return int(samples), sweep.iter_random(bounds, int(samples), dtype=dtype, seed=0)
+
+    axes = dict((name, np.linspace(low, high, max(int(steps), 1))) for name, (low, high, steps) in ranges.items())
+    return sweep.grid_size(axes), sweep.iter_grid(axes, dtype=dtype)
+
+
+def preset_designs():
+    #the presets as sweep results, a preset without a view distance has NaN for what depends on it
+    presets = list(PROFILES.values())
+    designs = sweep.evaluate(*[[np.nan if getattr(profile, name) is None else getattr(profile, name) for profile in presets] for name in sweep.PARAMETERS])
+    return [profile.label for profile in presets], designs
+
+
+def plot_sample(designs, size):
+    #at most size of the designs, evenly spread over them
+    count = len(designs['pixel_pitch'])
+    if count <= size:
+        return designs
+    index = np.linspace(0, count - 1, size).astype(np.int64)
+    return dict((name, values[index]) for name, values in designs.items())
+
+
+def sweep_figure(sample, x, y, front=None):
+    figure = go.Figure(go.Scattergl(
+        x=sample[x], y=sample[y], mode='markers', name='Sample',
+        marker=dict(size=4, color=sample['pixel_pitch'], colorscale='Viridis', showscale=True, colorbar=dict(title="Pixel Pitch (mm)")),
+        hoverinfo='x+y',
+    ))
+    if front is not None and len(front):
+        designs = plot_sample(front.designs, PLOT_FRONT_SIZE)
+        figure.add_trace(go.Scattergl(
+            x=designs[x], y=designs[y], mode='markers', name='Pareto frontier',
+            marker=dict(size=6, color='rgba(0,0,0,0)', line=dict(color='crimson', width=1.5)),
+            hoverinfo='x+y',
+        ))
+        labels, presets = preset_designs()
+        figure.add_trace(go.Scatter(
+            x=presets[x], y=presets[y], mode='markers+text', name='Presets', text=labels, textposition='top center',
+            marker=dict(size=10, symbol='diamond', color='black'),
+            hoverinfo='text+x+y',
+        ))
+    figure.update_layout(title=dict(text='Sweep', x=0.5, font=dict(color="Black", size=24)), plot_bgcolor='white', width=600, height=600,
+                         xaxis=dict(title=LABELS[x]), yaxis=dict(title=LABELS[y]), legend=dict(x=0, y=-0.15, orientation='h'))
+    return figure
+
+
+def summary_table(summary):
+    return [
+        html.Thead(children=[html.Tr(children=[html.Th(scope="col", children=[name]) for name in ("Symbol", "Min", "Mean", "Max")])]),
+        html.Tbody(children=[
+            html.Tr(children=[
+                html.Th(scope="row", children=[LABELS[name]]),
+                html.Td("{:.4g}".format(stats['min'])),
+                html.Td("{:.4g}".format(stats['mean'])),
+                html.Td("{:.4g}".format(stats['max'])),
+                ])
+            for name, stats in summary['stats'].items()
+            ]),
+    ]
+
+
+def presets_table(front):
+    #where every preset sits relative to the frontier of the sweep
+    labels, presets = preset_designs()
+    dominated_by = front.dominated_by(presets)
+    objectives = ", ".join("{} {}".format(sense, LABELS[name]) for name, sense in front.objectives)
+    return [
+        html.Caption(children=["Presets against the frontier ({})".format(objectives)]),
+        html.Thead(children=[html.Tr(children=[html.Th(scope="col", children=[name]) for name in ("Preset", "Frontier designs that beat it")])]),
+        html.Tbody(children=[
+            html.Tr(children=[
+                html.Th(scope="row", children=[label]),
+                html.Td("{:,}".format(count) if count else "none, it is on or beyond the frontier"),
+                ])
+            for label, count in zip(labels, dominated_by)
+            ]),
+    ]
+
+
+def tracked(chunks, front):
+    #passes the chunks on after adding each to front
+    for chunk in chunks:
+        front.update(chunk)
+        yield chunk
+
+
+@disk_cache.memoize('sweep', 'arrays')
+def sweep_results(mode, ranges, samples, dtype):
+    #sweep.summarize of the sweep with the frontier of all its designs under 'front'
+    count, chunks = sweep_chunks(mode, ranges, samples, dtype)
+    front = pareto.ParetoFront()
+    summary = sweep.summarize(tracked(chunks, front), sample_size=PLOT_SAMPLE_SIZE)
+    summary['front'] = front.designs if front.designs is not None else sweep.concatenate([])
+    return summary
+
+
+def register_sweep_callbacks(app):
+    range_states = [State('sweep-{}-{}'.format(name, field), 'value') for name, label, low, high, steps in SWEEP_INPUTS for field in ('min', 'max', 'steps')]
+
+    @app.callback(
+        [Output('sweep-figure', 'figure'), Output('sweep-summary', 'children'), Output('sweep-presets', 'children'), Output('sweep-status', 'children')],
+        [Input('sweep-run', 'n_clicks')],
+        [State('sweep-mode', 'value'), State('sweep-samples', 'value'), State('sweep-options', 'value'),
+         State('sweep-x', 'value'), State('sweep-y', 'value')] + range_states
+    )
+    def run_sweep(n_clicks, mode, samples, options, x, y, *range_values):
+        #Dash calls this on page load too, when nothing has been asked for yet
+        if not n_clicks:
+            return go.Figure(), [], [], "Set the ranges and press Run sweep."
+
+        values = list(range_values)
+        if any(value is None for value in values) or (mode == 'random' and not samples):
+            return go.Figure(), [], [], "Fill in every min, max and step count."
+
+        ranges = dict((name, tuple(values[3*i:3*i + 3])) for i, (name, label, low, high, steps) in enumerate(SWEEP_INPUTS))
+        dtype = np.float32 if 'float32' in (options or []) else np.float64
+
+        count, chunks = sweep_chunks(mode, ranges, samples, dtype)
+        if count > MAX_DESIGNS:
+            return go.Figure(), [], [], "{:,} designs is more than the {:,} the page allows, use sweep.py directly.".format(count, MAX_DESIGNS)
+
+        start = time.time()
+        summary = sweep_results(mode, ranges, samples if mode == 'random' else None, dtype)
+        front = pareto.ParetoFront().update(summary['front'])
+        status = "{:,} designs in {:.2f} s, plotting {:,} of them; {:,} on the Pareto frontier.".format(
+            summary['count'], time.time() - start, len(summary['sample']['pixel_pitch']), len(front))
+        return sweep_figure(summary['sample'], x, y, front), summary_table(summary), presets_table(front), status
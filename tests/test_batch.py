@@ -0,0 +1,50 @@
+import csv
+import io
+
+import batch
+
+
+SPECS = (
+    'name,pixel_pitch,hogel_diameter,view_distance,view_angle\n'
+    '"desk\ntop",0.019,0.23,800,57.2\n'
+    '\n'
+    'plain,0.047,0.8,2743.2,61.9\n'
+    '"say ""hi""\n\nthere",0.05,1.06,3658,60\n'
+)
+
+
+def run_csv(text, chunk_size, workers=1):
+    output = io.StringIO()
+    count = batch.run(io.StringIO(text), output, chunk_size=chunk_size, workers=workers)
+    return count, list(csv.reader(io.StringIO(output.getvalue())))
+
+
+def test_quoted_line_breaks_stay_in_one_record():
+    for chunk_size in (1, 2, 50):
+        count, rows = run_csv(SPECS, chunk_size)
+        assert count == 3
+        assert [row[0] for row in rows[1:]] == ['desk\ntop', 'plain', 'say "hi"\n\nthere']
+        assert all(len(row) == len(rows[0]) for row in rows)
+
+
+def test_worker_processes_see_whole_records():
+    assert run_csv(SPECS, 1, workers=2) == run_csv(SPECS, 1)
+
+
+def test_read_records_jsonl_is_line_based():
+    assert list(batch.read_records(io.StringIO('{"a": "\\""}\n\n{"b": 1}\n'), 'jsonl')) == ['{"a": "\\""}\n', '{"b": 1}\n']
+
+
+def test_multiline_header():
+    stream = io.StringIO('"pixel\npitch",b\n1,2\n')
+    assert batch.read_header(stream) == ['pixel\npitch', 'b']
+    assert stream.read() == '1,2\n'
+
+
+def test_view_angles_from_180_degrees_get_empty_results():
+    text = 'name,pixel_pitch,hogel_diameter,view_distance,view_angle\nok,0.019,0.23,800,57.2\nflat,0.019,0.23,800,180\nwide,0.019,0.23,800,185\n'
+    count, rows = run_csv(text, 50)
+    assert count == 3
+    results = [row[len(rows[0]) - len(batch.RESULT_COLUMNS):] for row in rows[1:]]
+    assert all(value != '' for value in results[0])
+    assert results[1] == results[2] == [''] * len(batch.RESULT_COLUMNS)
@@ -0,0 +1,57 @@
+import threading
+
+import configurator
+
+
+def test_coalescer_forgets_finished_sessions():
+    coalescer = configurator.Coalescer()
+    for session in range(100):
+        ticket, lock = coalescer.submit(session, {'top'})
+        with lock:
+            assert coalescer.take(session, ticket) == {'top'}
+        coalescer.done(session)
+    assert len(coalescer) == 0
+    assert not (coalescer.latest or coalescer.pending or coalescer.session_locks)
+
+
+def test_coalescer_keeps_waiting_updates():
+    coalescer = configurator.Coalescer()
+    first, lock = coalescer.submit('a', {'top'})
+    second, same_lock = coalescer.submit('a', {'side'})
+    assert lock is same_lock
+    with lock:
+        assert coalescer.take('a', first) is None
+    coalescer.done('a')
+    assert len(coalescer) == 1
+    with lock:
+        assert coalescer.take('a', second) == {'top', 'side'}
+    coalescer.done('a')
+    assert len(coalescer) == 0
+
+
+def test_coalescer_from_threads():
+    coalescer = configurator.Coalescer()
+
+    def update(session):
+        for _ in range(200):
+            ticket, lock = coalescer.submit(session, {'top'})
+            try:
+                with lock:
+                    coalescer.take(session, ticket)
+            finally:
+                coalescer.done(session)
+
+    threads = [threading.Thread(target=update, args=(index % 3,)) for index in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(coalescer) == 0
+
+
+def test_input_error():
+    values = dict(display_width=586.7, display_height=330, view_distance=800, pixel_pitch=0.019, hogel_diameter=0.23, view_angle=57.2)
+    assert configurator.input_error(values) is None
+    assert configurator.input_error(dict(values, pixel_pitch=0)) == "Every value has to be a positive number."
+    assert configurator.input_error(dict(values, view_angle=None)) == "Every value has to be a positive number."
+    assert configurator.input_error(dict(values, view_angle=180)) == "The view angle must be below 180 degrees."
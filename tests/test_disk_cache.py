@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+
+import disk_cache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    yield disk_cache.configure(str(tmp_path))
+    disk_cache.configure(None)
+
+
+def test_miss_and_hit_return_the_same_types(cache):
+    calls = []
+
+    @disk_cache.memoize('test.json', 'json')
+    def figure(size):
+        calls.append(size)
+        return dict(data=[dict(x=np.arange(size), y=(1, 2))], layout=dict(title='t'))
+
+    @disk_cache.memoize('test.arrays', 'arrays')
+    def results(size):
+        calls.append(size)
+        return dict(count=size, stats=dict(mean=np.float32(0.5)), sample=dict(x=np.arange(size, dtype=np.float32)))
+
+    for function in (figure, results):
+        miss, hit = function(3), function(3)
+        assert len(calls) == 1
+        assert repr(miss) == repr(hit)
+        calls.clear()
+    assert hit['sample']['x'].dtype == np.float32
+
+
+def test_unreadable_files_are_misses(cache):
+    key = disk_cache.cache_key('test', 1)
+    cache.put(key, 'arrays', dict(x=np.zeros(3)))
+    with open(cache.path(key, 'arrays'), 'wb') as f:
+        f.write(b'not a zip file')
+    assert cache.get(key, 'arrays') is disk_cache.MISSING
+
+
+def test_eviction_keeps_the_cache_in_budget(tmp_path, monkeypatch):
+    cache = disk_cache.DiskCache(str(tmp_path), max_bytes=100000)
+    scans = []
+    entries = cache.entries
+    monkeypatch.setattr(cache, 'entries', lambda: scans.append(1) or entries())
+
+    for index in range(200):
+        cache.put('{:064x}'.format(index), 'json', list(range(300)))
+    monkeypatch.setattr(cache, 'entries', entries)
+    assert cache.size() <= 100000
+    assert cache.get('{:064x}'.format(199), 'json') == list(range(300)) #the newest stays
+    assert len(scans) < 30 #not a scan per write
+
+
+def test_keys():
+    assert disk_cache.cache_key('x', 1, 2.0) == disk_cache.cache_key('x', 1, 2.0)
+    assert disk_cache.cache_key('x', 1) != disk_cache.cache_key('x', 1.0)
+    assert disk_cache.cache_key('x', np.arange(3)) != disk_cache.cache_key('x', np.arange(3.0))
+    assert disk_cache.cache_key('x', window=None) != disk_cache.cache_key('y', window=None)
+
+
+def test_zoomed_top_views_stay_out_of_the_cache(cache):
+    import figures
+    from profiles import PROFILES
+
+    profile = PROFILES['HC']
+    figures.top_figure_json(profile)
+    for window in ((-1, 1, -1, 1), (-0.5, 0.5, -0.5, 0.5)):
+        assert figures.top_figure_json(profile, window)['data']
+    assert len(cache.entries()) == 1
@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+import hogels
+import rays
+from profiles import PROFILES
+
+
+#columns x rows of whole hogels, width / diameter and height / diameter rounded down
+@pytest.mark.parametrize('key, columns, rows', [
+    ('T', 1524, 857),
+    ('D', 2550, 1434),
+    ('HC', 1800, 1012),
+    ('C', 4859, 11501),
+])
+def test_preset_grid_sizes(key, columns, rows):
+    profile = PROFILES[key]
+    grid = hogels.hogel_grid(profile.display_width, profile.display_height, profile.hogel_diameter)
+    assert (grid.columns, grid.rows) == (columns, rows)
+
+
+def test_whole_count_exact_multiples():
+    assert hogels.whole_count(1440, 0.8) == 1800
+    assert hogels.whole_count(0.3, 0.1) == 3
+    assert hogels.whole_count(0.29, 0.1) == 2
+
+
+def test_trace_covers_every_home_cinema_column():
+    profile = PROFILES['HC']
+    grid = hogels.hogel_grid(profile.display_width, profile.display_height, profile.hogel_diameter)
+    result = rays.trace(grid, profile.pixel_pitch, profile.view_angle, profile.hor_view_angle, [[0, 0, profile.view_distance]])
+    assert result['horizontal_view'].shape[-1] == 1800
+
+
+def test_write_npy_stores_the_fan(tmp_path):
+    profile = PROFILES['T']
+    grid = hogels.HogelGrid(4, 3, profile.hogel_diameter)
+    fan = hogels.view_directions(profile.pixel_pitch, profile.hogel_diameter, profile.view_angle)
+    summary = hogels.write_npy(str(tmp_path), grid, profile.view_angle, (0, 0, profile.view_distance), fan=fan)
+    assert (np.load(str(tmp_path / 'fan.npy')) == fan).all()
+    assert (summary['fan'] == fan).all()
+    assert len(fan) == hogels.whole_count(profile.hogel_diameter, profile.pixel_pitch)
+    step = profile.view_angle * profile.pixel_pitch / profile.hogel_diameter
+    assert np.allclose(np.diff(fan), step) and np.isclose(fan[0], step / 2 - profile.view_angle / 2)
@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+import pareto
+import sweep
+
+
+def brute_force_mask(points):
+    #every pair compared, rows with NaN are neither on the frontier nor dominate anything
+    finite = np.isfinite(points).all(axis=1)
+    others = points[finite]
+    dominated = ((others[None] >= points[:, None]).all(axis=2) & (others[None] > points[:, None]).any(axis=2)).any(axis=1)
+    return finite & ~dominated
+
+
+@pytest.mark.parametrize('objectives', [1, 2, 3, 4, 5])
+def test_pareto_mask_matches_brute_force(objectives):
+    rng = np.random.default_rng(objectives)
+    for trial in range(5):
+        #few distinct values, so ties and identical rows are common
+        points = rng.integers(0, 6, (800, objectives)).astype(float)
+        if trial % 2:
+            points[rng.integers(0, len(points), 10), 0] = np.nan
+        assert (pareto.pareto_mask(points) == brute_force_mask(points)).all()
+    points = rng.random((1500, objectives))
+    assert (pareto.pareto_mask(points) == brute_force_mask(points)).all()
+
+
+def test_blocks_smaller_than_the_input(monkeypatch):
+    monkeypatch.setattr(pareto, 'BLOCK_SIZE', 64)
+    points = np.random.default_rng(7).random((2000, 3))
+    assert (pareto.pareto_mask(points) == brute_force_mask(points)).all()
+
+
+def test_dominates():
+    rng = np.random.default_rng(3)
+    points, others = rng.integers(0, 4, (50, 3)).astype(float), rng.integers(0, 4, (40, 3)).astype(float)
+    expected = np.array([[(point >= other).all() and (point > other).any() for point in points] for other in others])
+    assert (pareto.dominates(points, others) == expected).all()
+
+
+def test_streamed_frontier_equals_the_whole_one():
+    bounds = dict(pixel_pitch=(0.01, 0.06), hogel_diameter=(0.05, 1.2), view_distance=(300, 4000), view_angle=(20, 150))
+    chunks = list(sweep.iter_random(bounds, 20000, chunk_size=1500, seed=1))
+    whole = sweep.concatenate(chunks)
+    streamed = pareto.frontier(chunks)
+    expected = pareto.pareto_mask(pareto.scores(whole))
+    assert streamed.count == 20000
+    assert sorted(streamed.designs['pixel_pitch']) == sorted(whole['pixel_pitch'][expected])
+    assert (streamed.dominated_by(streamed.designs) == 0).all()
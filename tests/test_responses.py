@@ -0,0 +1,56 @@
+import flask
+
+from responses import ResponseCache
+
+
+def make_cache(**kwargs):
+    return ResponseCache(flask.Flask(__name__), ['/x'], **kwargs)
+
+
+def test_byte_budget_evicts_least_recently_used():
+    cache = make_cache(max_bytes=10000, precompress=False)
+    for index in range(10):
+        cache.put('POST', '/x', b'a' * 3000, data=str(index).encode())
+    assert cache.size <= 10000
+    assert len(cache.entries) == 3
+    assert cache.lookup(cache.request_key('POST', '/x', b'9')) is not None
+    assert cache.lookup(cache.request_key('POST', '/x', b'0')) is None
+
+
+def test_size_counts_compressed_copies_and_replacements():
+    cache = make_cache()
+    body = b'{"a": 1}' * 1000
+    entry = cache.put('GET', '/x', body)
+    assert cache.size == entry.size > len(body)
+    cache.put('GET', '/x', body)
+    assert cache.size == entry.size and len(cache.entries) == 1
+
+
+def test_oversized_bodies_are_not_kept():
+    cache = make_cache(max_bytes=100, precompress=False)
+    cache.put('GET', '/x', b'a' * 1000)
+    assert cache.size == 0 and not cache.entries
+
+
+def test_profile_header_survives_the_cache(tmp_path):
+    import dash
+    from dash import dcc, html
+    from dash.dependencies import Input, Output
+
+    from profiling import register_profiling
+
+    app = dash.Dash(__name__)
+    app.layout = html.Div([dcc.Input(id='in', value='a'), html.Div(id='out')])
+    app.callback(Output('out', 'children'), [Input('in', 'value')])(lambda value: value * 2)
+    path = app.config.routes_pathname_prefix + '_dash-update-component'
+    ResponseCache(app.server, [path])
+    register_profiling(app, 'all', directory=str(tmp_path), interval=0.001)
+
+    body = dict(output='out.children', outputs=dict(id='out', property='children'),
+                inputs=[dict(id='in', property='value', value='a')], changedPropIds=['in.value'])
+    client = app.server.test_client()
+    response = client.post(path, json=body)
+    assert response.status_code == 200 and response.headers['X-Response-Cache'] == 'miss'
+    assert (tmp_path / response.headers['X-Profile-File']).exists()
+    response = client.post(path, json=body)
+    assert response.headers['X-Response-Cache'] == 'hit' and 'X-Profile-File' not in response.headers
@@ -0,0 +1,16 @@
+import numpy as np
+
+import core
+import seating
+from profiles import PROFILES
+
+
+def test_views_per_degree_is_angular_resolution_times_coverage():
+    profile = PROFILES['HC']
+    seats = dict(x=np.array([0.0, 2500.0, 0.0]), y=np.zeros(3), z=np.array([profile.view_distance, profile.view_distance, -100.0]))
+    results = seating.simulate(profile, seats, workers=1)
+    resolution = core.angular_resolution(profile.pixel_pitch, profile.hogel_diameter, profile.view_angle)
+    assert np.allclose(results['views_per_degree'], resolution * results['coverage'])
+    assert np.isclose(results['views_per_degree'][0], resolution)
+    assert results['views_per_degree'][1] < resolution
+    assert results['views_per_degree'][2] == 0
@@ -0,0 +1,32 @@
+import numpy as np
+
+import core
+import sensitivity
+
+
+def random_designs(n=20000, seed=0):
+    rng = np.random.default_rng(seed)
+    return (rng.uniform(0.01, 0.06, n), rng.uniform(0.05, 1.2, n), rng.uniform(300, 4000, n), rng.uniform(20, 150, n))
+
+
+def test_jacobian_matches_central_differences():
+    designs = random_designs()
+    analytic = sensitivity.jacobian(*designs)
+    numeric = sensitivity.numeric_jacobian(*designs)
+    error = np.abs(analytic - numeric) / np.maximum(np.abs(analytic), 1e-3)
+    assert error.max() < 1e-6
+
+
+def test_elasticities_of_power_laws():
+    #angular resolution is D / (p * theta), view zone width is proportional to L
+    elasticities = sensitivity.elasticities(*random_designs(100))
+    assert np.allclose(elasticities[:, 0], [-1, 1, 0])
+    assert np.allclose(elasticities[:, 2], [0, 0, 1])
+
+
+def test_swings_are_metric_changes():
+    pixel_pitch, hogel_diameter, view_distance, view_angle = 0.019, 0.23, 800, 57.2
+    swings = sensitivity.swings(pixel_pitch, hogel_diameter, view_distance, view_angle, step=0.1)[0]
+    depth = core.lossless_depth(pixel_pitch, hogel_diameter, view_angle)
+    assert np.isclose(swings[1, 1, 1], 100 * (core.lossless_depth(pixel_pitch, 1.1 * hogel_diameter, view_angle) / depth - 1))
+    assert np.allclose(swings[2, 2], [-10, 10])
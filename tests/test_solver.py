@@ -0,0 +1,52 @@
+import numpy as np
+
+import core
+import solver
+import solver_page
+from profiles import PROFILES
+
+
+def test_solutions_reproduce_their_targets():
+    rng = np.random.default_rng(0)
+    pixel_pitch, hogel_diameter = rng.uniform(0.01, 0.06, 1000), rng.uniform(0.5, 1.2, 1000)
+    view_distance, view_angle = rng.uniform(300, 4000, 1000), rng.uniform(20, 150, 1000)
+    depth = core.lossless_depth(pixel_pitch, hogel_diameter, view_angle)
+    resolution = core.angular_resolution(pixel_pitch, hogel_diameter, view_angle)
+
+    solution = solver.solve(depth, resolution, view_distance, view_angle)
+    assert solution['feasible'].all()
+    assert np.allclose(solution['pixel_pitch'], pixel_pitch)
+    assert np.allclose(solution['hogel_diameter'], hogel_diameter)
+    assert np.allclose(core.lossless_depth(solution['pixel_pitch'], solution['hogel_diameter'], view_angle), depth)
+    assert np.allclose(core.angular_resolution(solution['pixel_pitch'], solution['hogel_diameter'], view_angle), resolution)
+
+
+def test_presets_round_trip():
+    for profile in PROFILES.values():
+        if profile.view_distance is None:
+            continue
+        depth = core.lossless_depth(profile.pixel_pitch, profile.hogel_diameter, profile.view_angle)
+        resolution = core.angular_resolution(profile.pixel_pitch, profile.hogel_diameter, profile.view_angle)
+        solution = solver.solve(depth, resolution, profile.view_distance, profile.view_angle)
+        assert np.isclose(solution['pixel_pitch'][0], profile.pixel_pitch)
+        assert np.isclose(solution['hogel_diameter'][0], profile.hogel_diameter)
+
+
+def test_infeasible_reasons():
+    solution = solver.solve([25, -1, 25, 25], [0.27, 0.27, 0.27, 0.001], 2743.2, [61.9, 61.9, 190, 61.9])
+    assert list(solution['reason']) == ['', solver.INVALID_TARGET, solver.TOO_WIDE, solver.TOO_FEW_VIEWS]
+    assert list(solution['feasible']) == [True, False, False, False]
+
+
+def test_infeasible_table_shows_no_numbers():
+    import dash
+    app = dash.Dash(__name__)
+    app.layout = solver_page.make_solver_layout()
+    solver_page.register_solver_callbacks(app)
+    update = next(entry['callback'] for output, entry in app.callback_map.items() if 'solver-table' in output).__wrapped__
+
+    table, status = update(25, 0.27, 2743.2, 190, None)
+    assert status.startswith("Infeasible")
+    assert all(row.children[1].children == "–" for row in table[0].children)
+    table, status = update(25, 0.27, 2743.2, 61.9, None)
+    assert status == "Feasible." and all(row.children[1].children != "–" for row in table[0].children)
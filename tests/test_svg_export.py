@@ -0,0 +1,14 @@
+import io
+import os
+
+import svg_export
+
+
+def test_view_angles_from_180_degrees_are_skipped(tmp_path):
+    specs = ('name,display_width,display_height,pixel_pitch,hogel_diameter,view_distance,view_angle\n'
+             'ok,1440,810,0.019,0.23,800,60\n'
+             'flat,1440,810,0.019,0.23,800,180\n'
+             'wide,1440,810,0.019,0.23,800,185\n'
+             'missing,1440,810,0.019,0.23,800,\n')
+    assert svg_export.run(io.StringIO(specs), str(tmp_path), workers=1) == (1, 3)
+    assert sorted(os.listdir(str(tmp_path))) == ['ok_side.svg', 'ok_top.svg']
@@ -0,0 +1,17 @@
+"""WSGI entry point"""
+
+#For production servers instead of app.run_server:
+#
+#    gunicorn -c gunicorn.conf.py wsgi:server
+#
+#Importing this module builds every preset figure, serializes the page layout
+#and the callback dependencies and compresses them (create_app(preload=True)).
+#With preload_app in gunicorn.conf.py that happens once in the master process,
+#and the forked workers share the result copy-on-write instead of each building
+#their own copy on their first request.
+
+from app import create_app
+
+
+app = create_app(preload=True)
+server = app.server